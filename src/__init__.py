@@ -5,7 +5,7 @@ Author: Iliya Vereshchagin
 Copyright (c) 2023 aBLT.ai. All rights reserved.
 
 Created: 03.11.2023
-Last Modified: 20.11.2023
+Last Modified: 17.10.2026
 
 Description:
 This file describes entry point for aBLT chat API.
@@ -13,5 +13,26 @@ This file describes entry point for aBLT chat API.
 
 from .ablt_python_api.ablt_api_async import ABLTApi as ABLTApi_async
 from .ablt_python_api.ablt_api_sync import ABLTApi
-from .ablt_python_api.utils.exceptions import DoneException
+from .ablt_python_api.job_queue import ChatJobQueue
+from .ablt_python_api.transport import (
+    AsyncTransport,
+    SyncTransport,
+    close_async_transport,
+    close_async_transports,
+    close_sync_transport,
+    close_sync_transports,
+    get_async_transport,
+    get_sync_transport,
+)
+from .ablt_python_api.utils.batch import BatchResult, ChatResult
+from .ablt_python_api.utils.circuit_breaker import CircuitBreaker
+from .ablt_python_api.utils.concurrency import AdaptiveConcurrencyLimiter
+from .ablt_python_api.utils.exceptions import ChatTimeoutError, CircuitOpenError, DoneException
+from .ablt_python_api.utils.rate_limiter import RateLimiter
+from .ablt_python_api.utils.response_cache import ResponseCache, SQLiteResponseCache
+from .ablt_python_api.utils.retry import RetryPolicy
+from .ablt_python_api.utils.scheduler import PriorityClass, RequestScheduler
+from .ablt_python_api.utils.statistics_cache import StatisticsCache
+from .ablt_python_api.utils.statistics_frame import StatisticsFrame
+from .ablt_python_api.utils.timeouts import ChatTimeout
 from .ablt_python_api.schemas import *
@@ -5,7 +5,7 @@ Author: Iliya Vereshchagin
 Copyright (c) 2023 aBLT.ai. All rights reserved.
 
 Created: 03.11.2023
-Last Modified: 20.11.2023
+Last Modified: 17.10.2026
 
 Description:
 This file describes entry point for aBLT chat API.
@@ -13,5 +13,26 @@ This file describes entry point for aBLT chat API.
 
 from .ablt_api_async import ABLTApi as ABLTApi_async
 from .ablt_api_sync import ABLTApi
-from .utils.exceptions import DoneException
+from .job_queue import ChatJobQueue
+from .transport import (
+    AsyncTransport,
+    SyncTransport,
+    close_async_transport,
+    close_async_transports,
+    close_sync_transport,
+    close_sync_transports,
+    get_async_transport,
+    get_sync_transport,
+)
+from .utils.batch import BatchResult, ChatResult
+from .utils.circuit_breaker import CircuitBreaker
+from .utils.concurrency import AdaptiveConcurrencyLimiter
+from .utils.exceptions import ChatTimeoutError, CircuitOpenError, DoneException
+from .utils.rate_limiter import RateLimiter
+from .utils.response_cache import ResponseCache, SQLiteResponseCache
+from .utils.retry import RetryPolicy
+from .utils.scheduler import PriorityClass, RequestScheduler
+from .utils.statistics_cache import StatisticsCache
+from .utils.statistics_frame import StatisticsFrame
+from .utils.timeouts import ChatTimeout
 from .schemas import *
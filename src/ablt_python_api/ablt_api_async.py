@@ -5,36 +5,75 @@ Author: Iliya Vereshchagin
 Copyright (c) 2023 aBLT.ai. All rights reserved.
 
 Created: 03.11.2023
-Last Modified: 17.11.2023
+Last Modified: 17.10.2026
 
 Description:
 This file contains an implementation of class for async aBLT chat API.
 """
 
+# pylint: disable=C0302
+
 import asyncio
+import hashlib
 import json
 import logging
+import sqlite3
 import ssl
+from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import datetime
 from os import environ
-from time import sleep
-from typing import Optional
+from time import monotonic
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional, Union
 
 import aiohttp
 
-from .utils.exceptions import DoneException
-from .utils.logger_config import setup_logger
+from .transport import AsyncTransport, get_async_transport
+from .utils.bot_catalog import BotCatalog
+from .utils.batch import BatchResult, ChatResult, iter_bounded
+from .utils.circuit_breaker import CircuitBreaker
+from .utils.concurrency import AdaptiveConcurrencyLimiter, ConcurrencySample
+from .utils.exceptions import ChatTimeoutError, CircuitOpenError, DoneException
+from .utils.rate_limiter import RateLimiter
+from .utils.response_cache import ResponseCache, SQLiteResponseCache
+from .utils.retry import RetryPolicy
+from .utils.scheduler import RequestScheduler
+from .utils.single_flight import AsyncSingleFlight
+from .utils.statistics_cache import StatisticsCache, get_covering_ranges, split_date_range
+from .utils.statistics_frame import StatisticsFrame
+from .utils.timeouts import ChatTimeout
 
 
-class ABLTApi:
+class ABLTApi:  # pylint: disable=R0902,R0904
     """aBLT Chat API master class"""
 
-    def __init__(
+    def __init__(  # pylint: disable=R0914,R0917
         self,
         bearer_token: Optional[str] = None,
         base_api_url: str = "https://api.ablt.ai",
         logger: Optional[logging.Logger] = None,
         ssl_context: Optional[ssl.SSLContext] = None,
+        connector_limit: int = 100,
+        connector_limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        dns_cache_ttl: Optional[int] = 10,
+        transport: Optional[AsyncTransport] = None,
+        shared_transport: bool = False,
+        startup_check: str = "eager",
+        retry_policy: Optional[RetryPolicy] = None,
+        chat_timeout: Optional[ChatTimeout] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        coalesce_requests: bool = True,
+        bots_ttl: float = 300.0,
+        bots_hard_ttl: Optional[float] = 3600.0,
+        bots_cache_path: Optional[str] = None,
+        response_cache: Optional[Union[ResponseCache, SQLiteResponseCache]] = None,
+        statistics_cache: Optional[StatisticsCache] = None,
+        statistics_chunk_days: Optional[int] = None,
+        statistics_concurrency: int = 4,
+        statistics_chunk_retries: int = 1,
     ):
         """
         Initializes the object with the provided base API URL and bearer token.
@@ -47,10 +86,66 @@ class ABLTApi:
         :type logger: logger
         :param ssl_context: ssl context for aiohttp.
         :type ssl_context: ssl.SSLContext
+        :param connector_limit: total number of simultaneous connections in the pool, 0 means unlimited.
+        :type connector_limit: int
+        :param connector_limit_per_host: number of simultaneous connections to the same host, 0 means unlimited.
+        :type connector_limit_per_host: int
+        :param keepalive_timeout: how long (in seconds) idle connections are kept alive in the pool.
+        :type keepalive_timeout: float
+        :param dns_cache_ttl: how long (in seconds) resolved DNS entries are cached, None means forever.
+        :type dns_cache_ttl: int
+        :param transport: transport (connection pool) to use, it's not closed by this instance.
+        :type transport: AsyncTransport
+        :param shared_transport: use process-wide transport for base API URL, shared with other instances.
+        :type shared_transport: bool
+        :param startup_check: startup health check mode: 'eager' - check right now (in background if the event loop
+                              is running), 'lazy' - check before the first request, 'skip' - never check.
+        :type startup_check: str
+        :param retry_policy: retry policy for transient failures, default is RetryPolicy().
+        :type retry_policy: RetryPolicy
+        :param chat_timeout: default chat timeouts (connect, first chunk, idle, total), may be overridden per call.
+        :type chat_timeout: ChatTimeout
+        :param circuit_breaker: circuit breaker to fail fast while API is degraded, None means no circuit breaker.
+        :type circuit_breaker: CircuitBreaker
+        :param rate_limiter: client-side rate limiter to pace requests, None means no rate limiting.
+        :type rate_limiter: RateLimiter
+        :param concurrency_limiter: adaptive limiter of in-flight chat requests, None means no limit.
+        :type concurrency_limiter: AdaptiveConcurrencyLimiter
+        :param scheduler: scheduler of chat requests by priority classes and users, None means no scheduling.
+        :type scheduler: RequestScheduler
+        :param coalesce_requests: share one request (and its result) between concurrent identical calls of
+                                  health_check, get_bots and get_usage_statistics.
+        :type coalesce_requests: bool
+        :param bots_ttl: time (in seconds) after which bot catalog used by find_bot_by_* methods is refreshed in
+                         background, while stale one is served.
+        :type bots_ttl: float
+        :param bots_hard_ttl: time (in seconds) after which stale bot catalog isn't served and lookups wait for refresh,
+                              None means stale catalog is always served.
+        :type bots_hard_ttl: float
+        :param bots_cache_path: path to cache file of bot catalog, shared by processes and loaded on start (so cold
+                                start doesn't wait for bot list), None means bot catalog is kept in memory only.
+        :type bots_cache_path: str
+        :param response_cache: cache of non-streaming chat responses (SQLiteResponseCache is shared by processes),
+                               None means no caching.
+        :type response_cache: ResponseCache | SQLiteResponseCache
+        :param statistics_cache: cache of usage statistics of closed days, so only missing days are requested,
+                                 None means no caching.
+        :type statistics_cache: StatisticsCache
+        :param statistics_chunk_days: max days in one request of usage statistics, longer ranges are split into
+                                      chunks requested concurrently, None means ranges aren't split.
+        :type statistics_chunk_days: int
+        :param statistics_concurrency: max requests of statistics chunks in flight.
+        :type statistics_concurrency: int
+        :param statistics_chunk_retries: how many times failed chunks of statistics (only them) are requested again,
+                                         with backoff of retry policy between passes.
+        :type statistics_chunk_retries: int
 
         Raises:
             TypeError: If the bearer token is not provided.
+            ValueError: If the startup check mode is unknown.
         """
+        if startup_check not in ("eager", "lazy", "skip"):
+            raise ValueError(f"Unknown startup check mode: {startup_check}")
         self.__base_api_url = base_api_url
         if bearer_token is None:
             if environ.get("ABLT_BEARER_TOKEN"):
@@ -60,12 +155,62 @@ class ABLTApi:
         else:
             self.__bearer_token = bearer_token
         self.__ssl_context = ssl_context
-        if logger:
-            self.__logger = logger
+        self.__retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.__chat_timeout = chat_timeout if chat_timeout is not None else ChatTimeout()
+        self.__circuit_breaker = circuit_breaker
+        self.__rate_limiter = rate_limiter
+        self.__concurrency_limiter = concurrency_limiter
+        self.__scheduler = scheduler
+        self.__response_cache = response_cache
+        self.__statistics_cache = statistics_cache
+        self.__statistics_chunk_days = statistics_chunk_days
+        self.__statistics_concurrency = statistics_concurrency
+        self.__statistics_chunk_retries = statistics_chunk_retries
+        self.__bot_catalog = BotCatalog(bots_ttl, bots_hard_ttl, bots_cache_path, self.__get_cache_key())
+        self.__bots_refresh_task: Optional[asyncio.Task] = None
+        self.__single_flight = AsyncSingleFlight() if coalesce_requests else None
+        self.__transport_params = {
+            "connector_limit": connector_limit,
+            "connector_limit_per_host": connector_limit_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "dns_cache_ttl": dns_cache_ttl,
+        }
+        self.__shared_transport = shared_transport and transport is None
+        self.__owns_transport = transport is None and not shared_transport
+        if transport is not None:
+            self.__transport = transport
+        elif shared_transport:
+            self.__transport = get_async_transport(base_api_url, **self.__transport_params)
         else:
-            self.__logger = setup_logger("api", "api.log")
-            self.__logger.info("Logger for API now launched!")
+            self.__transport = AsyncTransport(**self.__transport_params)
+        self.__logger = logger if logger else self.__transport.logger
+
+        self.__startup_check = startup_check
+        # Transport shared with other instances may be already checked
+        if startup_check == "eager" and not self.__transport.healthy:
+            self.__eager_startup_check()
+
+    @classmethod
+    async def create(cls, *args, startup_check: str = "eager", **kwargs) -> "ABLTApi":
+        """
+        Creates the object without blocking the running event loop, see __init__ for params.
+
+        :param startup_check: startup health check mode: 'eager' - await the check, 'lazy' - check before the first
+                              request, 'skip' - never check.
+        :type startup_check: str
+        :return: ABLTApi instance.
+        :rtype: ABLTApi
+
+        Raises:
+            ConnectionError: If the eager health check fails.
+        """
+        api = cls(*args, startup_check="lazy" if startup_check == "eager" else startup_check, **kwargs)
+        if startup_check == "eager":
+            await api.__ensure_healthy()
+        return api
 
+    def __eager_startup_check(self) -> None:
+        """Runs the startup health check in the current event loop (or starts it in background if loop is running)."""
         try:
             loop = asyncio.get_event_loop()
         except RuntimeError:
@@ -73,9 +218,53 @@ class ABLTApi:
             asyncio.set_event_loop(loop)
 
         if loop.is_running():
-            loop.create_task(self.update_api())
+            # The first request waits for this check
+            self.__transport.start_health_check(self.update_api)
         else:
-            loop.run_until_complete(self.update_api())
+            try:
+                loop.run_until_complete(self.update_api())
+            finally:
+                # Session is bound to this loop, which most probably won't be used for further calls
+                loop.run_until_complete(self.__transport.aclose(current_loop_only=True))
+
+    async def __ensure_healthy(self) -> None:
+        """
+        Waits for the startup health check (or runs it if it's lazy and not done yet).
+
+        Raises:
+            ConnectionError: If the health check fails.
+        """
+        if self.__startup_check != "skip":
+            await self.__transport.ensure_healthy(self.update_api)
+
+    async def __aenter__(self):
+        """
+        Enters the async context manager.
+
+        :return: ABLTApi instance.
+        :rtype: ABLTApi
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exits the async context manager and closes the pooled session."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the pooled session and all its connections, shared transports are left untouched."""
+        if self.__bots_refresh_task is not None:
+            self.__bots_refresh_task.cancel()
+        if self.__owns_transport:
+            await self.__transport.aclose()
+
+    def get_transport(self) -> AsyncTransport:
+        """
+        Returns the transport (connection pool) used by this instance.
+
+        :return: transport.
+        :rtype: AsyncTransport
+        """
+        return self.__transport
 
     def get_base_api_url(self) -> str:
         """
@@ -118,85 +307,340 @@ class ABLTApi:
         headers = {"Authorization": f"Bearer {self.__bearer_token}"}
         return url, headers
 
+    @staticmethod
+    async def __wait_for(
+        awaitable: Awaitable, timeout: Optional[ChatTimeout], started: float, phase_started: float, phase: str
+    ) -> Any:
+        """
+        Waits for the awaitable, enforcing chat timeouts.
+
+        :param awaitable: awaitable to wait for.
+        :type awaitable: Awaitable
+        :param timeout: chat timeouts, None means no timeouts.
+        :type timeout: ChatTimeout
+        :param started: monotonic time when the chat call was started.
+        :type started: float
+        :param phase_started: monotonic time when the current phase was started.
+        :type phase_started: float
+        :param phase: current phase: 'first_chunk' or 'idle'.
+        :type phase: str
+        :return: result of the awaitable.
+        :rtype: Any
+
+        Raises:
+            ChatTimeoutError: If timeout is exceeded.
+        """
+        if timeout is None:
+            return await awaitable
+        wait, phase = timeout.get_wait(started, phase_started, phase)
+        try:
+            return await asyncio.wait_for(awaitable, wait)
+        except asyncio.TimeoutError as error:
+            raise ChatTimeoutError(phase, getattr(timeout, phase)) from error
+
+    async def __iter_chunks(
+        self, response: aiohttp.ClientResponse, timeout: Optional[ChatTimeout], started: float
+    ) -> AsyncIterator[bytes]:
+        """
+        Yields chunks of the streaming response, enforcing first chunk, idle and total timeouts.
+
+        :param response: streaming response.
+        :type response: aiohttp.ClientResponse
+        :param timeout: chat timeouts, None means no timeouts.
+        :type timeout: ChatTimeout
+        :param started: monotonic time when the chat call was started.
+        :type started: float
+        :return: chunks of the response.
+        :rtype: AsyncIterator[bytes]
+
+        Raises:
+            ChatTimeoutError: If timeout is exceeded.
+        """
+        phase, phase_started = "first_chunk", started
+        while True:
+            chunk = await self.__wait_for(response.content.readany(), timeout, started, phase_started, phase)
+            if not chunk:
+                return
+            phase, phase_started = "idle", monotonic()
+            yield chunk
+
+    async def __check_circuit(self, endpoint: str) -> None:
+        """
+        Checks circuit breaker before request to endpoint, probes recovery with health check when it's time.
+
+        :param endpoint: The endpoint for the API request.
+        :type endpoint: str
+
+        Raises:
+            CircuitOpenError: If the circuit of endpoint is open or recovery probe has failed.
+        """
+        if self.__circuit_breaker is None or not self.__circuit_breaker.acquire(endpoint):
+            return
+        try:
+            healthy = await self.health_check()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            healthy = False
+        if not healthy:
+            self.__circuit_breaker.record_failure(endpoint)
+            raise CircuitOpenError(endpoint, self.__circuit_breaker.recovery_timeout)
+
+    def __record_outcome(self, endpoint: str, status: Optional[int] = None) -> None:
+        """
+        Records outcome of request to endpoint in circuit breaker.
+
+        :param endpoint: The endpoint for the API request.
+        :type endpoint: str
+        :param status: HTTP status of the response, None if request has failed without response.
+        :type status: int
+        """
+        if self.__circuit_breaker is None:
+            return
+        if status is None or self.__circuit_breaker.is_failure_status(status):
+            self.__circuit_breaker.record_failure(endpoint)
+        else:
+            self.__circuit_breaker.record_success(endpoint)
+
+    @asynccontextmanager
+    async def __limit_concurrency(
+        self, priority: Optional[str] = None, user_id: Optional[int] = None
+    ) -> AsyncIterator[ConcurrencySample]:
+        """
+        Takes a slot of scheduler and then a slot of concurrency limiter (if any) for the request.
+
+        :param priority: name of priority class of the request for scheduler.
+        :type priority: str
+        :param user_id: user identifier for fair queuing of scheduler.
+        :type user_id: int
+        :return: sample to record signals of the request.
+        :rtype: ConcurrencySample
+        """
+        async with AsyncExitStack() as stack:
+            if self.__scheduler is not None:
+                await stack.enter_async_context(self.__scheduler.slot_async(priority, user_id))
+            if self.__concurrency_limiter is None:
+                yield ConcurrencySample()
+            else:
+                yield await stack.enter_async_context(self.__concurrency_limiter.slot())
+
+    async def __coalesce(self, endpoint: str, func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """
+        Calls request function, sharing it with concurrent identical calls (if coalescing is enabled).
+
+        :param endpoint: The endpoint for the API request.
+        :type endpoint: str
+        :param func: request function.
+        :type func: Callable
+        :param args: arguments of the request function.
+        :type args: Any
+        :return: result of the request function.
+        :rtype: Any
+        """
+        if self.__single_flight is None:
+            return await func(*args)
+        key = (self.__base_api_url, self.__bearer_token, endpoint, *args)
+        return await self.__single_flight.do(key, func, *args)
+
+    @asynccontextmanager
+    async def __request(  # pylint: disable=R0914,R0917
+        self,
+        method: str,
+        endpoint: str,
+        streaming: bool = False,
+        timeout: Optional[ChatTimeout] = None,
+        cost: Optional[int] = None,
+        sample: Optional[ConcurrencySample] = None,
+        **kwargs,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Sends an API request, retries transient failures according to retry policy and yields the final response.
+
+        :param method: HTTP method.
+        :type method: str
+        :param endpoint: The endpoint for the API request.
+        :type endpoint: str
+        :param streaming: whether request is streaming one.
+        :type streaming: bool
+        :param timeout: timeouts for connect and response headers (first chunk or total), None means no timeouts.
+        :type timeout: ChatTimeout
+        :param cost: cost of the request for weighted rate limiter (e.g. 'max_words').
+        :type cost: int
+        :param sample: sample of concurrency limiter to record 429 statuses and timeouts.
+        :type sample: ConcurrencySample
+        :param kwargs: other params for aiohttp request.
+        :return: The final response (it's released on exit).
+        :rtype: aiohttp.ClientResponse
+
+        Raises:
+            ChatTimeoutError: If connect or first chunk (total) timeout is exceeded.
+            CircuitOpenError: If the circuit of endpoint is open.
+        """
+        url, headers = self.__get_url_and_headers(endpoint)
+        headers.update(kwargs.pop("headers", {}))
+        session = self.__transport.get_session()
+        retryable = self.__retry_policy.is_retryable(endpoint, streaming)
+        started = monotonic()
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=None, sock_connect=timeout.connect)
+        attempt = 0
+        while True:
+            await self.__check_circuit(endpoint)
+            if self.__rate_limiter is not None:
+                await self.__rate_limiter.acquire_async(self.__bearer_token, endpoint, cost)
+            wait, phase = timeout.get_wait(started, started, "first_chunk") if timeout is not None else (None, "")
+            try:
+                response = await asyncio.wait_for(
+                    session.request(method, url, headers=headers, ssl=self.__ssl_context, **kwargs), wait
+                )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+                self.__record_outcome(endpoint)
+                if sample is not None and isinstance(error, asyncio.TimeoutError):
+                    sample.mark_overloaded()
+                delay = self.__retry_policy.get_delay(attempt)
+                if (
+                    not retryable
+                    or not self.__retry_policy.can_retry(attempt, monotonic() - started, delay)
+                    or (timeout is not None and not timeout.can_retry(started, delay))
+                ):
+                    if timeout is not None and isinstance(error, asyncio.TimeoutError):
+                        phase = "connect" if isinstance(error, aiohttp.ServerTimeoutError) else phase
+                        raise ChatTimeoutError(phase, getattr(timeout, phase)) from error
+                    raise
+                reason = repr(error)
+            else:
+                self.__record_outcome(endpoint, response.status)
+                if sample is not None and response.status == 429:
+                    sample.mark_overloaded()
+                if not retryable or not self.__retry_policy.is_retryable_status(response.status):
+                    break
+                delay = self.__retry_policy.get_delay(attempt, response.headers.get("Retry-After"))
+                if not self.__retry_policy.can_retry(attempt, monotonic() - started, delay) or (
+                    timeout is not None and not timeout.can_retry(started, delay)
+                ):
+                    break
+                reason = f"{response.status}, x-request-id: {response.headers.get('x-request-id')}"
+                response.release()
+            attempt += 1
+            self.__logger.warning(
+                "WARNING: Request to %s failed (%s), retry %s/%s in %.2f s",
+                endpoint,
+                reason,
+                attempt,
+                self.__retry_policy.max_retries,
+                delay,
+            )
+            await asyncio.sleep(delay)
+        try:
+            yield response
+        finally:
+            response.release()
+
     async def health_check(self) -> bool:
         """
         Performs a health check on the API.
 
+        Concurrent calls share one request (unless coalescing is disabled).
+
         :return: True if the API status is 'ok', False otherwise.
         :rtype: bool
         """
-        url, headers = self.__get_url_and_headers("health-check")
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, headers=headers, ssl=self.__ssl_context) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get("status") == "ok":
-                            self.__logger.info("ABLT chat API is working like a charm")
-                            return True
-                        self.__logger.error("Error: %s", data.get("status"))
-                        try:
-                            self.__logger.error("Error details:")
-                            for error in data["detail"]:
-                                self.__logger.error(
-                                    "  - %s (type: %s, location: %s)", error["msg"], error["type"], error["loc"]
-                                )
-                            self.__logger.error("  - x-request-id: %s", response.headers.get("x-request-id"))
-                        except ValueError:
-                            self.__logger.error(
-                                "Error text: %s, x-request-id: %s", response.text, response.headers.get("x-request-id")
-                            )
-                        return False
-                    self.__logger.error(
-                        "Request error: %s, x-request-id: %s", response.status, response.headers.get("x-request-id")
-                    )
+        return await self.__coalesce("health-check", self.__health_check)
+
+    async def __health_check(self) -> bool:
+        """
+        Requests health check of the API.
+
+        :return: True if the API status is 'ok', False otherwise.
+        :rtype: bool
+        """
+        url, _ = self.__get_url_and_headers("health-check")
+        try:
+            async with self.__request("GET", "health-check") as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if data.get("status") == "ok":
+                        self.__logger.info("ABLT chat API is working like a charm")
+                        return True
+                    self.__logger.error("Error: %s", data.get("status"))
                     try:
-                        error_data = await response.json()
                         self.__logger.error("Error details:")
-                        for original_error in error_data["detail"]:
+                        for error in data["detail"]:
                             self.__logger.error(
-                                "  - %s (type: %s, location: %s)",
-                                original_error["msg"],
-                                original_error["type"],
-                                original_error["loc"],
+                                "  - %s (type: %s, location: %s)", error["msg"], error["type"], error["loc"]
                             )
                         self.__logger.error("  - x-request-id: %s", response.headers.get("x-request-id"))
-                    except (ValueError, aiohttp.ContentTypeError):
+                    except ValueError:
                         self.__logger.error(
                             "Error text: %s, x-request-id: %s", response.text, response.headers.get("x-request-id")
                         )
                     return False
-            except aiohttp.ClientConnectorError:
-                self.__logger.error("Error: Connection to aBLT API couldn't be established, check URL: %s", url)
+                self.__logger.error(
+                    "Request error: %s, x-request-id: %s", response.status, response.headers.get("x-request-id")
+                )
+                try:
+                    error_data = await response.json()
+                    self.__logger.error("Error details:")
+                    for original_error in error_data["detail"]:
+                        self.__logger.error(
+                            "  - %s (type: %s, location: %s)",
+                            original_error["msg"],
+                            original_error["type"],
+                            original_error["loc"],
+                        )
+                    self.__logger.error("  - x-request-id: %s", response.headers.get("x-request-id"))
+                except (ValueError, aiohttp.ContentTypeError):
+                    self.__logger.error(
+                        "Error text: %s, x-request-id: %s", response.text, response.headers.get("x-request-id")
+                    )
                 return False
+        except aiohttp.ClientConnectorError:
+            self.__logger.error("Error: Connection to aBLT API couldn't be established, check URL: %s", url)
+            return False
 
     async def get_bots(self) -> list[dict]:
         """
         Retrieves all published bots.
 
+        Concurrent calls share one request and its result (unless coalescing is disabled), so don't modify it.
+
         :return: A list of dictionaries containing bot information (BotSchema), or an empty list if an error occurs.
         :rtype: list[dict]
         """
-        url, headers = self.__get_url_and_headers("v1/bots")
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, ssl=self.__ssl_context) as response:
-                if response.status == 200:
-                    return await response.json()
+        bots = await self.__coalesce("v1/bots", self.__get_bots)
+        return bots if bots is not None else []
+
+    async def __get_bots(self) -> Optional[list[dict]]:
+        """
+        Requests all published bots.
+
+        :return: A list of dictionaries containing bot information (BotSchema), or None if an error occurs.
+        :rtype: list[dict] | None
+        """
+        await self.__ensure_healthy()
+        async with self.__request("GET", "v1/bots", headers=self.__bot_catalog.get_validators()) as response:
+            if response.status == 304:
+                self.__bot_catalog.touch()
+                await self.__save_bot_catalog()
+                return self.__bot_catalog.get_bots()
+            if response.status == 200:
+                bots = await response.json()
+                self.__bot_catalog.update(bots, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+                await self.__save_bot_catalog()
+                return bots
+            self.__logger.error(
+                "Request error: %s, x-request-id: %s", response.status, response.headers.get("x-request-id")
+            )
+            try:
+                error_data = await response.json()
                 self.__logger.error(
-                    "Request error: %s, x-request-id: %s", response.status, response.headers.get("x-request-id")
+                    "Error details: %s, x-request-id: %s", error_data, response.headers.get("x-request-id")
                 )
-                try:
-                    error_data = await response.json()
-                    self.__logger.error(
-                        "Error details: %s, x-request-id: %s", error_data, response.headers.get("x-request-id")
-                    )
-                except (ValueError, aiohttp.ContentTypeError):
-                    self.__logger.error(
-                        "Error text: %s, x-request-id: %s", await response.text(), response.headers.get("x-request-id")
-                    )
-                return []
+            except (ValueError, aiohttp.ContentTypeError):
+                self.__logger.error(
+                    "Error text: %s, x-request-id: %s", await response.text(), response.headers.get("x-request-id")
+                )
+            return None
 
-    # pylint: disable=R0914,R0912,R0915
+    # pylint: disable=R0914,R0912,R0915,R0917
     async def chat(
         self,
         bot_uid: Optional[str] = None,
@@ -209,6 +653,9 @@ class ABLTApi:
         assumptions: Optional[dict] = None,
         max_words: Optional[int] = None,
         use_search: Optional[bool] = False,
+        timeout: Optional[ChatTimeout] = None,
+        priority: Optional[str] = None,
+        bypass_cache: bool = False,
     ):
         """
         Sends a chat request to the API and returns the response.
@@ -234,9 +681,17 @@ class ABLTApi:
         :type max_words: int
         :param use_search: A flag for using search mode (default is False).
         :type use_search: bool
+        :param timeout: chat timeouts for this call, if None, the default ones of API instance are used.
+        :type timeout: ChatTimeout
+        :param priority: priority class of the request for scheduler, if None, the default class is used.
+        :type priority: str
+        :param bypass_cache: don't use response cache for this call (neither read nor update it).
+        :type bypass_cache: bool
         :return: The response message from the bot or None in case of an error.
         :rtype: yield
         :raises DoneException: If the bot is done with the conversation.
+        :raises ChatTimeoutError: If one of chat timeouts is exceeded.
+        :raises CircuitOpenError: If the circuit of chat endpoint is open.
 
         Important: Only one of the parameters 'prompt' or 'messages' should be provided.
                    Only one of the parameters 'bot_uid' or 'bot_slug' should be provided.
@@ -249,6 +704,8 @@ class ABLTApi:
 
         Raises:
             DoneException: If the bot is done with the conversation.
+            ChatTimeoutError: If one of chat timeouts is exceeded.
+            CircuitOpenError: If the circuit of chat endpoint is open.
         """
         if (prompt is None and messages is None) or (prompt is not None and messages is not None):
             self.__logger.error("Error: Only one param is required ('prompt' or 'messages')")
@@ -258,7 +715,7 @@ class ABLTApi:
             self.__logger.error("Error: Only one param is required ('bot_slug' or 'bot_uid')")
             return
 
-        url, headers = self.__get_url_and_headers("v1/chat")
+        await self.__ensure_healthy()
         payload = {
             "stream": stream,
             **({"bot_slug": bot_slug} if bot_slug is not None else {}),
@@ -271,13 +728,27 @@ class ABLTApi:
             **({"user_id": user_id} if user_id is not None else {}),
             **({"use_search": use_search} if use_search is not None else {}),
         }
+        cache_key = None
+        if self.__response_cache is not None and not stream and not bypass_cache:
+            cache_key = self.__response_cache.get_key(payload, self.__get_cache_key())
+            cached_message = await self.__get_cached_response(cache_key)
+            if cached_message is not None:
+                yield cached_message
+                return
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=headers, json=payload, ssl=self.__ssl_context) as response:
+        timeout = timeout if timeout is not None else self.__chat_timeout
+        timeout = timeout if timeout.is_set() else None
+        started = monotonic()
+        # Slot is released when the chat is consumed or closed (event loop finalizes abandoned async generators)
+        async with self.__limit_concurrency(priority, user_id) as sample:  # pylint: disable=W0135
+            async with self.__request(
+                "POST", "v1/chat", streaming=bool(stream), timeout=timeout, cost=max_words, sample=sample, json=payload
+            ) as response:
                 if response.status == 200:
                     if stream:
                         try:
-                            async for line in response.content.iter_any():
+                            async for line in self.__iter_chunks(response, timeout, started):
+                                sample.mark_first_chunk()
                                 if line:
                                     line_data = line.decode("utf-8").splitlines()
                                     for data in line_data:
@@ -299,7 +770,8 @@ class ABLTApi:
                         finally:
                             await response.release()
                     else:
-                        response_json = await response.json()
+                        response_json = await self.__wait_for(response.json(), timeout, started, started, "first_chunk")
+                        sample.mark_first_chunk()
 
                         if "message" in response_json:
                             message = response_json.get("message")
@@ -312,6 +784,8 @@ class ABLTApi:
                                 response.headers.get("x-request-id"),
                             )
                             return
+                        if cache_key is not None and isinstance(message, str):
+                            await self.__cache_response(cache_key, message)
                         yield message
                 else:
                     self.__logger.error("Error: %s", response.status)
@@ -336,25 +810,76 @@ class ABLTApi:
                         )
                     return
 
-    async def update_api(self) -> None:
+    async def __collect_chat(self, request: dict) -> Optional[str]:
         """
-        Updates the API by calling the health_check function.
+        Sends a chat request and collects the full response.
 
-        :raises ConnectionError: If the health_check function fails 10 times in a row.
+        :param request: chat params.
+        :type request: dict
+        :return: The full response from the bot or None in case of an error.
+        :rtype: str | None
+        """
+        messages = []
+        try:
+            async for message in self.chat(**request):
+                messages.append(message)
+        except DoneException:
+            pass
+        return "".join(messages) if messages else None
+
+    def chat_many(
+        self, requests: Iterable[dict], concurrency: int = 10, ordered: bool = False, priority: Optional[str] = None
+    ) -> AsyncIterator[ChatResult]:
+        """
+        Sends many chat requests with bounded concurrency over the pooled session and yields results as they complete.
+
+        Error of a single request doesn't abort the batch, it's reported in its result (response is None and error is
+        set, or both are None if API has returned an error, which is logged). Closing (or cancelling) the iterator
+        cancels requests in flight.
+
+        :param requests: chat params for each request, consumed lazily.
+        :type requests: Iterable[dict]
+        :param concurrency: max requests in flight.
+        :type concurrency: int
+        :param ordered: yield results in order of requests instead of order of completion.
+        :type ordered: bool
+        :param priority: default priority class of requests for scheduler, if None, the lowest priority class of
+                         scheduler is used (so interactive chats go first).
+        :type priority: str
+        :return: results of requests.
+        :rtype: AsyncIterator[ChatResult]
+        """
+        if priority is None and self.__scheduler is not None:
+            priority = self.__scheduler.lowest_class
+        return iter_bounded(
+            lambda request: self.__collect_chat({"priority": priority, **request}), requests, concurrency, ordered
+        )
+
+    async def update_api(self, retries: int = 10, backoff: float = 0.5, max_backoff: float = 8.0) -> None:
+        """
+        Updates the API by calling the health_check function, retries with exponential backoff.
+
+        :param retries: how many times to try the health check.
+        :type retries: int
+        :param backoff: delay (in seconds) after the first failed try, doubled after each next one.
+        :type backoff: float
+        :param max_backoff: max delay (in seconds) between tries.
+        :type max_backoff: float
+        :raises ConnectionError: If the health_check function fails `retries` times in a row.
 
         Raises:
-            ConnectionError: If the health_check function fails 10 times in a row.
-        """
-        retries = 0
-        while retries < 10:
-            if not await self.health_check():
-                retries += 1
-                self.__logger.warning("WARNING: Seems something nasty happened with aBLT api, trying %s/10", retries)
-                sleep(5)
-            else:
-                break
-        if retries >= 10:
-            raise ConnectionError("ERROR: Connection to aBLT API couldn't be established")
+            ConnectionError: If the health_check function fails `retries` times in a row.
+        """
+        for attempt in range(1, retries + 1):
+            if await self.health_check():
+                self.__transport.healthy = True
+                return
+            self.__logger.warning(
+                "WARNING: Seems something nasty happened with aBLT api, trying %s/%s", attempt, retries
+            )
+            if attempt < retries:
+                await asyncio.sleep(min(max_backoff, backoff * 2 ** (attempt - 1)))
+        raise ConnectionError("ERROR: Connection to aBLT API couldn't be established")
 
     async def set_base_api_url(self, new_base_api_url: str, instant_update: bool = False):
         """
@@ -366,6 +891,9 @@ class ABLTApi:
         :type instant_update: bool
         """
         self.__base_api_url = new_base_api_url
+        self.__bot_catalog.reset(self.__get_cache_key())
+        if self.__shared_transport:
+            self.__transport = get_async_transport(new_base_api_url, **self.__transport_params)
         if instant_update:
             await self.update_api()
 
@@ -379,6 +907,7 @@ class ABLTApi:
         :type instant_update: bool
         """
         self.__bearer_token = new_bearer_token
+        self.__bot_catalog.reset(self.__get_cache_key())
         if instant_update:
             await self.update_api()
 
@@ -408,10 +937,7 @@ class ABLTApi:
         :return: bot dict (BotSchema).
         :rtype: dict|None
         """
-        for bot_info in await self.get_bots():
-            if bot_info.get("uid") == bot_uid:
-                return bot_info
-        return None
+        return (await self.__get_bot_catalog()).get_by_uid(bot_uid)
 
     async def find_bot_by_slug(self, bot_slug: str) -> Optional[dict]:
         """
@@ -422,10 +948,7 @@ class ABLTApi:
         :return: bot dict (BotSchema).
         :rtype: dict|None
         """
-        for bot_info in await self.get_bots():
-            if bot_info.get("slug") == bot_slug:
-                return bot_info
-        return None
+        return (await self.__get_bot_catalog()).get_by_slug(bot_slug)
 
     async def find_bot_by_name(self, bot_name: str) -> Optional[dict]:
         """
@@ -436,53 +959,281 @@ class ABLTApi:
         :return: bot dict (BotSchema).
         :rtype: dict|None
         """
-        for bot_info in await self.get_bots():
-            if bot_info.get("name") == bot_name:
-                return bot_info
-        return None
+        bots = await self.find_bots_by_name(bot_name)
+        return bots[0] if bots else None
+
+    async def find_bots_by_name(self, bot_name: str) -> list[dict]:
+        """
+        Searches for all bots with the name in the bot list (names are not unique).
+
+        :param bot_name: The name of the bots to search for.
+        :type bot_name: str
+        :return: list of bot dicts (BotSchema).
+        :rtype: list[dict]
+        """
+        return (await self.__get_bot_catalog()).get_by_name(bot_name)
+
+    async def refresh_bots(self) -> bool:
+        """
+        Downloads bot list and refreshes bot catalog used by find_bot_by_* methods.
+
+        :return: True if bot catalog is refreshed (or revalidated), False in case of an error.
+        :rtype: bool
+        """
+        return await self.__coalesce("v1/bots", self.__get_bots) is not None
+
+    async def __get_bot_catalog(self) -> BotCatalog:
+        """
+        Returns bot catalog: fresh one as is, stale one while it's refreshed in background, and waits for refresh
+        only if catalog isn't loaded or its hard TTL is expired (stale catalog is kept if refresh fails).
+
+        :return: bot catalog.
+        :rtype: BotCatalog
+        """
+        if not self.__bot_catalog.is_fresh():
+            if self.__bot_catalog.is_usable():
+                self.__refresh_bots_in_background()
+            else:
+                await self.get_bots()
+        return self.__bot_catalog
+
+    def __get_cache_key(self) -> str:
+        """
+        Returns key of API in caches (hash of base API URL and bearer token).
+
+        :return: key of API.
+        :rtype: str
+        """
+        return hashlib.sha256(f"{self.__base_api_url}\n{self.__bearer_token}".encode("utf-8")).hexdigest()
+
+    async def __get_cached_response(self, cache_key: str) -> Optional[str]:
+        """
+        Returns cached chat response, errors of shared cache are logged (as a miss).
+
+        :param cache_key: key of the request.
+        :type cache_key: str
+        :return: cached response or None.
+        :rtype: str | None
+        """
+        if not isinstance(self.__response_cache, SQLiteResponseCache):
+            return self.__response_cache.get(cache_key)
+        try:
+            return await asyncio.to_thread(self.__response_cache.get, cache_key)
+        except sqlite3.Error as error:
+            self.__logger.warning("WARNING: Response cache isn't read: %s", error)
+            return None
+
+    async def __cache_response(self, cache_key: str, message: str) -> None:
+        """
+        Caches chat response, errors of shared cache are logged.
+
+        :param cache_key: key of the request.
+        :type cache_key: str
+        :param message: full response of the bot.
+        :type message: str
+        """
+        if not isinstance(self.__response_cache, SQLiteResponseCache):
+            self.__response_cache.set(cache_key, message)
+            return
+        try:
+            await asyncio.to_thread(self.__response_cache.set, cache_key, message)
+        except sqlite3.Error as error:
+            self.__logger.warning("WARNING: Response cache isn't written: %s", error)
+
+    async def __save_bot_catalog(self) -> None:
+        """Saves bot catalog to cache file (if any), errors are logged."""
+        try:
+            await asyncio.to_thread(self.__bot_catalog.save)
+        except OSError as error:
+            self.__logger.warning("WARNING: Bot catalog isn't saved to %s: %s", self.__bot_catalog.path, error)
+
+    def __refresh_bots_in_background(self) -> None:
+        """Starts background refresh of bot catalog, unless it's already running."""
+        if self.__bots_refresh_task is None or self.__bots_refresh_task.done():
+            self.__bots_refresh_task = asyncio.get_running_loop().create_task(self.__refresh_bots_quietly())
+
+    async def __refresh_bots_quietly(self) -> None:
+        """Refreshes bot catalog, errors are logged (stale catalog is kept)."""
+        try:
+            await self.get_bots()
+        except (aiohttp.ClientError, asyncio.TimeoutError, CircuitOpenError) as error:
+            self.__logger.warning("WARNING: Background refresh of bots failed: %s", repr(error))
 
     async def get_usage_statistics(
         self,
         user_id: Optional[int] = -1,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-    ) -> Optional[dict]:
+        as_frame: bool = False,
+    ) -> Optional[Union[dict, StatisticsFrame]]:
         """
         Retrieves usage statistics for the API.
 
+        Concurrent identical calls share one request and its result (unless coalescing is disabled), so don't modify it.
+
         :param user_id: The id of the user to get statistics for.
         :type user_id: int
         :param start_date: The start date for the statistics in format YYYY-MM-DD.
         :type start_date: str
         :param end_date: The end date for the statistics in format YYYY-MM-DD.
         :type end_date: str
+        :param as_frame: return columnar StatisticsFrame (requires numpy) instead of dict.
+        :type as_frame: bool
         :return: The response message from the bot (StatisticsSchema) or None in case of an error.
-        :rtype: dict|None
+        :rtype: dict|StatisticsFrame|None
         """
         if not isinstance(user_id, int):
             self.__logger.error("Error: user_id should be int")
             return None
         start_date = datetime.now().strftime("%Y-%m-%d") if start_date is None else start_date
         end_date = datetime.now().strftime("%Y-%m-%d") if end_date is None else end_date
-        url, headers = self.__get_url_and_headers("v1/user/usage-statistics")
+        if self.__statistics_cache is not None or self.__statistics_chunk_days is not None:
+            statistics = await self.__get_merged_usage_statistics(user_id, start_date, end_date)
+        else:
+            statistics = await self.__coalesce(
+                "v1/user/usage-statistics", self.__get_usage_statistics, user_id, start_date, end_date
+            )
+        return StatisticsFrame.from_statistics(statistics) if as_frame and statistics is not None else statistics
+
+    async def __get_merged_usage_statistics(self, user_id: int, start_date: str, end_date: str) -> Optional[dict]:
+        """
+        Retrieves usage statistics by chunks (only days missing in statistics cache, if any) and merges them.
+
+        :param user_id: The id of the user to get statistics for.
+        :type user_id: int
+        :param start_date: The start date for the statistics in format YYYY-MM-DD.
+        :type start_date: str
+        :param end_date: The end date for the statistics in format YYYY-MM-DD.
+        :type end_date: str
+        :return: The response message from the bot (StatisticsSchema), with "failed_ranges" if some chunks have
+                 failed, or None in case of an error.
+        :rtype: dict|None
+        """
+        try:
+            start = datetime.strptime(start_date, "%Y-%m-%d").date()
+            end = datetime.strptime(end_date, "%Y-%m-%d").date()
+        except ValueError:
+            # Malformed dates are reported by the server
+            return await self.__get_usage_statistics(user_id, start_date, end_date)
+        key = self.__get_cache_key()
+        if self.__statistics_cache is not None:
+            ranges = self.__statistics_cache.get_missing_ranges(key, user_id, start, end)
+            cached = self.__statistics_cache.get_items(key, user_id, start, end)
+            items = {day.isoformat(): item for day, item in cached.items()}
+        else:
+            ranges, items = [(start, end)], {}
+        chunks, failed = await self.__fetch_usage_statistics(user_id, ranges)
+        if failed and not chunks and not items:
+            return None
+        for chunk, stats in chunks:
+            if self.__statistics_cache is not None:
+                self.__statistics_cache.update(key, user_id, chunk["start_date"], chunk["end_date"], stats["items"])
+            # Items without date can't be merged by day, so they are dropped
+            items.update(
+                {
+                    str(item["date"]): item
+                    for item in stats["items"]
+                    if isinstance(item, dict) and item.get("date") is not None
+                }
+            )
+        merged = [items[day] for day in sorted(items) if items[day] is not None]
+        statistics = {"total": StatisticsCache.get_total(merged), "items": merged}
+        if failed:
+            # Partial statistics are returned with sub-ranges, which couldn't be received
+            statistics["failed_ranges"] = [
+                {"start_date": chunk["start_date"].isoformat(), "end_date": chunk["end_date"].isoformat()}
+                for chunk in sorted(failed, key=lambda chunk: chunk["start_date"])
+            ]
+        return statistics
+
+    async def __fetch_usage_statistics(self, user_id: int, ranges: list[tuple]) -> tuple[list[tuple], list[dict]]:
+        """
+        Requests usage statistics of date ranges split into chunks, which are requested concurrently. Failed chunks
+        (only them) are requested again up to `statistics_chunk_retries` times, with backoff of retry policy.
+
+        :param user_id: The id of the user to get statistics for.
+        :type user_id: int
+        :param ranges: list of (start date, end date) tuples.
+        :type ranges: list[tuple]
+        :return: list of (chunk, statistics) tuples of received chunks and list of failed chunks (errors are logged).
+        :rtype: tuple[list[tuple], list[dict]]
+        """
+        chunks = [
+            {"start_date": chunk_start, "end_date": chunk_end}
+            for range_start, range_end in ranges
+            for chunk_start, chunk_end in split_date_range(range_start, range_end, self.__statistics_chunk_days)
+        ]
+        fetched: list[tuple] = []
+        failed: list = []
+        for attempt in range(self.__statistics_chunk_retries + 1):
+            if attempt > 0:
+                self.__logger.warning(
+                    "WARNING: %s chunks of usage statistics failed, retrying them %s/%s",
+                    len(chunks),
+                    attempt,
+                    self.__statistics_chunk_retries,
+                )
+                await asyncio.sleep(self.__retry_policy.get_delay(attempt - 1))
+            failed = []
+            async for result in iter_bounded(
+                lambda chunk: self.__coalesce(
+                    "v1/user/usage-statistics",
+                    self.__get_usage_statistics,
+                    user_id,
+                    chunk["start_date"].isoformat(),
+                    chunk["end_date"].isoformat(),
+                ),
+                chunks,
+                self.__statistics_concurrency,
+                result_type=BatchResult,
+            ):
+                if result.ok and isinstance(result.response, dict) and isinstance(result.response.get("items"), list):
+                    fetched.append((result.request, result.response))
+                else:
+                    failed.append(result)
+            if not failed:
+                break
+            chunks = [result.request for result in failed]
+        for result in failed:
+            self.__logger.error(
+                "Error: usage statistics from %s to %s failed: %s",
+                result.request["start_date"],
+                result.request["end_date"],
+                repr(result.error) if result.error is not None else "API error",
+            )
+        return fetched, [result.request for result in failed]
+
+    async def __get_usage_statistics(self, user_id: int, start_date: str, end_date: str) -> Optional[dict]:
+        """
+        Requests usage statistics for the API.
+
+        :param user_id: The id of the user to get statistics for.
+        :type user_id: int
+        :param start_date: The start date for the statistics in format YYYY-MM-DD.
+        :type start_date: str
+        :param end_date: The end date for the statistics in format YYYY-MM-DD.
+        :type end_date: str
+        :return: The response message from the bot (StatisticsSchema) or None in case of an error.
+        :rtype: dict|None
+        """
+        await self.__ensure_healthy()
         payload = {"user_id": user_id, "start_date": start_date, "end_date": end_date}
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload, headers=headers, ssl=self.__ssl_context) as response:
-                if response.status == 200:
-                    return await response.json()
+        async with self.__request("POST", "v1/user/usage-statistics", json=payload) as response:
+            if response.status == 200:
+                return await response.json()
+            self.__logger.error(
+                "Request error: %s, x-request-id: %s", response.status, response.headers.get("x-request-id")
+            )
+            try:
+                error_data = await response.json()
                 self.__logger.error(
-                    "Request error: %s, x-request-id: %s", response.status, response.headers.get("x-request-id")
+                    "Error details: %s, x-request-id: %s", error_data, response.headers.get("x-request-id")
                 )
-                try:
-                    error_data = await response.json()
-                    self.__logger.error(
-                        "Error details: %s, x-request-id: %s", error_data, response.headers.get("x-request-id")
-                    )
-                except (ValueError, aiohttp.ContentTypeError):
-                    self.__logger.error(
-                        "Error text: %s, x-request-id: %s", await response.text(), response.headers.get("x-request-id")
-                    )
-                return None
+            except (ValueError, aiohttp.ContentTypeError):
+                self.__logger.error(
+                    "Error text: %s, x-request-id: %s", await response.text(), response.headers.get("x-request-id")
+                )
+            return None
 
     async def get_statistics_for_a_day(self, date: Optional[str] = None, user_id: Optional[int] = -1) -> Optional[dict]:
         """
@@ -508,6 +1259,156 @@ class ABLTApi:
                         return usage_info
         return None
 
+    async def get_statistics_for_days(
+        self,
+        dates: Iterable[str],
+        user_id: Optional[int] = -1,
+        user_ids: Optional[Iterable[int]] = None,
+        max_gap_days: int = 31,
+    ) -> Optional[dict]:
+        """
+        Retrieves usage statistics for many days (of one or many users) by as few requests as possible.
+
+        Days are merged into covering ranges (days with at most `max_gap_days` days between them share a range), and
+        each range is requested once per user (at most `statistics_concurrency` requests in flight).
+
+        :param dates: days for which statistics are needed. They should be in format YYYY-MM-DD.
+        :type dates: Iterable[str]
+        :param user_id: The id of the user to get statistics for.
+        :type user_id: int
+        :param user_ids: The ids of the users to get statistics for, user_id is ignored if they are given.
+        :type user_ids: Iterable[int]
+        :param max_gap_days: max count of not needed days between days requested together.
+        :type max_gap_days: int
+        :return: dict with statistics (StatisticItemSchema) by day (YYYY-MM-DD), None for days without statistics
+                 (days of failed chunks are missing), or dict of such dicts by user id if user_ids are given, or None
+                 in case of an error.
+        :rtype: dict | None
+        """
+        users = list(user_ids) if user_ids is not None else [user_id]
+        if not all(isinstance(user, int) for user in users):
+            self.__logger.error("Error: user_id should be int")
+            return None
+        try:
+            days = sorted({datetime.strptime(day, "%Y-%m-%d").date() for day in dates})
+        except (TypeError, ValueError):
+            self.__logger.error("Error: dates should be in format YYYY-MM-DD")
+            return None
+        statistics_requests = [
+            {"user_id": user, "start_date": start_date.isoformat(), "end_date": end_date.isoformat()}
+            for user in users
+            for start_date, end_date in get_covering_ranges(days, max_gap_days)
+        ]
+        statistics: dict[int, dict[str, Optional[dict]]] = {
+            user: dict.fromkeys(day.isoformat() for day in days) for user in users
+        }
+        error: Optional[Exception] = None
+        async for result in iter_bounded(
+            lambda request: self.get_usage_statistics(**request),
+            statistics_requests,
+            self.__statistics_concurrency,
+            result_type=BatchResult,
+        ):
+            if result.error is not None:
+                error = error or result.error
+            elif result.response is not None:
+                user_statistics = statistics[result.request["user_id"]]
+                for usage_info in result.response.get("items", []):
+                    if usage_info.get("date") in user_statistics:
+                        user_statistics[usage_info["date"]] = usage_info
+                for failed_range in result.response.get("failed_ranges", []):
+                    # Days of failed chunks are unknown, so they aren't reported as days without statistics
+                    range_start, range_end = failed_range["start_date"], failed_range["end_date"]
+                    for day in [day for day in user_statistics if range_start <= day <= range_end]:
+                        del user_statistics[day]
+        if error is not None:
+            raise error
+        return statistics if user_ids is not None else statistics[user_id]
+
+    def iter_usage_statistics_many(
+        self,
+        user_ids: Iterable[int],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        concurrency: int = 10,
+        ordered: bool = False,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Retrieves usage statistics of many users with bounded concurrency (sharing the pooled session) and yields
+        results as they complete.
+
+        Error of a single user doesn't abort the batch, it's reported in its result (response is None and error is
+        set, or both are None if API has returned an error, which is logged).
+
+        :param user_ids: The ids of the users to get statistics for, consumed lazily.
+        :type user_ids: Iterable[int]
+        :param start_date: The start date for the statistics in format YYYY-MM-DD.
+        :type start_date: str
+        :param end_date: The end date for the statistics in format YYYY-MM-DD.
+        :type end_date: str
+        :param concurrency: max requests in flight.
+        :type concurrency: int
+        :param ordered: yield results in order of users instead of order of completion.
+        :type ordered: bool
+        :return: results (request is dict with user_id and dates, response is StatisticsSchema dict).
+        :rtype: AsyncIterator[BatchResult]
+        """
+        start_date = datetime.now().strftime("%Y-%m-%d") if start_date is None else start_date
+        end_date = datetime.now().strftime("%Y-%m-%d") if end_date is None else end_date
+        return iter_bounded(
+            lambda request: self.get_usage_statistics(**request),
+            ({"user_id": user_id, "start_date": start_date, "end_date": end_date} for user_id in user_ids),
+            concurrency,
+            ordered,
+            result_type=BatchResult,
+        )
+
+    async def get_usage_statistics_many(
+        self,
+        user_ids: Iterable[int],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        concurrency: int = 10,
+        as_frame: bool = False,
+    ) -> dict:
+        """
+        Retrieves usage statistics of many users with bounded concurrency and aggregates them.
+
+        :param user_ids: The ids of the users to get statistics for.
+        :type user_ids: Iterable[int]
+        :param start_date: The start date for the statistics in format YYYY-MM-DD.
+        :type start_date: str
+        :param end_date: The end date for the statistics in format YYYY-MM-DD.
+        :type end_date: str
+        :param concurrency: max requests in flight.
+        :type concurrency: int
+        :param as_frame: return statistics of users as StatisticsFrame (requires numpy) and their combined frame.
+        :type as_frame: bool
+        :return: dict with "total" (StatisticTotalSchema) of all users, "users" (statistics by user id) and "failed"
+                 (ids of users, whose statistics aren't received), and "frame" (rows of all users) if as_frame is set.
+        :rtype: dict
+        """
+        users: dict[int, Any] = {}
+        failed: list[int] = []
+        async for result in self.iter_usage_statistics_many(user_ids, start_date, end_date, concurrency):
+            user_id = result.request["user_id"]
+            if result.ok:
+                users[user_id] = result.response
+            else:
+                failed.append(user_id)
+                if result.error is not None:
+                    self.__logger.error("Error: statistics of user %s failed: %s", user_id, repr(result.error))
+        total = StatisticsCache.get_total([statistics["total"] for statistics in users.values()])
+        if not as_frame:
+            return {"total": total, "users": users, "failed": failed}
+        frames = {user_id: StatisticsFrame.from_statistics(statistics) for user_id, statistics in users.items()}
+        return {
+            "total": total,
+            "users": frames,
+            "failed": failed,
+            "frame": StatisticsFrame.concatenate(frames.values()),
+        }
+
     async def get_statistics_total(
         self, user_id: Optional[int] = -1, start_date: Optional[str] = None, end_date: Optional[str] = None
     ) -> Optional[dict]:
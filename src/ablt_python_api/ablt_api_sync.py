@@ -5,34 +5,71 @@ Author: Iliya Vereshchagin
 Copyright (c) 2023 aBLT.ai. All rights reserved.
 
 Created: 20.11.2023
-Last Modified: 20.11.2023
+Last Modified: 17.10.2026
 
 Description:
 This file contains an implementation of class for sync aBLT chat API.
 """
 
+# pylint: disable=C0302
+
+import hashlib
 import json
 import logging
+import sqlite3
+from contextlib import nullcontext
 from datetime import datetime
 from os import environ
-from time import sleep
-from typing import Optional
+from time import monotonic, sleep
+from threading import Event, Lock, Thread
+from typing import Any, Callable, ContextManager, Iterable, Iterator, Optional, Union
 
 import requests
+from urllib3.exceptions import ReadTimeoutError
 
-from .utils.exceptions import DoneException
-from .utils.logger_config import setup_logger
+from .transport import SyncTransport, get_sync_transport
+from .utils.bot_catalog import BotCatalog
+from .utils.batch import BatchResult, ChatResult, iter_bounded_threaded
+from .utils.circuit_breaker import CircuitBreaker
+from .utils.exceptions import ChatTimeoutError, CircuitOpenError, DoneException
+from .utils.rate_limiter import RateLimiter
+from .utils.response_cache import ResponseCache, SQLiteResponseCache
+from .utils.retry import RetryPolicy
+from .utils.scheduler import RequestScheduler
+from .utils.single_flight import SingleFlight
+from .utils.statistics_cache import StatisticsCache, get_covering_ranges, split_date_range
+from .utils.statistics_frame import StatisticsFrame
+from .utils.timeouts import ChatTimeout
 
 
-class ABLTApi:
+class ABLTApi:  # pylint: disable=R0902,R0904
     """aBLT Chat API master class"""
 
-    def __init__(
+    def __init__(  # pylint: disable=R0914,R0917
         self,
         bearer_token: Optional[str] = None,
         base_api_url: str = "https://api.ablt.ai",
         logger: Optional[logging.Logger] = None,
         ssl_verify: Optional[bool] = True,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        transport: Optional[SyncTransport] = None,
+        shared_transport: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        chat_timeout: Optional[ChatTimeout] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        coalesce_requests: bool = True,
+        bots_ttl: float = 300.0,
+        bots_hard_ttl: Optional[float] = 3600.0,
+        bots_cache_path: Optional[str] = None,
+        response_cache: Optional[Union[ResponseCache, SQLiteResponseCache]] = None,
+        statistics_cache: Optional[StatisticsCache] = None,
+        statistics_chunk_days: Optional[int] = None,
+        statistics_concurrency: int = 4,
+        statistics_chunk_retries: int = 1,
     ):
         """
         Initializes the object with the provided base API URL and bearer token.
@@ -45,6 +82,52 @@ class ABLTApi:
         :type logger: logger
         :param ssl_verify: ssl verification enabled or not.
         :type ssl_verify: bool
+        :param pool_connections: number of connection pools (hosts) to cache.
+        :type pool_connections: int
+        :param pool_maxsize: maximum number of connections to keep in each pool.
+        :type pool_maxsize: int
+        :param pool_block: whether to block (instead of opening extra connections) when the pool is exhausted.
+        :type pool_block: bool
+        :param transport: transport (connection pool) to use, it's not closed by this instance.
+        :type transport: SyncTransport
+        :param shared_transport: use process-wide transport for base API URL, shared with other instances.
+        :type shared_transport: bool
+        :param retry_policy: retry policy for transient failures, default is RetryPolicy().
+        :type retry_policy: RetryPolicy
+        :param chat_timeout: default chat timeouts (connect, first chunk, idle, total), may be overridden per call.
+        :type chat_timeout: ChatTimeout
+        :param circuit_breaker: circuit breaker to fail fast while API is degraded, None means no circuit breaker.
+        :type circuit_breaker: CircuitBreaker
+        :param rate_limiter: client-side rate limiter to pace requests, None means no rate limiting.
+        :type rate_limiter: RateLimiter
+        :param scheduler: scheduler of chat requests by priority classes and users, None means no scheduling.
+        :type scheduler: RequestScheduler
+        :param coalesce_requests: share one request (and its result) between concurrent identical calls of
+                                  health_check, get_bots and get_usage_statistics.
+        :type coalesce_requests: bool
+        :param bots_ttl: time (in seconds) after which bot catalog used by find_bot_by_* methods is refreshed in
+                         background, while stale one is served.
+        :type bots_ttl: float
+        :param bots_hard_ttl: time (in seconds) after which stale bot catalog isn't served and lookups wait for refresh,
+                              None means stale catalog is always served.
+        :type bots_hard_ttl: float
+        :param bots_cache_path: path to cache file of bot catalog, shared by processes and loaded on start (so cold
+                                start doesn't wait for bot list), None means bot catalog is kept in memory only.
+        :type bots_cache_path: str
+        :param response_cache: cache of non-streaming chat responses (SQLiteResponseCache is shared by processes),
+                               None means no caching.
+        :type response_cache: ResponseCache | SQLiteResponseCache
+        :param statistics_cache: cache of usage statistics of closed days, so only missing days are requested,
+                                 None means no caching.
+        :type statistics_cache: StatisticsCache
+        :param statistics_chunk_days: max days in one request of usage statistics, longer ranges are split into
+                                      chunks requested concurrently, None means ranges aren't split.
+        :type statistics_chunk_days: int
+        :param statistics_concurrency: max requests of statistics chunks in flight.
+        :type statistics_concurrency: int
+        :param statistics_chunk_retries: how many times failed chunks of statistics (only them) are requested again,
+                                         with backoff of retry policy between passes.
+        :type statistics_chunk_retries: int
 
         Raises:
             TypeError: If the bearer token is not provided.
@@ -58,12 +141,64 @@ class ABLTApi:
         else:
             self.__bearer_token = bearer_token
         self.__ssl_verify = ssl_verify
-        if logger:
-            self.__logger = logger
+        self.__retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.__chat_timeout = chat_timeout if chat_timeout is not None else ChatTimeout()
+        self.__circuit_breaker = circuit_breaker
+        self.__rate_limiter = rate_limiter
+        self.__scheduler = scheduler
+        self.__response_cache = response_cache
+        self.__statistics_cache = statistics_cache
+        self.__statistics_chunk_days = statistics_chunk_days
+        self.__statistics_concurrency = statistics_concurrency
+        self.__statistics_chunk_retries = statistics_chunk_retries
+        self.__bot_catalog = BotCatalog(bots_ttl, bots_hard_ttl, bots_cache_path, self.__get_cache_key())
+        self.__bots_refresh_lock = Lock()
+        self.__bots_refresh_thread: Optional[Thread] = None
+        self.__single_flight = SingleFlight() if coalesce_requests else None
+        self.__transport_params = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+        }
+        self.__shared_transport = shared_transport and transport is None
+        self.__owns_transport = transport is None and not shared_transport
+        if transport is not None:
+            self.__transport = transport
+        elif shared_transport:
+            self.__transport = get_sync_transport(base_api_url, **self.__transport_params)
         else:
-            self.__logger = setup_logger("api", "api.log")
-            self.__logger.info("Logger for API now launched!")
-        self.update_api()
+            self.__transport = SyncTransport(**self.__transport_params)
+        self.__logger = logger if logger else self.__transport.logger
+        # Transport shared with other instances may be already checked
+        if not self.__transport.healthy:
+            self.update_api()
+
+    def __enter__(self):
+        """
+        Enters the context manager.
+
+        :return: ABLTApi instance.
+        :rtype: ABLTApi
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exits the context manager and closes the pooled session."""
+        self.close()
+
+    def close(self) -> None:
+        """Closes the pooled session and all its connections, shared transports are left untouched."""
+        if self.__owns_transport:
+            self.__transport.close()
+
+    def get_transport(self) -> SyncTransport:
+        """
+        Returns the transport (connection pool) used by this instance.
+
+        :return: transport.
+        :rtype: SyncTransport
+        """
+        return self.__transport
 
     def get_base_api_url(self) -> str:
         """
@@ -106,19 +241,219 @@ class ABLTApi:
         headers = {"Authorization": f"Bearer {self.__bearer_token}"}
         return url, headers
 
+    @staticmethod
+    def __iter_lines(response: requests.Response, timeout: Optional[ChatTimeout], started: float) -> Iterator[bytes]:
+        """
+        Yields lines of the streaming response, enforcing first chunk, idle and total timeouts.
+
+        :param response: streaming response.
+        :type response: requests.Response
+        :param timeout: chat timeouts, None means no timeouts.
+        :type timeout: ChatTimeout
+        :param started: monotonic time when the chat call was started.
+        :type started: float
+        :return: lines of the response.
+        :rtype: Iterator[bytes]
+
+        Raises:
+            ChatTimeoutError: If timeout is exceeded.
+        """
+        lines = response.iter_lines()
+        phase, phase_started = "first_chunk", started
+        while True:
+            wait_phase = phase
+            if timeout is not None:
+                wait, wait_phase = timeout.get_wait(started, phase_started, phase)
+                if wait is not None and wait <= 0:
+                    raise ChatTimeoutError(wait_phase, getattr(timeout, wait_phase))
+                # Socket read timeout is adjusted before each read to the phase in progress
+                sock = getattr(getattr(response.raw, "connection", None), "sock", None)
+                if sock is not None:
+                    sock.settimeout(wait)
+            try:
+                line = next(lines)
+            except StopIteration:
+                return
+            except requests.exceptions.ConnectionError as error:
+                if timeout is not None and error.args and isinstance(error.args[0], ReadTimeoutError):
+                    raise ChatTimeoutError(wait_phase, getattr(timeout, wait_phase)) from error
+                raise
+            if line:
+                phase, phase_started = "idle", monotonic()
+            yield line
+
+    def __check_circuit(self, endpoint: str) -> None:
+        """
+        Checks circuit breaker before request to endpoint, probes recovery with health check when it's time.
+
+        :param endpoint: The endpoint for the API request.
+        :type endpoint: str
+
+        Raises:
+            CircuitOpenError: If the circuit of endpoint is open or recovery probe has failed.
+        """
+        if self.__circuit_breaker is None or not self.__circuit_breaker.acquire(endpoint):
+            return
+        try:
+            healthy = self.health_check()
+        except requests.exceptions.RequestException:
+            healthy = False
+        if not healthy:
+            self.__circuit_breaker.record_failure(endpoint)
+            raise CircuitOpenError(endpoint, self.__circuit_breaker.recovery_timeout)
+
+    def __record_outcome(self, endpoint: str, status: Optional[int] = None) -> None:
+        """
+        Records outcome of request to endpoint in circuit breaker.
+
+        :param endpoint: The endpoint for the API request.
+        :type endpoint: str
+        :param status: HTTP status of the response, None if request has failed without response.
+        :type status: int
+        """
+        if self.__circuit_breaker is None:
+            return
+        if status is None or self.__circuit_breaker.is_failure_status(status):
+            self.__circuit_breaker.record_failure(endpoint)
+        else:
+            self.__circuit_breaker.record_success(endpoint)
+
+    def __schedule(self, priority: Optional[str] = None, user_id: Optional[int] = None) -> ContextManager:
+        """
+        Takes a slot of scheduler (if any) for the request.
+
+        :param priority: name of priority class of the request for scheduler.
+        :type priority: str
+        :param user_id: user identifier for fair queuing of scheduler.
+        :type user_id: int
+        :return: context manager, which holds the slot.
+        :rtype: ContextManager
+        """
+        if self.__scheduler is None:
+            return nullcontext()
+        return self.__scheduler.slot(priority, user_id)
+
+    def __coalesce(self, endpoint: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Calls request function, sharing it with concurrent identical calls (if coalescing is enabled).
+
+        :param endpoint: The endpoint for the API request.
+        :type endpoint: str
+        :param func: request function.
+        :type func: Callable
+        :param args: arguments of the request function.
+        :type args: Any
+        :return: result of the request function.
+        :rtype: Any
+        """
+        if self.__single_flight is None:
+            return func(*args)
+        key = (self.__base_api_url, self.__bearer_token, endpoint, *args)
+        return self.__single_flight.do(key, func, *args)
+
+    def __request(  # pylint: disable=R0914
+        self,
+        method: str,
+        endpoint: str,
+        streaming: bool = False,
+        timeout: Optional[ChatTimeout] = None,
+        cost: Optional[int] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Sends an API request, retries transient failures according to retry policy and returns the final response.
+
+        :param method: HTTP method.
+        :type method: str
+        :param endpoint: The endpoint for the API request.
+        :type endpoint: str
+        :param streaming: whether request is streaming one.
+        :type streaming: bool
+        :param timeout: timeouts for connect and response headers (first chunk or total), None means no timeouts.
+        :type timeout: ChatTimeout
+        :param cost: cost of the request for weighted rate limiter (e.g. 'max_words').
+        :type cost: int
+        :param kwargs: other params for requests.
+        :return: The final response.
+        :rtype: requests.Response
+
+        Raises:
+            ChatTimeoutError: If connect or first chunk (total) timeout is exceeded.
+            CircuitOpenError: If the circuit of endpoint is open.
+        """
+        url, headers = self.__get_url_and_headers(endpoint)
+        headers.update(kwargs.pop("headers", {}))
+        retryable = self.__retry_policy.is_retryable(endpoint, streaming)
+        started = monotonic()
+        attempt = 0
+        while True:
+            self.__check_circuit(endpoint)
+            if self.__rate_limiter is not None:
+                self.__rate_limiter.acquire(self.__bearer_token, endpoint, cost)
+            phase = ""
+            if timeout is not None:
+                wait, phase = timeout.get_wait(started, started, "first_chunk")
+                kwargs["timeout"] = (timeout.connect, max(wait, 0.001) if wait is not None else None)
+            try:
+                response = self.__transport.session.request(
+                    method, url, headers=headers, verify=self.__ssl_verify, **kwargs
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as error:
+                self.__record_outcome(endpoint)
+                delay = self.__retry_policy.get_delay(attempt)
+                if (
+                    not retryable
+                    or not self.__retry_policy.can_retry(attempt, monotonic() - started, delay)
+                    or (timeout is not None and not timeout.can_retry(started, delay))
+                ):
+                    if timeout is not None and isinstance(error, requests.exceptions.Timeout):
+                        phase = "connect" if isinstance(error, requests.exceptions.ConnectTimeout) else phase
+                        raise ChatTimeoutError(phase, getattr(timeout, phase)) from error
+                    raise
+                reason = repr(error)
+            else:
+                self.__record_outcome(endpoint, response.status_code)
+                if not retryable or not self.__retry_policy.is_retryable_status(response.status_code):
+                    return response
+                delay = self.__retry_policy.get_delay(attempt, response.headers.get("Retry-After"))
+                if not self.__retry_policy.can_retry(attempt, monotonic() - started, delay) or (
+                    timeout is not None and not timeout.can_retry(started, delay)
+                ):
+                    return response
+                reason = f"{response.status_code}, x-request-id: {response.headers.get('x-request-id')}"
+                response.close()
+            attempt += 1
+            self.__logger.warning(
+                "WARNING: Request to %s failed (%s), retry %s/%s in %.2f s",
+                endpoint,
+                reason,
+                attempt,
+                self.__retry_policy.max_retries,
+                delay,
+            )
+            sleep(delay)
+
     def health_check(self) -> bool:
         """
         Performs a health check on the API.
 
+        Concurrent calls share one request (unless coalescing is disabled).
+
+        :return: True if the API status is 'ok', False otherwise.
+        :rtype: bool
+        """
+        return self.__coalesce("health-check", self.__health_check)
+
+    def __health_check(self) -> bool:
+        """
+        Requests health check of the API.
+
         :return: True if the API status is 'ok', False otherwise.
         :rtype: bool
         """
-        url, headers = self.__get_url_and_headers("health-check")
         response = None
         try:
-            session = requests.session()
-            session.verify = self.__ssl_verify
-            response = session.get(url, headers=headers, verify=self.__ssl_verify)
+            response = self.__request("GET", "health-check")
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             if response:
@@ -156,15 +491,24 @@ class ABLTApi:
         """
         Retrieves all published bots.
 
+        Concurrent calls share one request and its result (unless coalescing is disabled), so don't modify it.
+
         :return: A list of dictionaries containing bot information (BotSchema), or an empty list if an error occurs.
         :rtype: list[dict]
         """
-        url, headers = self.__get_url_and_headers("v1/bots")
+        bots = self.__coalesce("v1/bots", self.__get_bots)
+        return bots if bots is not None else []
+
+    def __get_bots(self) -> Optional[list[dict]]:
+        """
+        Requests all published bots.
+
+        :return: A list of dictionaries containing bot information (BotSchema), or None if an error occurs.
+        :rtype: list[dict] | None
+        """
         response = None
         try:
-            session = requests.session()
-            session.verify = self.__ssl_verify
-            response = session.get(url, headers=headers, verify=self.__ssl_verify)
+            response = self.__request("GET", "v1/bots", headers=self.__bot_catalog.get_validators())
             response.raise_for_status()
         except requests.exceptions.HTTPError as err:
             if response:
@@ -173,10 +517,17 @@ class ABLTApi:
                     err,
                     response.headers.get("x-request-id"),
                 )
-            return []
-        return response.json()
+            return None
+        if response.status_code == 304:
+            self.__bot_catalog.touch()
+            self.__save_bot_catalog()
+            return self.__bot_catalog.get_bots()
+        bots = response.json()
+        self.__bot_catalog.update(bots, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        self.__save_bot_catalog()
+        return bots
 
-    # pylint: disable=R0914,R0912,R0915,R1702
+    # pylint: disable=R0914,R0912,R0915,R0917,R1702
     def chat(
         self,
         bot_uid: Optional[str] = None,
@@ -189,6 +540,9 @@ class ABLTApi:
         assumptions: Optional[dict] = None,
         max_words: Optional[int] = None,
         use_search: Optional[bool] = False,
+        timeout: Optional[ChatTimeout] = None,
+        priority: Optional[str] = None,
+        bypass_cache: bool = False,
     ):
         """
         Sends a chat request to the API and returns the response.
@@ -214,9 +568,17 @@ class ABLTApi:
         :type max_words: int
         :param use_search: A flag for using search mode (default is False).
         :type use_search: bool
+        :param timeout: chat timeouts for this call, if None, the default ones of API instance are used.
+        :type timeout: ChatTimeout
+        :param priority: priority class of the request for scheduler, if None, the default class is used.
+        :type priority: str
+        :param bypass_cache: don't use response cache for this call (neither read nor update it).
+        :type bypass_cache: bool
         :return: The response message from the bot or None in case of an error.
         :rtype: yield
         :raises DoneException: If the bot is done with the conversation.
+        :raises ChatTimeoutError: If one of chat timeouts is exceeded.
+        :raises CircuitOpenError: If the circuit of chat endpoint is open.
 
         Important: Only one of the parameters 'prompt' or 'messages' should be provided.
                    Only one of the parameters 'bot_uid' or 'bot_slug' should be provided.
@@ -229,6 +591,8 @@ class ABLTApi:
 
         Raises:
             DoneException: If the bot is done with the conversation.
+            ChatTimeoutError: If one of chat timeouts is exceeded.
+            CircuitOpenError: If the circuit of chat endpoint is open.
         """
         if (prompt is None and messages is None) or (prompt is not None and messages is not None):
             self.__logger.error("Error: Only one param is required ('prompt' or 'messages')")
@@ -238,7 +602,6 @@ class ABLTApi:
             self.__logger.error("Error: Only one param is required ('bot_slug' or 'bot_uid')")
             return
 
-        url, headers = self.__get_url_and_headers("v1/chat")
         payload = {
             "stream": stream,
             **({"bot_slug": bot_slug} if bot_slug is not None else {}),
@@ -251,68 +614,147 @@ class ABLTApi:
             **({"user_id": user_id} if user_id is not None else {}),
             **({"use_search": use_search} if use_search is not None else {}),
         }
+        cache_key = None
+        if self.__response_cache is not None and not stream and not bypass_cache:
+            cache_key = self.__response_cache.get_key(payload, self.__get_cache_key())
+            cached_message = self.__get_cached_response(cache_key)
+            if cached_message is not None:
+                yield cached_message
+                return
 
-        session = requests.session()
-        session.verify = self.__ssl_verify
-        response = session.post(url, headers=headers, json=payload, verify=self.__ssl_verify)
-        if response.status_code == 200:
-            if stream:
-                for line in response.iter_lines():
-                    if line:
-                        line_data = line.decode("utf-8").splitlines()
-                        for data in line_data:
-                            if data.startswith("data:"):
-                                if "[DONE]" in data:
-                                    raise DoneException
-                                data = data[5:].strip()
-                                try:
-                                    message_data = json.loads(data)
-                                except json.JSONDecodeError:
-                                    self.__logger.error("Seems json malformed %s", line)
-                                    continue
-                                content = message_data.get("content")
-                                message = message_data.get("message")
-                                if content is not None:
-                                    yield content
-                                elif message is not None:
-                                    yield message
-            else:
-                response_json = response.json()
-
-                if "message" in response_json:
-                    message = response_json.get("message")
-                elif "content" in response_json:
-                    message = response_json.get("content")
+        timeout = timeout if timeout is not None else self.__chat_timeout
+        timeout = timeout if timeout.is_set() else None
+        started = monotonic()
+        # Slot is released when the chat is consumed or closed
+        with self.__schedule(priority, user_id):
+            response = self.__request(
+                "POST",
+                "v1/chat",
+                streaming=bool(stream),
+                timeout=timeout,
+                cost=max_words,
+                stream=bool(stream),
+                json=payload,
+            )
+            if response.status_code == 200:
+                if stream:
+                    try:
+                        for line in self.__iter_lines(response, timeout, started):
+                            if line:
+                                line_data = line.decode("utf-8").splitlines()
+                                for data in line_data:
+                                    if data.startswith("data:"):
+                                        if "[DONE]" in data:
+                                            raise DoneException
+                                        data = data[5:].strip()
+                                        try:
+                                            message_data = json.loads(data)
+                                        except json.JSONDecodeError:
+                                            self.__logger.error("Seems json malformed %s", line)
+                                            continue
+                                        content = message_data.get("content")
+                                        message = message_data.get("message")
+                                        if content is not None:
+                                            yield content
+                                        elif message is not None:
+                                            yield message
+                    finally:
+                        response.close()
                 else:
+                    response_json = response.json()
+
+                    if "message" in response_json:
+                        message = response_json.get("message")
+                    elif "content" in response_json:
+                        message = response_json.get("content")
+                    else:
+                        self.__logger.error(
+                            "Response malformed! Actual response is: %s, x-request-id: %s",
+                            response_json,
+                            response.headers.get("x-request-id"),
+                        )
+                        return
+                    if cache_key is not None and isinstance(message, str):
+                        self.__cache_response(cache_key, message)
+                    yield message
+            else:
+                self.__logger.error("Error: %s", response.status_code)
+                try:
+                    error_data = response.json()
+                    self.__logger.error("Error details:")
+                    if isinstance(error_data["detail"], str):
+                        self.__logger.error("  - %s", error_data["detail"])
+                    else:
+                        for error in error_data["detail"]:
+                            if error.get("msg") and error.get("type") and error.get("loc"):
+                                self.__logger.error(
+                                    "  - %s (type: %s, location: %s)", error["msg"], error["type"], error["loc"]
+                                )
+                            else:
+                                self.__logger.error("  - %s", error)
+                    self.__logger.error("  - x-request-id: %s", response.headers.get("x-request-id"))
+                except (ValueError, json.JSONDecodeError):
+                    error_text = response.text
                     self.__logger.error(
-                        "Response malformed! Actual response is: %s, x-request-id: %s",
-                        response_json,
-                        response.headers.get("x-request-id"),
+                        "Error text: %s, x-request-id: %s", error_text, response.headers.get("x-request-id")
                     )
-                    return
-                yield message
-        else:
-            self.__logger.error("Error: %s", response.status_code)
-            try:
-                error_data = response.json()
-                self.__logger.error("Error details:")
-                if isinstance(error_data["detail"], str):
-                    self.__logger.error("  - %s", error_data["detail"])
-                else:
-                    for error in error_data["detail"]:
-                        if error.get("msg") and error.get("type") and error.get("loc"):
-                            self.__logger.error(
-                                "  - %s (type: %s, location: %s)", error["msg"], error["type"], error["loc"]
-                            )
-                        else:
-                            self.__logger.error("  - %s", error)
-                self.__logger.error("  - x-request-id: %s", response.headers.get("x-request-id"))
-            except (ValueError, json.JSONDecodeError):
-                error_text = response.text
-                self.__logger.error(
-                    "Error text: %s, x-request-id: %s", error_text, response.headers.get("x-request-id")
-                )
-            return
+                return
+
+    def __collect_chat(self, request: dict, stop: Event) -> Optional[str]:
+        """
+        Sends a chat request and collects the full response.
+
+        :param request: chat params.
+        :type request: dict
+        :param stop: event to stop reading the stream early.
+        :type stop: Event
+        :return: The full response from the bot or None in case of an error (or if it was stopped).
+        :rtype: str | None
+        """
+        messages = []
+        chat = self.chat(**request)
+        try:
+            for message in chat:
+                if stop.is_set():
+                    return None
+                messages.append(message)
+        except DoneException:
+            pass
+        finally:
+            chat.close()
+        return "".join(messages) if messages else None
+
+    def chat_many(  # pylint: disable=W0621
+        self, requests: Iterable[dict], concurrency: int = 10, ordered: bool = False, priority: Optional[str] = None
+    ) -> Iterator[ChatResult]:
+        """
+        Sends many chat requests with bounded concurrency in thread pool (sharing the pooled session) and yields
+        results as they complete.
+
+        Error of a single request doesn't abort the batch, it's reported in its result (response is None and error is
+        set, or both are None if API has returned an error, which is logged). When iteration is stopped, pending
+        requests are cancelled and streaming requests in flight are stopped.
+
+        :param requests: chat params for each request, consumed lazily.
+        :type requests: Iterable[dict]
+        :param concurrency: max requests in flight, keep pool_maxsize not less than it to reuse all connections.
+        :type concurrency: int
+        :param ordered: yield results in order of requests instead of order of completion.
+        :type ordered: bool
+        :param priority: default priority class of requests for scheduler, if None, the lowest priority class of
+                         scheduler is used (so interactive chats go first).
+        :type priority: str
+        :return: results of requests.
+        :rtype: Iterator[ChatResult]
+        """
+        if priority is None and self.__scheduler is not None:
+            priority = self.__scheduler.lowest_class
+        return iter_bounded_threaded(
+            lambda request, stop: self.__collect_chat({"priority": priority, **request}, stop),
+            requests,
+            concurrency,
+            ordered,
+        )
 
     def update_api(self) -> None:
         """
@@ -330,6 +772,7 @@ class ABLTApi:
                 self.__logger.warning("WARNING: Seems something nasty happened with aBLT api, trying %s/10", retries)
                 sleep(5)
             else:
+                self.__transport.healthy = True
                 break
         if retries >= 10:
             raise ConnectionError("ERROR: Connection to aBLT API couldn't be established")
@@ -344,6 +787,9 @@ class ABLTApi:
         :type instant_update: bool
         """
         self.__base_api_url = new_base_api_url
+        self.__bot_catalog.reset(self.__get_cache_key())
+        if self.__shared_transport:
+            self.__transport = get_sync_transport(new_base_api_url, **self.__transport_params)
         if instant_update:
             self.update_api()
 
@@ -357,6 +803,7 @@ class ABLTApi:
         :type instant_update: bool
         """
         self.__bearer_token = new_bearer_token
+        self.__bot_catalog.reset(self.__get_cache_key())
         if instant_update:
             self.update_api()
 
@@ -386,10 +833,7 @@ class ABLTApi:
         :return: bot dict (BotSchema).
         :rtype: dict|None
         """
-        for bot_info in self.get_bots():
-            if bot_info.get("uid") == bot_uid:
-                return bot_info
-        return None
+        return self.__get_bot_catalog().get_by_uid(bot_uid)
 
     def find_bot_by_slug(self, bot_slug: str) -> Optional[dict]:
         """
@@ -400,10 +844,7 @@ class ABLTApi:
         :return: bot dict (BotSchema).
         :rtype: dict|None
         """
-        for bot_info in self.get_bots():
-            if bot_info.get("slug") == bot_slug:
-                return bot_info
-        return None
+        return self.__get_bot_catalog().get_by_slug(bot_slug)
 
     def find_bot_by_name(self, bot_name: str) -> Optional[dict]:
         """
@@ -414,40 +855,264 @@ class ABLTApi:
         :return: bot dict (BotSchema).
         :rtype: dict|None
         """
-        for bot_info in self.get_bots():
-            if bot_info.get("name") == bot_name:
-                return bot_info
-        return None
+        bots = self.find_bots_by_name(bot_name)
+        return bots[0] if bots else None
+
+    def find_bots_by_name(self, bot_name: str) -> list[dict]:
+        """
+        Searches for all bots with the name in the bot list (names are not unique).
+
+        :param bot_name: The name of the bots to search for.
+        :type bot_name: str
+        :return: list of bot dicts (BotSchema).
+        :rtype: list[dict]
+        """
+        return self.__get_bot_catalog().get_by_name(bot_name)
+
+    def refresh_bots(self) -> bool:
+        """
+        Downloads bot list and refreshes bot catalog used by find_bot_by_* methods.
+
+        :return: True if bot catalog is refreshed (or revalidated), False in case of an error.
+        :rtype: bool
+        """
+        return self.__coalesce("v1/bots", self.__get_bots) is not None
+
+    def __get_bot_catalog(self) -> BotCatalog:
+        """
+        Returns bot catalog: fresh one as is, stale one while it's refreshed in background, and waits for refresh
+        only if catalog isn't loaded or its hard TTL is expired (stale catalog is kept if refresh fails).
+
+        :return: bot catalog.
+        :rtype: BotCatalog
+        """
+        if not self.__bot_catalog.is_fresh():
+            if self.__bot_catalog.is_usable():
+                self.__refresh_bots_in_background()
+            else:
+                self.get_bots()
+        return self.__bot_catalog
+
+    def __get_cache_key(self) -> str:
+        """
+        Returns key of API in caches (hash of base API URL and bearer token).
+
+        :return: key of API.
+        :rtype: str
+        """
+        return hashlib.sha256(f"{self.__base_api_url}\n{self.__bearer_token}".encode("utf-8")).hexdigest()
+
+    def __get_cached_response(self, cache_key: str) -> Optional[str]:
+        """
+        Returns cached chat response, errors of shared cache are logged (as a miss).
+
+        :param cache_key: key of the request.
+        :type cache_key: str
+        :return: cached response or None.
+        :rtype: str | None
+        """
+        try:
+            return self.__response_cache.get(cache_key)
+        except sqlite3.Error as error:
+            self.__logger.warning("WARNING: Response cache isn't read: %s", error)
+            return None
+
+    def __cache_response(self, cache_key: str, message: str) -> None:
+        """
+        Caches chat response, errors of shared cache are logged.
+
+        :param cache_key: key of the request.
+        :type cache_key: str
+        :param message: full response of the bot.
+        :type message: str
+        """
+        try:
+            self.__response_cache.set(cache_key, message)
+        except sqlite3.Error as error:
+            self.__logger.warning("WARNING: Response cache isn't written: %s", error)
+
+    def __save_bot_catalog(self) -> None:
+        """Saves bot catalog to cache file (if any), errors are logged."""
+        try:
+            self.__bot_catalog.save()
+        except OSError as error:
+            self.__logger.warning("WARNING: Bot catalog isn't saved to %s: %s", self.__bot_catalog.path, error)
+
+    def __refresh_bots_in_background(self) -> None:
+        """Starts background refresh of bot catalog in daemon thread, unless it's already running."""
+        with self.__bots_refresh_lock:
+            if self.__bots_refresh_thread is None or not self.__bots_refresh_thread.is_alive():
+                self.__bots_refresh_thread = Thread(
+                    target=self.__refresh_bots_quietly, name="ablt-bots-refresh", daemon=True
+                )
+                self.__bots_refresh_thread.start()
+
+    def __refresh_bots_quietly(self) -> None:
+        """Refreshes bot catalog, errors are logged (stale catalog is kept)."""
+        try:
+            self.get_bots()
+        except (requests.exceptions.RequestException, CircuitOpenError) as error:
+            self.__logger.warning("WARNING: Background refresh of bots failed: %s", repr(error))
 
     def get_usage_statistics(
         self,
         user_id: Optional[int] = -1,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-    ) -> Optional[dict]:
+        as_frame: bool = False,
+    ) -> Optional[Union[dict, StatisticsFrame]]:
         """
         Retrieves usage statistics for the API.
 
+        Concurrent identical calls share one request and its result (unless coalescing is disabled), so don't modify it.
+
         :param user_id: The id of the user to get statistics for.
         :type user_id: int
         :param start_date: The start date for the statistics in format YYYY-MM-DD.
         :type start_date: str
         :param end_date: The end date for the statistics in format YYYY-MM-DD.
         :type end_date: str
+        :param as_frame: return columnar StatisticsFrame (requires numpy) instead of dict.
+        :type as_frame: bool
         :return: The response message from the bot (StatisticsSchema) or None in case of an error.
-        :rtype: dict|None
+        :rtype: dict|StatisticsFrame|None
         """
         if not isinstance(user_id, int):
             self.__logger.error("Error: user_id should be int")
             return None
         start_date = datetime.now().strftime("%Y-%m-%d") if start_date is None else start_date
         end_date = datetime.now().strftime("%Y-%m-%d") if end_date is None else end_date
-        url, headers = self.__get_url_and_headers("v1/user/usage-statistics")
-        payload = {"user_id": user_id, "start_date": start_date, "end_date": end_date}
+        if self.__statistics_cache is not None or self.__statistics_chunk_days is not None:
+            statistics = self.__get_merged_usage_statistics(user_id, start_date, end_date)
+        else:
+            statistics = self.__coalesce(
+                "v1/user/usage-statistics", self.__get_usage_statistics, user_id, start_date, end_date
+            )
+        return StatisticsFrame.from_statistics(statistics) if as_frame and statistics is not None else statistics
+
+    def __get_merged_usage_statistics(self, user_id: int, start_date: str, end_date: str) -> Optional[dict]:
+        """
+        Retrieves usage statistics by chunks (only days missing in statistics cache, if any) and merges them.
+
+        :param user_id: The id of the user to get statistics for.
+        :type user_id: int
+        :param start_date: The start date for the statistics in format YYYY-MM-DD.
+        :type start_date: str
+        :param end_date: The end date for the statistics in format YYYY-MM-DD.
+        :type end_date: str
+        :return: The response message from the bot (StatisticsSchema), with "failed_ranges" if some chunks have
+                 failed, or None in case of an error.
+        :rtype: dict|None
+        """
+        try:
+            start = datetime.strptime(start_date, "%Y-%m-%d").date()
+            end = datetime.strptime(end_date, "%Y-%m-%d").date()
+        except ValueError:
+            # Malformed dates are reported by the server
+            return self.__get_usage_statistics(user_id, start_date, end_date)
+        key = self.__get_cache_key()
+        if self.__statistics_cache is not None:
+            ranges = self.__statistics_cache.get_missing_ranges(key, user_id, start, end)
+            cached = self.__statistics_cache.get_items(key, user_id, start, end)
+            items = {day.isoformat(): item for day, item in cached.items()}
+        else:
+            ranges, items = [(start, end)], {}
+        chunks, failed = self.__fetch_usage_statistics(user_id, ranges)
+        if failed and not chunks and not items:
+            return None
+        for chunk, stats in chunks:
+            if self.__statistics_cache is not None:
+                self.__statistics_cache.update(key, user_id, chunk["start_date"], chunk["end_date"], stats["items"])
+            # Items without date can't be merged by day, so they are dropped
+            items.update(
+                {
+                    str(item["date"]): item
+                    for item in stats["items"]
+                    if isinstance(item, dict) and item.get("date") is not None
+                }
+            )
+        merged = [items[day] for day in sorted(items) if items[day] is not None]
+        statistics = {"total": StatisticsCache.get_total(merged), "items": merged}
+        if failed:
+            # Partial statistics are returned with sub-ranges, which couldn't be received
+            statistics["failed_ranges"] = [
+                {"start_date": chunk["start_date"].isoformat(), "end_date": chunk["end_date"].isoformat()}
+                for chunk in sorted(failed, key=lambda chunk: chunk["start_date"])
+            ]
+        return statistics
+
+    def __fetch_usage_statistics(self, user_id: int, ranges: list[tuple]) -> tuple[list[tuple], list[dict]]:
+        """
+        Requests usage statistics of date ranges split into chunks, which are requested concurrently. Failed chunks
+        (only them) are requested again up to `statistics_chunk_retries` times, with backoff of retry policy.
+
+        :param user_id: The id of the user to get statistics for.
+        :type user_id: int
+        :param ranges: list of (start date, end date) tuples.
+        :type ranges: list[tuple]
+        :return: list of (chunk, statistics) tuples of received chunks and list of failed chunks (errors are logged).
+        :rtype: tuple[list[tuple], list[dict]]
+        """
+        chunks = [
+            {"start_date": chunk_start, "end_date": chunk_end}
+            for range_start, range_end in ranges
+            for chunk_start, chunk_end in split_date_range(range_start, range_end, self.__statistics_chunk_days)
+        ]
+        fetched: list[tuple] = []
+        failed: list = []
+        for attempt in range(self.__statistics_chunk_retries + 1):
+            if attempt > 0:
+                self.__logger.warning(
+                    "WARNING: %s chunks of usage statistics failed, retrying them %s/%s",
+                    len(chunks),
+                    attempt,
+                    self.__statistics_chunk_retries,
+                )
+                sleep(self.__retry_policy.get_delay(attempt - 1))
+            failed = []
+            for result in iter_bounded_threaded(
+                lambda chunk, _: self.__coalesce(
+                    "v1/user/usage-statistics",
+                    self.__get_usage_statistics,
+                    user_id,
+                    chunk["start_date"].isoformat(),
+                    chunk["end_date"].isoformat(),
+                ),
+                chunks,
+                self.__statistics_concurrency,
+                result_type=BatchResult,
+            ):
+                if result.ok and isinstance(result.response, dict) and isinstance(result.response.get("items"), list):
+                    fetched.append((result.request, result.response))
+                else:
+                    failed.append(result)
+            if not failed:
+                break
+            chunks = [result.request for result in failed]
+        for result in failed:
+            self.__logger.error(
+                "Error: usage statistics from %s to %s failed: %s",
+                result.request["start_date"],
+                result.request["end_date"],
+                repr(result.error) if result.error is not None else "API error",
+            )
+        return fetched, [result.request for result in failed]
 
-        session = requests.session()
-        session.verify = self.__ssl_verify
-        response = session.post(url, json=payload, headers=headers, verify=self.__ssl_verify)
+    def __get_usage_statistics(self, user_id: int, start_date: str, end_date: str) -> Optional[dict]:
+        """
+        Requests usage statistics for the API.
+
+        :param user_id: The id of the user to get statistics for.
+        :type user_id: int
+        :param start_date: The start date for the statistics in format YYYY-MM-DD.
+        :type start_date: str
+        :param end_date: The end date for the statistics in format YYYY-MM-DD.
+        :type end_date: str
+        :return: The response message from the bot (StatisticsSchema) or None in case of an error.
+        :rtype: dict|None
+        """
+        payload = {"user_id": user_id, "start_date": start_date, "end_date": end_date}
+        response = self.__request("POST", "v1/user/usage-statistics", json=payload)
         if response.status_code == 200:
             return response.json()
         self.__logger.error(
@@ -484,6 +1149,156 @@ class ABLTApi:
                         return usage_info
         return None
 
+    def get_statistics_for_days(
+        self,
+        dates: Iterable[str],
+        user_id: Optional[int] = -1,
+        user_ids: Optional[Iterable[int]] = None,
+        max_gap_days: int = 31,
+    ) -> Optional[dict]:
+        """
+        Retrieves usage statistics for many days (of one or many users) by as few requests as possible.
+
+        Days are merged into covering ranges (days with at most `max_gap_days` days between them share a range), and
+        each range is requested once per user (at most `statistics_concurrency` requests in flight).
+
+        :param dates: days for which statistics are needed. They should be in format YYYY-MM-DD.
+        :type dates: Iterable[str]
+        :param user_id: The id of the user to get statistics for.
+        :type user_id: int
+        :param user_ids: The ids of the users to get statistics for, user_id is ignored if they are given.
+        :type user_ids: Iterable[int]
+        :param max_gap_days: max count of not needed days between days requested together.
+        :type max_gap_days: int
+        :return: dict with statistics (StatisticItemSchema) by day (YYYY-MM-DD), None for days without statistics
+                 (days of failed chunks are missing), or dict of such dicts by user id if user_ids are given, or None
+                 in case of an error.
+        :rtype: dict | None
+        """
+        users = list(user_ids) if user_ids is not None else [user_id]
+        if not all(isinstance(user, int) for user in users):
+            self.__logger.error("Error: user_id should be int")
+            return None
+        try:
+            days = sorted({datetime.strptime(day, "%Y-%m-%d").date() for day in dates})
+        except (TypeError, ValueError):
+            self.__logger.error("Error: dates should be in format YYYY-MM-DD")
+            return None
+        statistics_requests = [
+            {"user_id": user, "start_date": start_date.isoformat(), "end_date": end_date.isoformat()}
+            for user in users
+            for start_date, end_date in get_covering_ranges(days, max_gap_days)
+        ]
+        statistics: dict[int, dict[str, Optional[dict]]] = {
+            user: dict.fromkeys(day.isoformat() for day in days) for user in users
+        }
+        error: Optional[Exception] = None
+        for result in iter_bounded_threaded(
+            lambda request, _: self.get_usage_statistics(**request),
+            statistics_requests,
+            self.__statistics_concurrency,
+            result_type=BatchResult,
+        ):
+            if result.error is not None:
+                error = error or result.error
+            elif result.response is not None:
+                user_statistics = statistics[result.request["user_id"]]
+                for usage_info in result.response.get("items", []):
+                    if usage_info.get("date") in user_statistics:
+                        user_statistics[usage_info["date"]] = usage_info
+                for failed_range in result.response.get("failed_ranges", []):
+                    # Days of failed chunks are unknown, so they aren't reported as days without statistics
+                    range_start, range_end = failed_range["start_date"], failed_range["end_date"]
+                    for day in [day for day in user_statistics if range_start <= day <= range_end]:
+                        del user_statistics[day]
+        if error is not None:
+            raise error
+        return statistics if user_ids is not None else statistics[user_id]
+
+    def iter_usage_statistics_many(
+        self,
+        user_ids: Iterable[int],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        concurrency: int = 10,
+        ordered: bool = False,
+    ) -> Iterator[BatchResult]:
+        """
+        Retrieves usage statistics of many users with bounded concurrency in thread pool (sharing the pooled session)
+        and yields results as they complete.
+
+        Error of a single user doesn't abort the batch, it's reported in its result (response is None and error is
+        set, or both are None if API has returned an error, which is logged).
+
+        :param user_ids: The ids of the users to get statistics for, consumed lazily.
+        :type user_ids: Iterable[int]
+        :param start_date: The start date for the statistics in format YYYY-MM-DD.
+        :type start_date: str
+        :param end_date: The end date for the statistics in format YYYY-MM-DD.
+        :type end_date: str
+        :param concurrency: max requests in flight, keep pool_maxsize not less than it to reuse all connections.
+        :type concurrency: int
+        :param ordered: yield results in order of users instead of order of completion.
+        :type ordered: bool
+        :return: results (request is dict with user_id and dates, response is StatisticsSchema dict).
+        :rtype: Iterator[BatchResult]
+        """
+        start_date = datetime.now().strftime("%Y-%m-%d") if start_date is None else start_date
+        end_date = datetime.now().strftime("%Y-%m-%d") if end_date is None else end_date
+        return iter_bounded_threaded(
+            lambda request, _: self.get_usage_statistics(**request),
+            ({"user_id": user_id, "start_date": start_date, "end_date": end_date} for user_id in user_ids),
+            concurrency,
+            ordered,
+            result_type=BatchResult,
+        )
+
+    def get_usage_statistics_many(
+        self,
+        user_ids: Iterable[int],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        concurrency: int = 10,
+        as_frame: bool = False,
+    ) -> dict:
+        """
+        Retrieves usage statistics of many users with bounded concurrency and aggregates them.
+
+        :param user_ids: The ids of the users to get statistics for.
+        :type user_ids: Iterable[int]
+        :param start_date: The start date for the statistics in format YYYY-MM-DD.
+        :type start_date: str
+        :param end_date: The end date for the statistics in format YYYY-MM-DD.
+        :type end_date: str
+        :param concurrency: max requests in flight.
+        :type concurrency: int
+        :param as_frame: return statistics of users as StatisticsFrame (requires numpy) and their combined frame.
+        :type as_frame: bool
+        :return: dict with "total" (StatisticTotalSchema) of all users, "users" (statistics by user id) and "failed"
+                 (ids of users, whose statistics aren't received), and "frame" (rows of all users) if as_frame is set.
+        :rtype: dict
+        """
+        users: dict[int, Any] = {}
+        failed: list[int] = []
+        for result in self.iter_usage_statistics_many(user_ids, start_date, end_date, concurrency):
+            user_id = result.request["user_id"]
+            if result.ok:
+                users[user_id] = result.response
+            else:
+                failed.append(user_id)
+                if result.error is not None:
+                    self.__logger.error("Error: statistics of user %s failed: %s", user_id, repr(result.error))
+        total = StatisticsCache.get_total([statistics["total"] for statistics in users.values()])
+        if not as_frame:
+            return {"total": total, "users": users, "failed": failed}
+        frames = {user_id: StatisticsFrame.from_statistics(statistics) for user_id, statistics in users.items()}
+        return {
+            "total": total,
+            "users": frames,
+            "failed": failed,
+            "frame": StatisticsFrame.concatenate(frames.values()),
+        }
+
     def get_statistics_total(
         self, user_id: Optional[int] = -1, start_date: Optional[str] = None, end_date: Optional[str] = None
     ) -> Optional[dict]:
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: batch.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file contains multi-process batch runner, which sends chat requests from JSONL file and writes results to JSONL.
+
+Usage:
+    python -m ablt_python_api.batch requests.jsonl results.jsonl --workers 8 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from time import monotonic
+from typing import IO, Iterator, Optional
+
+from .ablt_api_async import ABLTApi
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """
+    Returns percentile of sorted values (nearest rank).
+
+    :param values: sorted values.
+    :type values: list[float]
+    :param percent: percent (0..100).
+    :type percent: float
+    :return: percentile or 0.0 for empty values.
+    :rtype: float
+    """
+    if not values:
+        return 0.0
+    rank = max(0, min(len(values) - 1, int(round(percent / 100 * len(values) + 0.5)) - 1))
+    return values[rank]
+
+
+def _write_record(output: IO, index: int, response: Optional[str], error: Optional[str], latency: float) -> bool:
+    """
+    Writes result of a single request as JSON line.
+
+    :param output: output file.
+    :type output: IO
+    :param index: line number of the request in input file.
+    :type index: int
+    :param response: full response of the bot.
+    :type response: str
+    :param error: error of the request.
+    :type error: str
+    :param latency: time (in seconds) spent on the request.
+    :type latency: float
+    :return: True if request has got response, otherwise False.
+    :rtype: bool
+    """
+    ok = error is None and response is not None
+    record = {
+        "index": index,
+        "ok": ok,
+        "response": response,
+        "error": error,
+        "latency": round(latency, 6),
+    }
+    output.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return ok
+
+
+async def _run_shard(input_path: str, part_path: str, worker: int, workers: int, params: dict) -> dict:
+    """
+    Sends requests of the shard (lines with number % workers == worker) and writes results to part file.
+
+    :param input_path: path to input JSONL file.
+    :type input_path: str
+    :param part_path: path to part file of the worker.
+    :type part_path: str
+    :param worker: index of the worker.
+    :type worker: int
+    :param workers: count of workers.
+    :type workers: int
+    :param params: runner params (bearer_token, base_api_url, concurrency, connector_limit).
+    :type params: dict
+    :return: stats of the shard (total, ok and latencies of requests).
+    :rtype: dict
+    """
+    stats: dict = {"total": 0, "ok": 0, "latencies": []}
+    # Maps index of request in the shard to line number in input file, holds only requests in flight
+    line_numbers: dict[int, int] = {}
+    with open(input_path, encoding="utf-8") as input_file, open(part_path, "w", encoding="utf-8") as output:
+
+        def read_shard() -> Iterator[dict]:
+            """
+            Yields chat params of the shard, invalid lines are reported without sending.
+
+            :return: chat params.
+            :rtype: Iterator[dict]
+            """
+            shard_index = 0
+            for line_number, line in enumerate(input_file):
+                if line_number % workers != worker or not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("Request must be JSON object")
+                except ValueError as error:
+                    stats["total"] += 1
+                    _write_record(output, line_number, None, repr(error), 0.0)
+                    continue
+                line_numbers[shard_index] = line_number
+                shard_index += 1
+                yield request
+
+        async with ABLTApi(
+            bearer_token=params["bearer_token"],
+            base_api_url=params["base_api_url"],
+            connector_limit=params["connector_limit"],
+        ) as api:
+            # Results are written in order of completion, so a stalled request doesn't hold results after it
+            async for result in api.chat_many(read_shard(), params["concurrency"]):
+                error = repr(result.error) if result.error is not None else None
+                if error is None and result.response is None:
+                    error = "API error (see API log)"
+                stats["total"] += 1
+                stats["ok"] += _write_record(
+                    output, line_numbers.pop(result.index), result.response, error, result.latency
+                )
+                stats["latencies"].append(result.latency)
+    return stats
+
+
+def _run_worker(input_path: str, part_path: str, worker: int, workers: int, params: dict) -> dict:
+    """
+    Runs shard in worker process with its own event loop and connection pool.
+
+    :param input_path: path to input JSONL file.
+    :type input_path: str
+    :param part_path: path to part file of the worker.
+    :type part_path: str
+    :param worker: index of the worker.
+    :type worker: int
+    :param workers: count of workers.
+    :type workers: int
+    :param params: runner params.
+    :type params: dict
+    :return: stats of the shard.
+    :rtype: dict
+    """
+    return asyncio.run(_run_shard(input_path, part_path, worker, workers, params))
+
+
+def _merge_parts(part_paths: list[str], output_path: str, ordered: bool) -> None:
+    """
+    Merges part files of workers into output file and removes them.
+
+    :param part_paths: paths to part files.
+    :type part_paths: list[str]
+    :param output_path: path to output JSONL file.
+    :type output_path: str
+    :param ordered: merge results in order of requests (lines of part files are in order of completion).
+    :type ordered: bool
+    """
+    with open(output_path, "wb") as output:
+        if ordered:
+            part_files = [open(part_path, "rb") for part_path in part_paths]  # pylint: disable=R1732
+            try:
+                # Only indexes and offsets of lines are kept in memory, lines are copied in order of indexes
+                positions = []
+                for part, part_file in enumerate(part_files):
+                    offset = 0
+                    for line in part_file:
+                        positions.append((json.loads(line)["index"], part, offset))
+                        offset += len(line)
+                positions.sort()
+                for _, part, offset in positions:
+                    part_files[part].seek(offset)
+                    output.write(part_files[part].readline())
+            finally:
+                for part_file in part_files:
+                    part_file.close()
+        else:
+            for part_path in part_paths:
+                with open(part_path, "rb") as part_file:
+                    shutil.copyfileobj(part_file, output)
+    for part_path in part_paths:
+        os.remove(part_path)
+
+
+def run_batch(  # pylint: disable=R0914,R0917
+    input_path: str,
+    output_path: str,
+    workers: Optional[int] = None,
+    concurrency: int = 20,
+    bearer_token: Optional[str] = None,
+    base_api_url: str = "https://api.ablt.ai",
+    connector_limit: int = 100,
+    ordered: bool = False,
+) -> dict:
+    """
+    Sends chat requests from JSONL file (one object with chat params per line) in worker processes and writes
+    results to JSONL file.
+
+    :param input_path: path to input JSONL file.
+    :type input_path: str
+    :param output_path: path to output JSONL file.
+    :type output_path: str
+    :param workers: count of worker processes, default is count of CPUs.
+    :type workers: int
+    :param concurrency: max requests in flight per worker.
+    :type concurrency: int
+    :param bearer_token: The bearer token for authentication, default is ABLT_BEARER_TOKEN environment variable.
+    :type bearer_token: str
+    :param base_api_url: The base API URL, default is 'https://api.ablt.ai'.
+    :type base_api_url: str
+    :param connector_limit: total number of simultaneous connections in the pool of each worker.
+    :type connector_limit: int
+    :param ordered: write results in order of requests instead of order of completion (they are sorted on merge of
+                    part files, so a stalled request doesn't hold back results of its worker).
+    :type ordered: bool
+    :return: summary (requests, ok, failed, elapsed, throughput and p50, p95, p99 latencies).
+    :rtype: dict
+
+    Raises:
+        TypeError: If the bearer token is not provided.
+    """
+    bearer_token = bearer_token if bearer_token else os.environ.get("ABLT_BEARER_TOKEN")
+    if not bearer_token:
+        raise TypeError("Bearer token is required!")
+    workers = workers if workers else os.cpu_count() or 1
+    params = {
+        "bearer_token": bearer_token,
+        "base_api_url": base_api_url,
+        "concurrency": concurrency,
+        "connector_limit": connector_limit,
+    }
+    part_paths = [f"{output_path}.part{worker}" for worker in range(workers)]
+    started = monotonic()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_run_worker, input_path, part_paths[worker], worker, workers, params)
+            for worker in range(workers)
+        ]
+        shards = [future.result() for future in futures]
+    elapsed = monotonic() - started
+    _merge_parts(part_paths, output_path, ordered)
+    total = sum(shard["total"] for shard in shards)
+    ok = sum(shard["ok"] for shard in shards)
+    latencies = sorted(latency for shard in shards for latency in shard["latencies"])
+    return {
+        "requests": total,
+        "ok": ok,
+        "failed": total - ok,
+        "elapsed": round(elapsed, 3),
+        "throughput": round(total / elapsed, 3) if elapsed else 0.0,
+        "latency_p50": round(_percentile(latencies, 50), 3),
+        "latency_p95": round(_percentile(latencies, 95), 3),
+        "latency_p99": round(_percentile(latencies, 99), 3),
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Entry point of batch runner.
+
+    :param argv: command line arguments, default is sys.argv.
+    :type argv: list[str]
+    :return: exit code.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(
+        prog="ablt-batch", description="Send aBLT chat requests from JSONL file in parallel worker processes."
+    )
+    parser.add_argument("input", help="input JSONL file, one object with chat params per line")
+    parser.add_argument("output", help="output JSONL file with results")
+    parser.add_argument("--workers", type=int, default=None, help="count of worker processes (default: CPUs)")
+    parser.add_argument("--concurrency", type=int, default=20, help="max requests in flight per worker")
+    parser.add_argument("--base-api-url", default="https://api.ablt.ai", help="base API URL")
+    parser.add_argument("--connector-limit", type=int, default=100, help="max connections per worker")
+    parser.add_argument("--ordered", action="store_true", help="write results in order of requests")
+    args = parser.parse_args(argv)
+    try:
+        summary = run_batch(
+            args.input,
+            args.output,
+            workers=args.workers,
+            concurrency=args.concurrency,
+            base_api_url=args.base_api_url,
+            connector_limit=args.connector_limit,
+            ordered=args.ordered,
+        )
+    except (TypeError, OSError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    print(
+        f"Requests: {summary['requests']} (ok: {summary['ok']}, failed: {summary['failed']}), "
+        f"elapsed: {summary['elapsed']} s, throughput: {summary['throughput']} req/s, "
+        f"latency p50/p95/p99: {summary['latency_p50']}/{summary['latency_p95']}/{summary['latency_p99']} s"
+    )
+    return 0 if summary["failed"] == 0 else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
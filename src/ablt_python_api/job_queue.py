@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: job_queue.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file contains durable (SQLite in WAL mode) queue of chat requests with checkpointed completion.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+from threading import Lock
+from time import time
+from typing import Any, Iterable, Iterator, Optional
+
+from .utils.batch import ChatResult
+
+PENDING = "pending"
+IN_FLIGHT = "in_flight"
+DONE = "done"
+FAILED = "failed"
+# Async drain claims jobs by batches of this many times its concurrency
+DRAIN_BATCH_FACTOR = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    request TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    response TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_until REAL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id);
+"""
+
+
+class ChatJobQueue:
+    """
+    This class is durable queue of chat requests, which survives crashes and restarts of batch jobs.
+
+    Each job is pending, in flight (claimed by a worker for lease timeout), done (response is stored) or failed
+    (after max attempts). Completion of each job is committed in its own transaction, so after restart only jobs,
+    which weren't completed, are sent again. Jobs are deduplicated by key, so re-adding the same requests is free.
+    """
+
+    def __init__(self, path: str, lease_timeout: float = 3600.0):
+        """
+        Opens (creates if needed) the queue.
+
+        :param path: path to SQLite database file.
+        :type path: str
+        :param lease_timeout: time (in seconds) after which in-flight job of dead worker may be claimed again.
+        :type lease_timeout: float
+        """
+        self.path = path
+        self.lease_timeout = lease_timeout
+        self.__lock = Lock()
+        self.__connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.execute("PRAGMA busy_timeout=30000")
+        self.__connection.executescript(_SCHEMA)
+
+    def __enter__(self):
+        """
+        Enters the context manager.
+
+        :return: ChatJobQueue instance.
+        :rtype: ChatJobQueue
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exits the context manager and closes the database."""
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database."""
+        with self.__lock:
+            self.__connection.close()
+
+    @staticmethod
+    def get_key(request: dict) -> str:
+        """
+        Returns default key of the request (hash of its canonical JSON).
+
+        :param request: chat params.
+        :type request: dict
+        :return: key of the request.
+        :rtype: str
+        """
+        return hashlib.sha256(json.dumps(request, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def add(self, request: dict, key: Optional[str] = None) -> bool:
+        """
+        Adds chat request to the queue, unless job with the same key is already there.
+
+        :param request: chat params.
+        :type request: dict
+        :param key: unique key of the job, default is hash of the request (use explicit keys for repeated requests).
+        :type key: str
+        :return: True if job is added, False if it's already in the queue.
+        :rtype: bool
+        """
+        return self.add_many([request], [key] if key is not None else None) == 1
+
+    def add_many(self, requests: Iterable[dict], keys: Optional[Iterable[str]] = None) -> int:
+        """
+        Adds chat requests to the queue in a single transaction, skipping ones already in the queue.
+
+        :param requests: chat params for each job.
+        :type requests: Iterable[dict]
+        :param keys: unique keys of jobs, default is hash of each request.
+        :type keys: Iterable[str]
+        :return: count of added jobs.
+        :rtype: int
+        """
+        requests = list(requests)
+        keys = list(keys) if keys is not None else [self.get_key(request) for request in requests]
+        now = time()
+        rows = [(key, json.dumps(request, ensure_ascii=False), now) for key, request in zip(keys, requests)]
+        with self.__lock:
+            before = self.__connection.total_changes
+            self.__connection.execute("BEGIN IMMEDIATE")
+            try:
+                self.__connection.executemany(
+                    "INSERT OR IGNORE INTO jobs (key, request, updated) VALUES (?, ?, ?)", rows
+                )
+            except BaseException:
+                self.__connection.execute("ROLLBACK")
+                raise
+            self.__connection.execute("COMMIT")
+            return self.__connection.total_changes - before
+
+    def claim(self, limit: int = 1) -> list[tuple[int, dict]]:
+        """
+        Atomically claims pending jobs (and in-flight jobs with expired lease) for processing.
+
+        :param limit: max count of jobs to claim.
+        :type limit: int
+        :return: list of (job id, chat params).
+        :rtype: list[tuple[int, dict]]
+        """
+        now = time()
+        with self.__lock:
+            self.__connection.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self.__connection.execute(
+                    "SELECT id, request FROM jobs WHERE status = ? OR (status = ? AND lease_until < ?) "
+                    "ORDER BY id LIMIT ?",
+                    (PENDING, IN_FLIGHT, now, limit),
+                ).fetchall()
+                self.__connection.executemany(
+                    "UPDATE jobs SET status = ?, lease_until = ?, updated = ? WHERE id = ?",
+                    [(IN_FLIGHT, now + self.lease_timeout, now, job_id) for job_id, _ in rows],
+                )
+            except BaseException:
+                self.__connection.execute("ROLLBACK")
+                raise
+            self.__connection.execute("COMMIT")
+        return [(job_id, json.loads(request)) for job_id, request in rows]
+
+    def complete(self, job_id: int, response: str) -> None:
+        """
+        Checkpoints completed job with its response.
+
+        :param job_id: job id.
+        :type job_id: int
+        :param response: full response of the bot.
+        :type response: str
+        """
+        with self.__lock:
+            self.__connection.execute(
+                "UPDATE jobs SET status = ?, response = ?, error = NULL, lease_until = NULL, updated = ? WHERE id = ?",
+                (DONE, response, time(), job_id),
+            )
+
+    def fail(self, job_id: int, error: str, max_attempts: int = 3) -> None:
+        """
+        Records failed attempt of job, job is returned to the queue until max attempts are reached.
+
+        :param job_id: job id.
+        :type job_id: int
+        :param error: error of the attempt.
+        :type error: str
+        :param max_attempts: max attempts of job.
+        :type max_attempts: int
+        """
+        with self.__lock:
+            self.__connection.execute(
+                "UPDATE jobs SET attempts = attempts + 1, error = ?, lease_until = NULL, updated = ?, "
+                "status = CASE WHEN attempts + 1 >= ? THEN ? ELSE ? END WHERE id = ?",
+                (error, time(), max_attempts, FAILED, PENDING, job_id),
+            )
+
+    def requeue_in_flight(self) -> int:
+        """
+        Returns all in-flight jobs to the queue (e.g. after crash), use it only if no other worker is running.
+
+        :return: count of returned jobs.
+        :rtype: int
+        """
+        with self.__lock:
+            cursor = self.__connection.execute(
+                "UPDATE jobs SET status = ?, lease_until = NULL, updated = ? WHERE status = ?",
+                (PENDING, time(), IN_FLIGHT),
+            )
+            return cursor.rowcount
+
+    def retry_failed(self) -> int:
+        """
+        Returns failed jobs to the queue and resets their attempts.
+
+        :return: count of returned jobs.
+        :rtype: int
+        """
+        with self.__lock:
+            cursor = self.__connection.execute(
+                "UPDATE jobs SET status = ?, attempts = 0, updated = ? WHERE status = ?", (PENDING, time(), FAILED)
+            )
+            return cursor.rowcount
+
+    def counts(self) -> dict[str, int]:
+        """
+        Returns count of jobs by status.
+
+        :return: count of jobs by status (pending, in_flight, done, failed).
+        :rtype: dict[str, int]
+        """
+        with self.__lock:
+            rows = self.__connection.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {PENDING: 0, IN_FLIGHT: 0, DONE: 0, FAILED: 0}
+        counts.update(rows)
+        return counts
+
+    def results(self, status: str = DONE) -> Iterator[dict]:
+        """
+        Yields jobs with given status.
+
+        :param status: status of jobs.
+        :type status: str
+        :return: jobs (id, key, request, status, response, error, attempts).
+        :rtype: Iterator[dict]
+        """
+        with self.__lock:
+            rows = self.__connection.execute(
+                "SELECT id, key, request, status, response, error, attempts FROM jobs WHERE status = ? ORDER BY id",
+                (status,),
+            ).fetchall()
+        for job_id, key, request, job_status, response, error, attempts in rows:
+            yield {
+                "id": job_id,
+                "key": key,
+                "request": json.loads(request),
+                "status": job_status,
+                "response": response,
+                "error": error,
+                "attempts": attempts,
+            }
+
+    def __claim_requests(self, job_ids: dict[int, int], batch_size: int) -> Iterator[dict]:
+        """
+        Claims jobs by batches and yields their chat params.
+
+        :param job_ids: mapping of index of request to job id, filled while requests are yielded.
+        :type job_ids: dict[int, int]
+        :param batch_size: count of jobs claimed at once.
+        :type batch_size: int
+        :return: chat params.
+        :rtype: Iterator[dict]
+        """
+        index = 0
+        while True:
+            jobs = self.claim(batch_size)
+            if not jobs:
+                return
+            for job_id, request in jobs:
+                job_ids[index] = job_id
+                index += 1
+                yield request
+
+    def __checkpoint(self, result: ChatResult, job_ids: dict[int, int], max_attempts: int) -> None:
+        """
+        Checkpoints result of the job.
+
+        :param result: result of the request.
+        :type result: ChatResult
+        :param job_ids: mapping of index of request to job id.
+        :type job_ids: dict[int, int]
+        :param max_attempts: max attempts of job.
+        :type max_attempts: int
+        """
+        job_id = job_ids.pop(result.index)
+        if result.ok:
+            self.complete(job_id, result.response)
+        else:
+            self.fail(job_id, repr(result.error) if result.error is not None else "API error", max_attempts)
+
+    def drain(
+        self, api: Any, concurrency: int = 10, max_attempts: int = 3, requeue_in_flight: bool = False
+    ) -> dict[str, int]:
+        """
+        Processes jobs with sync API until the queue is empty (failed attempts are retried up to max attempts).
+
+        :param api: sync API instance.
+        :type api: ablt_python_api.ABLTApi
+        :param concurrency: max requests in flight.
+        :type concurrency: int
+        :param max_attempts: max attempts of each job.
+        :type max_attempts: int
+        :param requeue_in_flight: return all in-flight jobs (of crashed run) to the queue first, use it only if no
+            other worker is running (otherwise in-flight jobs are claimed again when their lease expires).
+        :type requeue_in_flight: bool
+        :return: count of jobs by status.
+        :rtype: dict[str, int]
+        """
+        if requeue_in_flight:
+            self.requeue_in_flight()
+        processed = True
+        while processed:
+            processed = False
+            job_ids: dict[int, int] = {}
+            for result in api.chat_many(self.__claim_requests(job_ids, concurrency), concurrency):
+                self.__checkpoint(result, job_ids, max_attempts)
+                processed = True
+        return self.counts()
+
+    async def drain_async(
+        self, api: Any, concurrency: int = 10, max_attempts: int = 3, requeue_in_flight: bool = False
+    ) -> dict[str, int]:
+        """
+        Processes jobs with async API until the queue is empty (failed attempts are retried up to max attempts).
+
+        Jobs are claimed by batches and database calls run in threads, so the event loop isn't blocked by SQLite.
+
+        :param api: async API instance.
+        :type api: ablt_python_api.ABLTApi_async
+        :param concurrency: max requests in flight.
+        :type concurrency: int
+        :param max_attempts: max attempts of each job.
+        :type max_attempts: int
+        :param requeue_in_flight: return all in-flight jobs (of crashed run) to the queue first, use it only if no
+            other worker is running (otherwise in-flight jobs are claimed again when their lease expires).
+        :type requeue_in_flight: bool
+        :return: count of jobs by status.
+        :rtype: dict[str, int]
+        """
+        # Database calls block, so they run in threads to keep the event loop free
+        if requeue_in_flight:
+            await asyncio.to_thread(self.requeue_in_flight)
+        while True:
+            jobs = await asyncio.to_thread(self.claim, concurrency * DRAIN_BATCH_FACTOR)
+            if not jobs:
+                break
+            job_ids = {index: job_id for index, (job_id, _) in enumerate(jobs)}
+            async for result in api.chat_many([request for _, request in jobs], concurrency):
+                await asyncio.to_thread(self.__checkpoint, result, job_ids, max_attempts)
+        return await asyncio.to_thread(self.counts)
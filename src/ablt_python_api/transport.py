@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: transport.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file contains pooled transports (connection pools) for aBLT chat API and process-wide registry to share them.
+"""
+
+import asyncio
+import logging
+from threading import Lock
+from typing import Awaitable, Callable, Optional
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from .utils.logger_config import setup_logger
+
+
+class AsyncTransport:  # pylint: disable=R0902
+    """Pooled aiohttp transport, may be shared by many async ABLTApi instances (e.g. one per bearer token)."""
+
+    def __init__(
+        self,
+        connector_limit: int = 100,
+        connector_limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        dns_cache_ttl: Optional[int] = 10,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initializes the transport, session itself is created lazily on first use.
+
+        :param connector_limit: total number of simultaneous connections in the pool, 0 means unlimited.
+        :type connector_limit: int
+        :param connector_limit_per_host: number of simultaneous connections to the same host, 0 means unlimited.
+        :type connector_limit_per_host: int
+        :param keepalive_timeout: how long (in seconds) idle connections are kept alive in the pool.
+        :type keepalive_timeout: float
+        :param dns_cache_ttl: how long (in seconds) resolved DNS entries are cached, None means forever.
+        :type dns_cache_ttl: int
+        :param logger: default logger for API instances using this transport.
+        :type logger: logger
+        """
+        self.__connector_limit = connector_limit
+        self.__connector_limit_per_host = connector_limit_per_host
+        self.__keepalive_timeout = keepalive_timeout
+        self.__dns_cache_ttl = dns_cache_ttl
+        self.__logger = logger
+        # Session is bound to its event loop, so each loop (e.g. of each thread or asyncio.run) has its own one
+        self.__sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self.__sessions_lock = Lock()
+        self.__health_task: Optional[asyncio.Task] = None
+        self.healthy = False
+
+    @property
+    def logger(self) -> logging.Logger:
+        """
+        Returns default logger of the transport, creates it on first use.
+
+        :return: logger
+        :rtype: logging.Logger
+        """
+        if self.__logger is None:
+            self.__logger = setup_logger("api", "api.log")
+            self.__logger.info("Logger for API now launched!")
+        return self.__logger
+
+    def start_health_check(self, check: Callable[[], Awaitable[None]]) -> asyncio.Task:
+        """
+        Starts the health check in background, unless it's already running (then the running one is returned).
+
+        :param check: coroutine function, which raises an exception if API isn't healthy.
+        :type check: Callable
+        :return: health check task.
+        :rtype: asyncio.Task
+        """
+        loop = asyncio.get_running_loop()
+        task = self.__health_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(check())
+            # Failure is reported to awaiting callers, if nobody waits - it's just dropped
+            task.add_done_callback(lambda done_task: done_task.cancelled() or done_task.exception())
+            self.__health_task = task
+        return task
+
+    async def ensure_healthy(self, check: Callable[[], Awaitable[None]]) -> None:
+        """
+        Runs the health check once, concurrent callers wait for the same check.
+
+        :param check: coroutine function, which raises an exception if API isn't healthy.
+        :type check: Callable
+        """
+        if not self.healthy:
+            await asyncio.shield(self.start_health_check(check))
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the pooled client session of the running event loop, creates it on first use in the loop.
+
+        Sessions of closed event loops are closed (their connections are dropped) when a new session is created.
+
+        :return: pooled client session.
+        :rtype: aiohttp.ClientSession
+        """
+        loop = asyncio.get_running_loop()
+        with self.__sessions_lock:
+            session = self.__sessions.get(loop)
+            if session is not None and not session.closed:
+                return session
+            stale = [
+                (session_loop, self.__sessions.pop(session_loop))
+                for session_loop in list(self.__sessions)
+                if session_loop is loop or session_loop.is_closed()
+            ]
+            connector = aiohttp.TCPConnector(
+                limit=self.__connector_limit,
+                limit_per_host=self.__connector_limit_per_host,
+                keepalive_timeout=self.__keepalive_timeout,
+                ttl_dns_cache=self.__dns_cache_ttl,
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            self.__sessions[loop] = session
+        for session_loop, stale_session in stale:
+            self.__drop_session(session_loop, stale_session)
+        return session
+
+    @staticmethod
+    def __drop_session(loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession) -> None:
+        """
+        Closes session of another (or closed) event loop without awaiting it.
+
+        :param loop: event loop of the session.
+        :type loop: asyncio.AbstractEventLoop
+        :param session: session to close.
+        :type session: aiohttp.ClientSession
+        """
+        if session.closed:
+            return
+        if loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        # Loop can't run the close coroutine anymore, so connections are closed directly
+        if session.connector is not None:
+            session.connector._close()  # pylint: disable=W0212
+        session.detach()
+
+    async def aclose(self, current_loop_only: bool = False) -> None:
+        """
+        Closes pooled sessions of all event loops and all their connections.
+
+        :param current_loop_only: close only the session of the running event loop.
+        :type current_loop_only: bool
+        """
+        current_loop = asyncio.get_running_loop()
+        with self.__sessions_lock:
+            if current_loop_only:
+                session = self.__sessions.pop(current_loop, None)
+                sessions = [(current_loop, session)] if session is not None else []
+            else:
+                sessions = list(self.__sessions.items())
+                self.__sessions.clear()
+        for loop, session in sessions:
+            if session.closed:
+                continue
+            if loop is current_loop:
+                await session.close()
+            elif loop.is_running() and not loop.is_closed():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+            else:
+                self.__drop_session(loop, session)
+
+
+class SyncTransport:
+    """Pooled requests transport, may be shared by many sync ABLTApi instances (e.g. one per bearer token)."""
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initializes the transport with pooled session.
+
+        :param pool_connections: number of connection pools (hosts) to cache.
+        :type pool_connections: int
+        :param pool_maxsize: maximum number of connections to keep in each pool.
+        :type pool_maxsize: int
+        :param pool_block: whether to block (instead of opening extra connections) when the pool is exhausted.
+        :type pool_block: bool
+        :param logger: default logger for API instances using this transport.
+        :type logger: logger
+        """
+        self.__logger = logger
+        self.__session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self.__session.mount("http://", adapter)
+        self.__session.mount("https://", adapter)
+        self.healthy = False
+
+    @property
+    def logger(self) -> logging.Logger:
+        """
+        Returns default logger of the transport, creates it on first use.
+
+        :return: logger
+        :rtype: logging.Logger
+        """
+        if self.__logger is None:
+            self.__logger = setup_logger("api", "api.log")
+            self.__logger.info("Logger for API now launched!")
+        return self.__logger
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Returns the pooled session.
+
+        :return: pooled session.
+        :rtype: requests.Session
+        """
+        return self.__session
+
+    def close(self) -> None:
+        """Closes the pooled session and all its connections."""
+        self.__session.close()
+
+
+_registry_lock = Lock()
+_async_transports: dict[str, AsyncTransport] = {}
+_sync_transports: dict[str, SyncTransport] = {}
+
+
+def get_async_transport(base_api_url: str, **kwargs) -> AsyncTransport:
+    """
+    Returns process-wide async transport for the base API URL, creates it on first call.
+
+    Transport is shared by event loops, but its sessions aren't: each loop gets its own session, and sessions of closed
+    loops are dropped. Transport lives until it's closed with close_async_transport (or close_async_transports).
+
+    :param base_api_url: The base API URL.
+    :type base_api_url: str
+    :param kwargs: AsyncTransport params, used only when the transport is created.
+    :return: shared async transport.
+    :rtype: AsyncTransport
+    """
+    with _registry_lock:
+        if base_api_url not in _async_transports:
+            _async_transports[base_api_url] = AsyncTransport(**kwargs)
+        return _async_transports[base_api_url]
+
+
+def get_sync_transport(base_api_url: str, **kwargs) -> SyncTransport:
+    """
+    Returns process-wide sync transport for the base API URL, creates it on first call.
+
+    Transport lives until it's closed with close_sync_transport (or close_sync_transports).
+
+    :param base_api_url: The base API URL.
+    :type base_api_url: str
+    :param kwargs: SyncTransport params, used only when the transport is created.
+    :return: shared sync transport.
+    :rtype: SyncTransport
+    """
+    with _registry_lock:
+        if base_api_url not in _sync_transports:
+            _sync_transports[base_api_url] = SyncTransport(**kwargs)
+        return _sync_transports[base_api_url]
+
+
+async def close_async_transport(base_api_url: str) -> None:
+    """
+    Closes (sessions of all event loops) and forgets shared async transport of the base API URL.
+
+    :param base_api_url: The base API URL.
+    :type base_api_url: str
+    """
+    with _registry_lock:
+        transport = _async_transports.pop(base_api_url, None)
+    if transport is not None:
+        await transport.aclose()
+
+
+def close_sync_transport(base_api_url: str) -> None:
+    """
+    Closes and forgets shared sync transport of the base API URL.
+
+    :param base_api_url: The base API URL.
+    :type base_api_url: str
+    """
+    with _registry_lock:
+        transport = _sync_transports.pop(base_api_url, None)
+    if transport is not None:
+        transport.close()
+
+
+async def close_async_transports() -> None:
+    """Closes and forgets all shared async transports."""
+    with _registry_lock:
+        transports = list(_async_transports.values())
+        _async_transports.clear()
+    for transport in transports:
+        await transport.aclose()
+
+
+def close_sync_transports() -> None:
+    """Closes and forgets all shared sync transports."""
+    with _registry_lock:
+        transports = list(_sync_transports.values())
+        _sync_transports.clear()
+    for transport in transports:
+        transport.close()
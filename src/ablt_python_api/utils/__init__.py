@@ -5,11 +5,23 @@ Author: Iliya Vereshchagin
 Copyright (c) 2023 aBLT.ai. All rights reserved.
 
 Created: 03.11.2023
-Last Modified: 03.11.2023
+Last Modified: 17.10.2026
 
 Description:
 This file describes entry point for aBLT chat API.
 """
 
-from .exceptions import DoneException
+from .batch import BatchResult, ChatResult
+from .bot_catalog import BotCatalog
+from .circuit_breaker import CircuitBreaker
+from .concurrency import AdaptiveConcurrencyLimiter
+from .exceptions import ChatTimeoutError, CircuitOpenError, DoneException
 from .logger_config import setup_logger
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache, SQLiteResponseCache
+from .retry import RetryPolicy
+from .scheduler import PriorityClass, RequestScheduler
+from .single_flight import AsyncSingleFlight, SingleFlight
+from .statistics_cache import StatisticsCache
+from .statistics_frame import StatisticsFrame
+from .timeouts import ChatTimeout
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: batch.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file contains helpers to run many requests (e.g. chats) with bounded concurrency and per-item error isolation.
+"""
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from threading import Event
+from time import monotonic
+from typing import Any, AsyncIterator, Awaitable, Callable, Generic, Iterable, Iterator, Optional, Type, TypeVar
+
+T = TypeVar("T")
+
+
+class BatchResult(Generic[T]):
+    """This class describes result of a single request of the batch, response type depends on the request."""
+
+    def __init__(
+        self,
+        index: int,
+        request: dict,
+        response: Optional[T] = None,
+        error: Optional[BaseException] = None,
+        latency: float = 0.0,
+    ):
+        """
+        Init BatchResult class
+
+        :param index: index of the request in the batch.
+        :type index: int
+        :param request: params of the request.
+        :type request: dict
+        :param response: response of the request, None in case of an error.
+        :type response: T
+        :param error: exception raised by the request, None if there was no exception.
+        :type error: BaseException
+        :param latency: time (in seconds) spent on the request.
+        :type latency: float
+        """
+        self.index = index
+        self.request = request
+        self.response = response
+        self.error = error
+        self.latency = latency
+
+    @property
+    def ok(self) -> bool:
+        """
+        Checks whether the request has got response.
+
+        :return: True if response is received, otherwise False.
+        :rtype: bool
+        """
+        return self.error is None and self.response is not None
+
+    def __repr__(self) -> str:
+        """
+        Returns string representation of the result.
+
+        :return: string representation.
+        :rtype: str
+        """
+        return (
+            f"{type(self).__name__}(index={self.index}, ok={self.ok}, latency={self.latency:.3f}, error={self.error!r})"
+        )
+
+
+class ChatResult(BatchResult[str]):  # pylint: disable=R0903
+    """This class describes result of a single chat request of the batch (response is full response of the bot)."""
+
+
+async def iter_bounded(
+    func: Callable[[dict], Awaitable[Any]],
+    requests: Iterable[dict],
+    concurrency: int = 10,
+    ordered: bool = False,
+    result_type: Type[BatchResult] = ChatResult,
+) -> AsyncIterator[BatchResult]:
+    """
+    Runs func for each request with at most `concurrency` requests in flight and yields results as they complete
+    (or in order of requests).
+
+    Requests are consumed lazily, exceptions of func are reported in results instead of aborting the batch.
+    In ordered mode request is started only if it's less than `concurrency` requests ahead of the first unfinished
+    one, so a stalled request pauses the batch instead of buffering all results after it.
+    Closing (or cancelling) the iterator cancels all requests in flight.
+
+    :param func: coroutine function to run for each request.
+    :type func: Callable
+    :param requests: requests (e.g. chat params).
+    :type requests: Iterable[dict]
+    :param concurrency: max requests in flight.
+    :type concurrency: int
+    :param ordered: yield results in order of requests instead of order of completion.
+    :type ordered: bool
+    :param result_type: class of results.
+    :type result_type: Type[BatchResult]
+    :return: results of requests.
+    :rtype: AsyncIterator[BatchResult]
+
+    Raises:
+        ValueError: If concurrency isn't positive.
+    """
+    if concurrency <= 0:
+        raise ValueError("Concurrency must be positive!")
+    items = enumerate(requests)
+    # Bounded queue keeps workers from running far ahead of slow consumer
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+    window = asyncio.Condition()
+    next_index = 0
+
+    async def worker() -> None:
+        """Runs requests one by one until there are no more requests."""
+        try:
+            for index, request in items:
+                if ordered:
+                    async with window:
+                        await window.wait_for(lambda index=index: index < next_index + concurrency)
+                started = monotonic()
+                try:
+                    response, error = await func(request), None
+                except Exception as err:  # pylint: disable=W0718
+                    response, error = None, err
+                await results.put(result_type(index, request, response, error, monotonic() - started))
+        except Exception as err:  # pylint: disable=W0718
+            # Requests iterable itself has failed
+            await results.put(err)
+            return
+        await results.put(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    active = len(workers)
+    buffer: dict[int, BatchResult] = {}
+    try:
+        while active:
+            result = await results.get()
+            if result is None:
+                active -= 1
+                continue
+            if isinstance(result, Exception):
+                raise result
+            if not ordered:
+                yield result
+                continue
+            buffer[result.index] = result
+            while next_index in buffer:
+                result = buffer.pop(next_index)
+                next_index += 1
+                async with window:
+                    window.notify_all()
+                yield result
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def iter_bounded_threaded(  # pylint: disable=R0914
+    func: Callable[[dict, Event], Any],
+    requests: Iterable[dict],
+    concurrency: int = 10,
+    ordered: bool = False,
+    result_type: Type[BatchResult] = ChatResult,
+) -> Iterator[BatchResult]:
+    """
+    Runs func for each request in thread pool with at most `concurrency` requests in flight and yields results
+    as they complete (or in order of requests).
+
+    Requests are consumed lazily, exceptions of func are reported in results instead of aborting the batch.
+    In ordered mode request is submitted only if it's less than `concurrency` requests ahead of the first unfinished
+    one, so a stalled request pauses the batch instead of buffering all results after it.
+    When caller stops iterating (iterator is closed), pending requests are cancelled and stop event passed to func
+    is set, so requests in flight may stop early (e.g. between chunks of the stream).
+
+    :param func: function to run for each request, it takes request and stop event.
+    :type func: Callable
+    :param requests: requests (e.g. chat params).
+    :type requests: Iterable[dict]
+    :param concurrency: max requests in flight (threads in the pool).
+    :type concurrency: int
+    :param ordered: yield results in order of requests instead of order of completion.
+    :type ordered: bool
+    :param result_type: class of results.
+    :type result_type: Type[BatchResult]
+    :return: results of requests.
+    :rtype: Iterator[BatchResult]
+
+    Raises:
+        ValueError: If concurrency isn't positive.
+    """
+    if concurrency <= 0:
+        raise ValueError("Concurrency must be positive!")
+    items = enumerate(requests)
+    stop = Event()
+
+    def run(index: int, request: dict) -> BatchResult:
+        """
+        Runs a single request.
+
+        :param index: index of the request.
+        :type index: int
+        :param request: request.
+        :type request: dict
+        :return: result of the request.
+        :rtype: BatchResult
+        """
+        started = monotonic()
+        try:
+            response, error = func(request, stop), None
+        except Exception as err:  # pylint: disable=W0718
+            response, error = None, err
+        return result_type(index, request, response, error, monotonic() - started)
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="ablt_chat_many")
+    pending: set[Future] = set()
+    buffer: dict[int, BatchResult] = {}
+    next_index = 0
+    submitted = 0
+
+    def submit() -> None:
+        """Submits requests while there are free slots (and window of ordered mode isn't exceeded)."""
+        nonlocal submitted
+        free = concurrency - len(pending)
+        if ordered:
+            free = min(free, next_index + concurrency - submitted)
+        for index, request in islice(items, max(free, 0)):
+            pending.add(executor.submit(run, index, request))
+            submitted += 1
+
+    try:
+        submit()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            submit()
+            for result in sorted((future.result() for future in done), key=lambda done_result: done_result.index):
+                if not ordered:
+                    yield result
+                    continue
+                buffer[result.index] = result
+                while next_index in buffer:
+                    yield buffer.pop(next_index)
+                    next_index += 1
+            submit()
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: bot_catalog.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file contains catalog of bots with soft and hard TTL, validators, indexes by uid, slug and name and optional
+cache file shared by processes.
+"""
+
+import json
+import os
+import tempfile
+from time import monotonic, time
+from typing import Optional
+
+from pydantic import ValidationError
+
+from ..schemas import BotSchema
+
+BOT_CATALOG_VERSION = 1
+
+
+class _Snapshot:  # pylint: disable=R0903
+    """This class describes snapshot of bot list with its indexes."""
+
+    def __init__(self, bots: list[dict], loaded: float, etag: Optional[str], last_modified: Optional[str]):
+        """
+        Init _Snapshot class
+
+        :param bots: list of bots (BotSchema).
+        :type bots: list[dict]
+        :param loaded: time (monotonic) when bots were loaded or revalidated.
+        :type loaded: float
+        :param etag: ETag of bot list.
+        :type etag: str
+        :param last_modified: Last-Modified of bot list.
+        :type last_modified: str
+        """
+        self.bots = bots
+        self.loaded = loaded
+        self.etag = etag
+        self.last_modified = last_modified
+        self.by_uid: dict[str, dict] = {}
+        self.by_slug: dict[str, dict] = {}
+        self.by_name: dict[str, list[dict]] = {}
+        for bot in bots:
+            # The first bot wins for duplicated keys, as linear search did
+            self.by_uid.setdefault(bot.get("uid"), bot)
+            self.by_slug.setdefault(bot.get("slug"), bot)
+            self.by_name.setdefault(bot.get("name"), []).append(bot)
+
+
+class BotCatalog:
+    """
+    This class is in-memory catalog of bots with TTL and O(1) lookups by uid, slug and name.
+
+    After TTL catalog is stale: it may still be served while it's refreshed in background, until hard TTL is expired.
+    Catalog keeps ETag and Last-Modified of bot list, so it may be revalidated with conditional request. Catalog is
+    replaced as a whole on update, so lookups from many threads (or coroutines) never see half-built indexes and don't
+    need locks. Returned bots are shared, so callers must not modify them.
+
+    With cache file, catalog is loaded from it on start (before any request), so cold start doesn't wait for bot list.
+    File is replaced atomically (by rename) on each save, so it may be shared by many processes.
+    """
+
+    def __init__(self, ttl: float = 300.0, hard_ttl: Optional[float] = None, path: Optional[str] = None, key: str = ""):
+        """
+        Init BotCatalog class, catalog is loaded from cache file (if any).
+
+        :param ttl: time (in seconds) after which catalog is stale and must be refreshed, 0 means always stale.
+        :type ttl: float
+        :param hard_ttl: time (in seconds) after which stale catalog mustn't be served, None means never.
+        :type hard_ttl: float
+        :param path: path to cache file, None means catalog is kept in memory only.
+        :type path: str
+        :param key: key of bot list (e.g. hash of base API URL and bearer token), cache file of other key is ignored.
+        :type key: str
+        """
+        self.ttl = ttl
+        self.hard_ttl = hard_ttl
+        self.path = path
+        self.__key = key
+        self.__snapshot: Optional[_Snapshot] = None
+        self.load()
+
+    def reset(self, key: str) -> None:
+        """
+        Drops catalog and sets new key of bot list, catalog is loaded from cache file (if any).
+
+        :param key: key of bot list.
+        :type key: str
+        """
+        self.__key = key
+        self.__snapshot = None
+        self.load()
+
+    def load(self) -> bool:
+        """
+        Loads catalog from cache file, file of other version or key and file with invalid bots are ignored.
+
+        :return: True if catalog is loaded, False otherwise.
+        :rtype: bool
+        """
+        if self.path is None:
+            return False
+        try:
+            with open(self.path, encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+            if data.get("version") != BOT_CATALOG_VERSION or data.get("key") != self.__key:
+                return False
+            bots = data["bots"]
+            for bot in bots:
+                BotSchema.model_validate(bot)
+            age = max(0.0, time() - float(data["saved"]))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError, ValidationError):
+            return False
+        self.__snapshot = _Snapshot(bots, monotonic() - age, data.get("etag"), data.get("last_modified"))
+        return True
+
+    def save(self) -> None:
+        """
+        Saves catalog to cache file (if any) atomically: it's written to temporary file, which replaces cache file.
+
+        Raises:
+            OSError: If cache file can't be written.
+        """
+        snapshot = self.__snapshot
+        if self.path is None or snapshot is None:
+            return
+        data = {
+            "version": BOT_CATALOG_VERSION,
+            "key": self.__key,
+            "saved": time() - (monotonic() - snapshot.loaded),
+            "etag": snapshot.etag,
+            "last_modified": snapshot.last_modified,
+            "bots": snapshot.bots,
+        }
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=directory, prefix=".bots-", suffix=".tmp", delete=False
+        ) as temp_file:
+            try:
+                json.dump(data, temp_file, ensure_ascii=False)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            except BaseException:
+                temp_file.close()
+                os.remove(temp_file.name)
+                raise
+        try:
+            os.replace(temp_file.name, self.path)
+        except OSError:
+            os.remove(temp_file.name)
+            raise
+
+    def update(self, bots: list[dict], etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """
+        Replaces catalog with the new list of bots.
+
+        :param bots: list of bots (BotSchema).
+        :type bots: list[dict]
+        :param etag: ETag of bot list.
+        :type etag: str
+        :param last_modified: Last-Modified of bot list.
+        :type last_modified: str
+        """
+        self.__snapshot = _Snapshot(bots, monotonic(), etag, last_modified)
+
+    def touch(self) -> None:
+        """Marks catalog as fresh again (bot list is revalidated and not modified)."""
+        snapshot = self.__snapshot
+        if snapshot is not None:
+            snapshot.loaded = monotonic()
+
+    def get_validators(self) -> dict[str, str]:
+        """
+        Returns headers of conditional request to revalidate catalog.
+
+        :return: If-None-Match and If-Modified-Since headers (only known ones).
+        :rtype: dict[str, str]
+        """
+        snapshot = self.__snapshot
+        if snapshot is None:
+            return {}
+        headers = {}
+        if snapshot.etag:
+            headers["If-None-Match"] = snapshot.etag
+        if snapshot.last_modified:
+            headers["If-Modified-Since"] = snapshot.last_modified
+        return headers
+
+    def invalidate(self) -> None:
+        """Drops catalog, so it's loaded again on the next lookup."""
+        self.__snapshot = None
+
+    def is_loaded(self) -> bool:
+        """
+        Checks if catalog is loaded (it may be stale).
+
+        :return: True if catalog is loaded, False otherwise.
+        :rtype: bool
+        """
+        return self.__snapshot is not None
+
+    def is_usable(self) -> bool:
+        """
+        Checks if catalog is loaded and its hard TTL isn't expired, so it may be served while it's refreshed.
+
+        :return: True if catalog is usable, False otherwise.
+        :rtype: bool
+        """
+        snapshot = self.__snapshot
+        return snapshot is not None and (self.hard_ttl is None or monotonic() - snapshot.loaded < self.hard_ttl)
+
+    def is_fresh(self) -> bool:
+        """
+        Checks if catalog is loaded and its TTL isn't expired.
+
+        :return: True if catalog is fresh, False otherwise.
+        :rtype: bool
+        """
+        snapshot = self.__snapshot
+        return snapshot is not None and monotonic() - snapshot.loaded < self.ttl
+
+    def get_bots(self) -> list[dict]:
+        """
+        Returns all bots of the catalog.
+
+        :return: list of bots (BotSchema), or an empty list if catalog isn't loaded.
+        :rtype: list[dict]
+        """
+        snapshot = self.__snapshot
+        return snapshot.bots if snapshot is not None else []
+
+    def get_by_uid(self, bot_uid: str) -> Optional[dict]:
+        """
+        Returns bot by its uid.
+
+        :param bot_uid: The id of the bot.
+        :type bot_uid: str
+        :return: bot dict (BotSchema).
+        :rtype: dict|None
+        """
+        snapshot = self.__snapshot
+        return snapshot.by_uid.get(bot_uid) if snapshot is not None else None
+
+    def get_by_slug(self, bot_slug: str) -> Optional[dict]:
+        """
+        Returns bot by its slug.
+
+        :param bot_slug: The slug of the bot.
+        :type bot_slug: str
+        :return: bot dict (BotSchema).
+        :rtype: dict|None
+        """
+        snapshot = self.__snapshot
+        return snapshot.by_slug.get(bot_slug) if snapshot is not None else None
+
+    def get_by_name(self, bot_name: str) -> list[dict]:
+        """
+        Returns bots by their name (names are not unique).
+
+        :param bot_name: The name of the bot.
+        :type bot_name: str
+        :return: list of bots (BotSchema).
+        :rtype: list[dict]
+        """
+        snapshot = self.__snapshot
+        return list(snapshot.by_name.get(bot_name, ())) if snapshot is not None else []
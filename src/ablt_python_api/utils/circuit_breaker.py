@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: circuit_breaker.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file contains circuit breaker (closed, open and half-open states per endpoint) for aBLT API requests.
+"""
+
+from collections import deque
+from threading import Lock
+from time import monotonic
+from typing import Iterable
+
+from .exceptions import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+DEFAULT_BREAKER_ENDPOINTS = ("v1/chat", "v1/bots", "v1/user/usage-statistics")
+DEFAULT_FAILURE_STATUSES = (500, 502, 503, 504)
+
+
+class _EndpointCircuit:  # pylint: disable=R0903
+    """This class holds circuit state of a single endpoint."""
+
+    def __init__(self, window_size: int):
+        """
+        Init _EndpointCircuit class
+
+        :param window_size: count of the latest outcomes to calculate error rate.
+        :type window_size: int
+        """
+        self.state = CLOSED
+        self.outcomes: deque = deque(maxlen=window_size)
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_started = 0.0
+        self.probing = False
+
+
+class CircuitBreaker:  # pylint: disable=R0902
+    """
+    This class is circuit breaker for aBLT API endpoints, it may be shared by many API instances.
+
+    Circuit of endpoint is opened on too many consecutive failures or too high error rate, while it's open requests
+    fail fast with CircuitOpenError. After recovery timeout one caller probes API with health check and sends a trial
+    request (half-open state), its success closes the circuit, its failure opens the circuit again.
+    """
+
+    def __init__(  # pylint: disable=R0917
+        self,
+        failure_threshold: int = 5,
+        error_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 10,
+        recovery_timeout: float = 30.0,
+        endpoints: Iterable[str] = DEFAULT_BREAKER_ENDPOINTS,
+        failure_statuses: Iterable[int] = DEFAULT_FAILURE_STATUSES,
+    ):
+        """
+        Initializes the circuit breaker.
+
+        :param failure_threshold: consecutive failures to open the circuit.
+        :type failure_threshold: int
+        :param error_rate_threshold: error rate (0..1) in the window to open the circuit.
+        :type error_rate_threshold: float
+        :param window_size: count of the latest outcomes to calculate error rate.
+        :type window_size: int
+        :param min_calls: min outcomes in the window to calculate error rate.
+        :type min_calls: int
+        :param recovery_timeout: time (in seconds) to keep circuit open before probing recovery.
+        :type recovery_timeout: float
+        :param endpoints: endpoints guarded by the circuit breaker.
+        :type endpoints: Iterable[str]
+        :param failure_statuses: HTTP statuses treated as failures.
+        :type failure_statuses: Iterable[int]
+        """
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.recovery_timeout = recovery_timeout
+        self.endpoints = frozenset(endpoints)
+        self.failure_statuses = frozenset(failure_statuses)
+        self.__circuits: dict[str, _EndpointCircuit] = {}
+        self.__lock = Lock()
+
+    def __get_circuit(self, endpoint: str) -> _EndpointCircuit:
+        """
+        Returns circuit of the endpoint, creates it on first use.
+
+        :param endpoint: The endpoint of the API request.
+        :type endpoint: str
+        :return: circuit of the endpoint.
+        :rtype: _EndpointCircuit
+        """
+        if endpoint not in self.__circuits:
+            self.__circuits[endpoint] = _EndpointCircuit(self.window_size)
+        return self.__circuits[endpoint]
+
+    def get_state(self, endpoint: str) -> str:
+        """
+        Returns current state of the endpoint circuit: 'closed', 'open' or 'half_open'.
+
+        :param endpoint: The endpoint of the API request.
+        :type endpoint: str
+        :return: state of the circuit.
+        :rtype: str
+        """
+        with self.__lock:
+            return self.__get_circuit(endpoint).state
+
+    def is_failure_status(self, status: int) -> bool:
+        """
+        Checks whether HTTP status is failure for the circuit breaker.
+
+        :param status: HTTP status.
+        :type status: int
+        :return: True if status is failure, otherwise False.
+        :rtype: bool
+        """
+        return status in self.failure_statuses
+
+    def acquire(self, endpoint: str) -> bool:
+        """
+        Checks whether request to endpoint is allowed.
+
+        :param endpoint: The endpoint of the API request.
+        :type endpoint: str
+        :return: True if caller has to probe recovery (health check) before the request, otherwise False.
+        :rtype: bool
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or half-open with another probe in progress).
+        """
+        if endpoint not in self.endpoints:
+            return False
+        now = monotonic()
+        with self.__lock:
+            circuit = self.__get_circuit(endpoint)
+            if circuit.state == CLOSED:
+                return False
+            if circuit.state == OPEN:
+                retry_in = self.recovery_timeout - (now - circuit.opened_at)
+                if retry_in > 0:
+                    raise CircuitOpenError(endpoint, retry_in)
+                circuit.state = HALF_OPEN
+            elif circuit.probing and now - circuit.probe_started < self.recovery_timeout:
+                raise CircuitOpenError(endpoint, self.recovery_timeout - (now - circuit.probe_started))
+            # Only one caller probes recovery, the stuck probe is replaced after recovery timeout
+            circuit.probing = True
+            circuit.probe_started = now
+            return True
+
+    def record_success(self, endpoint: str) -> None:
+        """
+        Records successful request to endpoint.
+
+        :param endpoint: The endpoint of the API request.
+        :type endpoint: str
+        """
+        if endpoint not in self.endpoints:
+            return
+        with self.__lock:
+            circuit = self.__get_circuit(endpoint)
+            if circuit.state == HALF_OPEN:
+                circuit.state = CLOSED
+                circuit.probing = False
+                circuit.outcomes.clear()
+            circuit.outcomes.append(True)
+            circuit.consecutive_failures = 0
+
+    def record_failure(self, endpoint: str) -> None:
+        """
+        Records failed request to endpoint, opens the circuit if thresholds are reached.
+
+        :param endpoint: The endpoint of the API request.
+        :type endpoint: str
+        """
+        if endpoint not in self.endpoints:
+            return
+        with self.__lock:
+            circuit = self.__get_circuit(endpoint)
+            circuit.outcomes.append(False)
+            circuit.consecutive_failures += 1
+            failures = circuit.outcomes.count(False)
+            if (
+                circuit.state == HALF_OPEN
+                or circuit.consecutive_failures >= self.failure_threshold
+                or (
+                    len(circuit.outcomes) >= self.min_calls
+                    and failures / len(circuit.outcomes) >= self.error_rate_threshold
+                )
+            ):
+                circuit.state = OPEN
+                circuit.opened_at = monotonic()
+                circuit.probing = False
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: concurrency.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file contains adaptive (AIMD) concurrency limiter for async aBLT chat requests.
+"""
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from time import monotonic
+from typing import AsyncIterator, Optional
+
+
+class ConcurrencySample:
+    """This class collects signals (time to first chunk, overload) of a single limited request."""
+
+    def __init__(self):
+        """Init ConcurrencySample class"""
+        self.started = monotonic()
+        self.latency: Optional[float] = None
+        self.overloaded = False
+
+    def mark_first_chunk(self) -> None:
+        """Records time to first chunk, only the first call counts."""
+        if self.latency is None:
+            self.latency = monotonic() - self.started
+
+    def mark_overloaded(self) -> None:
+        """Records overload signal (429 status or timeout)."""
+        self.overloaded = True
+
+
+class AdaptiveConcurrencyLimiter:  # pylint: disable=R0902
+    """
+    This class limits in-flight async requests, the limit is adapted to observed latency (AIMD).
+
+    Limit grows by one per limit of successful requests (i.e. about once per round trip) while time to first chunk
+    stays flat, and is multiplied by decrease factor on 429 statuses, timeouts or when short-term average latency
+    rises above long-term one by latency tolerance. Decreases are applied at most once per cooldown, so a burst
+    of failures of in-flight requests cuts the limit only once.
+    """
+
+    def __init__(  # pylint: disable=R0917
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        decrease_factor: float = 0.7,
+        latency_tolerance: float = 1.5,
+        cooldown: float = 1.0,
+    ):
+        """
+        Initializes the limiter.
+
+        :param initial_limit: initial number of in-flight requests.
+        :type initial_limit: int
+        :param min_limit: min number of in-flight requests.
+        :type min_limit: int
+        :param max_limit: max number of in-flight requests.
+        :type max_limit: int
+        :param decrease_factor: multiplier (0..1) applied to the limit on overload.
+        :type decrease_factor: float
+        :param latency_tolerance: ratio of short-term to long-term average latency treated as overload.
+        :type latency_tolerance: float
+        :param cooldown: min time (in seconds) between two decreases.
+        :type cooldown: float
+
+        Raises:
+            ValueError: If limits are inconsistent.
+        """
+        if not 0 < min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 0 < min_limit <= initial_limit <= max_limit!")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+        self.__limit = float(initial_limit)
+        self.__in_flight = 0
+        self.__waiters: deque = deque()
+        self.__short_latency: Optional[float] = None
+        self.__long_latency: Optional[float] = None
+        self.__decreased_at = 0.0
+
+    @property
+    def limit(self) -> int:
+        """
+        Returns current limit of in-flight requests.
+
+        :return: current limit.
+        :rtype: int
+        """
+        return int(self.__limit)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Returns number of in-flight requests.
+
+        :return: number of in-flight requests.
+        :rtype: int
+        """
+        return self.__in_flight
+
+    async def acquire(self) -> None:
+        """Waits until number of in-flight requests is below the limit and takes a slot."""
+        if self.__in_flight < self.limit and not self.__waiters:
+            self.__in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self.__waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was already handed over, give it to the next waiter
+                self.__in_flight -= 1
+                self.__wake_up()
+            else:
+                self.__waiters.remove(waiter)
+            raise
+
+    def release(self, latency: Optional[float] = None, overloaded: bool = False) -> None:
+        """
+        Frees a slot and adapts the limit to the outcome of the request.
+
+        :param latency: time (in seconds) to first chunk, None if unknown.
+        :type latency: float
+        :param overloaded: whether request has got 429 status or timed out.
+        :type overloaded: bool
+        """
+        saturated = self.__in_flight >= self.limit
+        self.__in_flight -= 1
+        if latency is not None and not overloaded:
+            self.__short_latency = (
+                latency if self.__short_latency is None else 0.5 * self.__short_latency + 0.5 * latency
+            )
+            self.__long_latency = (
+                latency if self.__long_latency is None else 0.95 * self.__long_latency + 0.05 * latency
+            )
+            overloaded = self.__short_latency > self.__long_latency * self.latency_tolerance
+        if overloaded:
+            now = monotonic()
+            if now - self.__decreased_at >= self.cooldown:
+                self.__decreased_at = now
+                self.__limit = max(float(self.min_limit), self.__limit * self.decrease_factor)
+        elif latency is not None and saturated:
+            # Grow only if the limit is actually reached, idle limiter has no evidence of spare capacity
+            self.__limit = min(float(self.max_limit), self.__limit + 1 / self.__limit)
+        self.__wake_up()
+
+    def __wake_up(self) -> None:
+        """Hands over free slots to waiters in order of arrival."""
+        while self.__waiters and self.__in_flight < self.limit:
+            waiter = self.__waiters.popleft()
+            if not waiter.done():
+                self.__in_flight += 1
+                waiter.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[ConcurrencySample]:
+        """
+        Takes a slot for the request and releases it on exit, timeouts are treated as overload.
+
+        :return: sample to record signals of the request.
+        :rtype: ConcurrencySample
+        """
+        await self.acquire()
+        sample = ConcurrencySample()
+        try:
+            yield sample
+        except (asyncio.TimeoutError, TimeoutError):
+            sample.mark_overloaded()
+            raise
+        finally:
+            self.release(sample.latency, sample.overloaded)
@@ -4,17 +4,53 @@ Author: Iliya Vereshchagin
 Copyright (c) 2023 aBLT.ai. All rights reserved.
 
 Created: 14.06.2023
-Last Modified: 19.06.2023
+Last Modified: 17.10.2026
 
 Description:
 This file contains any exception classes.
 """
 
+from typing import Optional
+
 
 class DoneException(Exception):
     """This class is dummy placeholder to raise exception to break endless stream responses (endless loop)"""
 
 
+class ChatTimeoutError(TimeoutError):
+    """This class is raised when chat request exceeds one of its timeouts (connect, first_chunk, idle or total)"""
+
+    def __init__(self, phase: str, timeout: Optional[float] = None):
+        """
+        Init ChatTimeoutError class
+
+        :param phase: name of exceeded timeout
+        :type phase: str
+        :param timeout: exceeded timeout value in seconds
+        :type timeout: float
+        """
+        super().__init__(f"Chat request exceeded {phase} timeout ({timeout} s)")
+        self.phase = phase
+        self.timeout = timeout
+
+
+class CircuitOpenError(Exception):
+    """This class is raised when circuit breaker of endpoint is open, so request fails fast without being sent"""
+
+    def __init__(self, endpoint: str, retry_in: Optional[float] = None):
+        """
+        Init CircuitOpenError class
+
+        :param endpoint: endpoint with open circuit
+        :type endpoint: str
+        :param retry_in: time in seconds until recovery will be probed
+        :type retry_in: float
+        """
+        super().__init__(f"Circuit for {endpoint} is open, recovery will be probed in {retry_in} s")
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
 class CustomError(Exception):
     """This class is placeholder to raise exception for servers or standalone logging"""
 
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: rate_limiter.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file contains client-side token bucket rate limiter for aBLT API requests (safe for coroutines and threads).
+"""
+
+import asyncio
+from threading import Lock
+from time import monotonic, sleep
+from typing import Iterable, Optional
+
+DEFAULT_LIMITED_ENDPOINTS = ("v1/bots", "v1/chat", "v1/user/usage-statistics")
+
+
+class _Bucket:  # pylint: disable=R0903
+    """This class holds tokens of a single bucket."""
+
+    def __init__(self, tokens: float, updated: float):
+        """
+        Init _Bucket class
+
+        :param tokens: tokens available in the bucket (negative if reserved in advance).
+        :type tokens: float
+        :param updated: time of the last refill.
+        :type updated: float
+        """
+        self.tokens = tokens
+        self.updated = updated
+
+
+class RateLimiter:  # pylint: disable=R0902
+    """
+    This class is token bucket rate limiter for aBLT API requests, it may be shared by many API instances.
+
+    Each request reserves its cost from the bucket and waits until the bucket is refilled enough, so waiting callers
+    are served in order of arrival and bucket is never overdrawn by concurrent coroutines or threads.
+    """
+
+    def __init__(  # pylint: disable=R0917
+        self,
+        rate: float = 10.0,
+        burst: int = 10,
+        per_token: bool = True,
+        per_endpoint: bool = False,
+        weighted: bool = False,
+        endpoints: Iterable[str] = DEFAULT_LIMITED_ENDPOINTS,
+    ):
+        """
+        Initializes the rate limiter.
+
+        :param rate: tokens added to the bucket per second (requests per second, or words per second if weighted).
+        :type rate: float
+        :param burst: bucket capacity, max tokens spent at once after idle period.
+        :type burst: int
+        :param per_token: use separate bucket for each bearer token.
+        :type per_token: bool
+        :param per_endpoint: use separate bucket for each endpoint.
+        :type per_endpoint: bool
+        :param weighted: charge chat requests with 'max_words' instead of 1 token.
+        :type weighted: bool
+        :param endpoints: endpoints limited by the rate limiter.
+        :type endpoints: Iterable[str]
+
+        Raises:
+            ValueError: If rate or burst isn't positive.
+        """
+        if rate <= 0 or burst <= 0:
+            raise ValueError("Rate and burst must be positive!")
+        self.rate = rate
+        self.burst = burst
+        self.per_token = per_token
+        self.per_endpoint = per_endpoint
+        self.weighted = weighted
+        self.endpoints = frozenset(endpoints)
+        self.__buckets: dict[tuple, _Bucket] = {}
+        self.__lock = Lock()
+
+    def reserve(self, bearer_token: str, endpoint: str, cost: Optional[int] = None) -> float:
+        """
+        Reserves tokens for the request and returns time to wait before sending it.
+
+        :param bearer_token: The bearer token of the request.
+        :type bearer_token: str
+        :param endpoint: The endpoint of the API request.
+        :type endpoint: str
+        :param cost: cost of the request in weighted mode (e.g. 'max_words'), None means 1.
+        :type cost: int
+        :return: delay in seconds (0 if request may be sent right now).
+        :rtype: float
+        """
+        if endpoint not in self.endpoints:
+            return 0.0
+        cost = cost if self.weighted and cost else 1
+        key = (bearer_token if self.per_token else None, endpoint if self.per_endpoint else None)
+        now = monotonic()
+        with self.__lock:
+            bucket = self.__buckets.get(key)
+            if bucket is None:
+                bucket = self.__buckets[key] = _Bucket(self.burst, now)
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * self.rate)
+            bucket.updated = now
+            bucket.tokens -= cost
+            return max(0.0, -bucket.tokens / self.rate)
+
+    def acquire(self, bearer_token: str, endpoint: str, cost: Optional[int] = None) -> None:
+        """
+        Blocks current thread until the request may be sent.
+
+        :param bearer_token: The bearer token of the request.
+        :type bearer_token: str
+        :param endpoint: The endpoint of the API request.
+        :type endpoint: str
+        :param cost: cost of the request in weighted mode (e.g. 'max_words'), None means 1.
+        :type cost: int
+        """
+        delay = self.reserve(bearer_token, endpoint, cost)
+        if delay > 0:
+            sleep(delay)
+
+    async def acquire_async(self, bearer_token: str, endpoint: str, cost: Optional[int] = None) -> None:
+        """
+        Waits (without blocking the event loop) until the request may be sent.
+
+        :param bearer_token: The bearer token of the request.
+        :type bearer_token: str
+        :param endpoint: The endpoint of the API request.
+        :type endpoint: str
+        :param cost: cost of the request in weighted mode (e.g. 'max_words'), None means 1.
+        :type cost: int
+        """
+        delay = self.reserve(bearer_token, endpoint, cost)
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,422 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: response_cache.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file contains memory-bounded LRU cache of chat responses with TTL and its SQLite (WAL) variant shared by
+processes.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic, time
+from typing import Optional
+
+
+class ResponseCache:  # pylint: disable=R0902
+    """
+    This class is memory-bounded LRU cache of chat responses with per-entry TTL.
+
+    Least recently used responses are evicted when cache exceeds max entries or max size of responses. Cache is safe
+    for threads and coroutines, so it may be shared by many API instances: keys are namespaced by API (base API URL
+    and bearer token), so responses of one API key are never served to another one.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_size: Optional[int] = 64 * 1024 * 1024, ttl: float = 3600.0):
+        """
+        Init ResponseCache class
+
+        :param max_entries: max count of cached responses.
+        :type max_entries: int
+        :param max_size: max total size (in characters) of cached responses, None means no limit.
+        :type max_size: int
+        :param ttl: default time (in seconds) to keep response.
+        :type ttl: float
+
+        Raises:
+            ValueError: If max entries isn't positive.
+        """
+        if max_entries <= 0:
+            raise ValueError("Max entries must be positive!")
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.__size = 0
+        self.__entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self.__lock = Lock()
+
+    @staticmethod
+    def get_key(payload: dict, namespace: str = "") -> str:
+        """
+        Returns key of chat request (hash of namespace and canonical JSON of its payload).
+
+        :param payload: payload of chat request.
+        :type payload: dict
+        :param namespace: namespace of the key, e.g. key of API (hash of base API URL and bearer token).
+        :type namespace: str
+        :return: key of the request.
+        :rtype: str
+        """
+        canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(f"{namespace}\n{canonical}".encode("utf-8")).hexdigest()
+
+    def __len__(self) -> int:
+        """
+        Returns count of cached responses (including expired, but not evicted ones).
+
+        :return: count of cached responses.
+        :rtype: int
+        """
+        return len(self.__entries)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Returns cached response and marks it as recently used.
+
+        :param key: key of the request.
+        :type key: str
+        :return: cached response or None if it's not cached or expired.
+        :rtype: str | None
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[1] <= monotonic():
+                self.__remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: str, response: str, ttl: Optional[float] = None) -> None:
+        """
+        Caches response, evicting least recently used ones if needed.
+
+        :param key: key of the request.
+        :type key: str
+        :param response: full response of the bot.
+        :type response: str
+        :param ttl: time (in seconds) to keep response, None means default TTL of the cache.
+        :type ttl: float
+        """
+        ttl = ttl if ttl is not None else self.ttl
+        if ttl <= 0 or (self.max_size is not None and len(response) > self.max_size):
+            return
+        with self.__lock:
+            if key in self.__entries:
+                self.__remove(key)
+            self.__entries[key] = (response, monotonic() + ttl)
+            self.__size += len(response)
+            while len(self.__entries) > self.max_entries or (self.max_size is not None and self.__size > self.max_size):
+                self.__remove(next(iter(self.__entries)))
+
+    def invalidate(self, key: str) -> None:
+        """
+        Removes cached response.
+
+        :param key: key of the request.
+        :type key: str
+        """
+        with self.__lock:
+            if key in self.__entries:
+                self.__remove(key)
+
+    def clear(self) -> None:
+        """Removes all cached responses and resets counters."""
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Returns stats of the cache.
+
+        :return: hits, misses, entries and size (in characters) of cached responses.
+        :rtype: dict[str, int]
+        """
+        with self.__lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self.__entries), "size": self.__size}
+
+    def __remove(self, key: str) -> None:
+        """
+        Removes entry, must be called under the lock.
+
+        :param key: key of the request.
+        :type key: str
+        """
+        response, _ = self.__entries.pop(key)
+        self.__size -= len(response)
+
+
+# Version of the schema (PRAGMA user_version), entries of other versions (e.g. keyed without API) are discarded
+_SCHEMA_VERSION = 1
+_SCHEMA = (
+    "DROP TRIGGER IF EXISTS entries_insert",
+    "DROP TRIGGER IF EXISTS entries_delete",
+    "DROP TABLE IF EXISTS entries",
+    "DROP TABLE IF EXISTS totals",
+    """CREATE TABLE entries (
+        key TEXT PRIMARY KEY,
+        response TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        expires REAL NOT NULL,
+        accessed REAL NOT NULL
+    )""",
+    "CREATE INDEX entries_accessed ON entries (accessed)",
+    "CREATE INDEX entries_expires ON entries (expires)",
+    """CREATE TABLE totals (
+        id INTEGER PRIMARY KEY CHECK (id = 0),
+        entries INTEGER NOT NULL,
+        size INTEGER NOT NULL
+    )""",
+    "INSERT INTO totals (id, entries, size) VALUES (0, 0, 0)",
+    """CREATE TRIGGER entries_insert AFTER INSERT ON entries BEGIN
+        UPDATE totals SET entries = entries + 1, size = size + NEW.size WHERE id = 0;
+    END""",
+    """CREATE TRIGGER entries_delete AFTER DELETE ON entries BEGIN
+        UPDATE totals SET entries = entries - 1, size = size - OLD.size WHERE id = 0;
+    END""",
+    f"PRAGMA user_version = {_SCHEMA_VERSION}",
+)
+
+
+class SQLiteResponseCache:  # pylint: disable=R0902
+    """
+    This class is LRU cache of chat responses with per-entry TTL in SQLite database (WAL mode), shared by processes.
+
+    All workers on the host, which use the same database file, share cached responses, so each response is paid once.
+    WAL mode lets readers work concurrently with a writer. Least recently used responses (access time is updated at
+    most once per touch interval to keep reads cheap) are evicted when cache exceeds max entries or max size of
+    responses. Hit and miss counters are kept per instance. Connection is reopened after fork. Keys are namespaced by
+    API (see ResponseCache.get_key), and database of older schema version (e.g. with keys without API) is recreated.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 100000,
+        max_size: Optional[int] = 256 * 1024 * 1024,
+        ttl: float = 3600.0,
+        touch_interval: float = 60.0,
+    ):
+        """
+        Opens (creates if needed) the cache.
+
+        :param path: path to SQLite database file.
+        :type path: str
+        :param max_entries: max count of cached responses.
+        :type max_entries: int
+        :param max_size: max total size (in characters) of cached responses, None means no limit.
+        :type max_size: int
+        :param ttl: default time (in seconds) to keep response.
+        :type ttl: float
+        :param touch_interval: min time (in seconds) between updates of access time of the same response.
+        :type touch_interval: float
+
+        Raises:
+            ValueError: If max entries isn't positive.
+        """
+        if max_entries <= 0:
+            raise ValueError("Max entries must be positive!")
+        self.path = path
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.ttl = ttl
+        self.touch_interval = touch_interval
+        self.hits = 0
+        self.misses = 0
+        self.__lock = Lock()
+        self.__pid = os.getpid()
+        self.__connection = self.__connect()
+
+    def __connect(self) -> sqlite3.Connection:
+        """
+        Opens connection to the database.
+
+        :return: connection.
+        :rtype: sqlite3.Connection
+        """
+        connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False, timeout=30.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            # Version is checked in the write transaction, so only the first process (re)creates the schema
+            if connection.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            connection.close()
+            raise
+        connection.execute("COMMIT")
+        return connection
+
+    def __get_connection(self) -> sqlite3.Connection:
+        """
+        Returns connection of current process, must be called under the lock.
+
+        :return: connection.
+        :rtype: sqlite3.Connection
+        """
+        if self.__pid != os.getpid():
+            # Connection inherited from parent process mustn't be used after fork
+            self.__pid = os.getpid()
+            self.__connection = self.__connect()
+        return self.__connection
+
+    def __enter__(self):
+        """
+        Enters the context manager.
+
+        :return: SQLiteResponseCache instance.
+        :rtype: SQLiteResponseCache
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exits the context manager and closes the database."""
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database."""
+        with self.__lock:
+            self.__connection.close()
+
+    get_key = staticmethod(ResponseCache.get_key)
+
+    def __len__(self) -> int:
+        """
+        Returns count of cached responses (including expired, but not evicted ones).
+
+        :return: count of cached responses.
+        :rtype: int
+        """
+        with self.__lock:
+            return self.__get_connection().execute("SELECT entries FROM totals WHERE id = 0").fetchone()[0]
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Returns cached response and marks it as recently used.
+
+        :param key: key of the request.
+        :type key: str
+        :return: cached response or None if it's not cached or expired.
+        :rtype: str | None
+        """
+        now = time()
+        with self.__lock:
+            connection = self.__get_connection()
+            row = connection.execute("SELECT response, expires, accessed FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or row[1] <= now:
+                self.misses += 1
+                return None
+            if now - row[2] >= self.touch_interval:
+                connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, response: str, ttl: Optional[float] = None) -> None:
+        """
+        Caches response, evicting expired and least recently used ones if needed.
+
+        :param key: key of the request.
+        :type key: str
+        :param response: full response of the bot.
+        :type response: str
+        :param ttl: time (in seconds) to keep response, None means default TTL of the cache.
+        :type ttl: float
+        """
+        ttl = ttl if ttl is not None else self.ttl
+        if ttl <= 0 or (self.max_size is not None and len(response) > self.max_size):
+            return
+        now = time()
+        with self.__lock:
+            connection = self.__get_connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                connection.execute(
+                    "INSERT INTO entries (key, response, size, expires, accessed) VALUES (?, ?, ?, ?, ?)",
+                    (key, response, len(response), now + ttl, now),
+                )
+                self.__evict(connection, now)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def __evict(self, connection: sqlite3.Connection, now: float) -> None:
+        """
+        Evicts expired and then least recently used responses until cache is within limits.
+
+        :param connection: connection with open transaction.
+        :type connection: sqlite3.Connection
+        :param now: current time.
+        :type now: float
+        """
+        if self.__is_within_limits(connection):
+            return
+        connection.execute("DELETE FROM entries WHERE expires <= ?", (now,))
+        while not self.__is_within_limits(connection):
+            entries = connection.execute("SELECT entries FROM totals WHERE id = 0").fetchone()[0]
+            # Evict in batches, so the next writes don't have to evict again
+            count = max(1, entries - self.max_entries, entries // 20)
+            connection.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY accessed LIMIT ?)", (count,)
+            )
+
+    def __is_within_limits(self, connection: sqlite3.Connection) -> bool:
+        """
+        Checks if cache is within max entries and max size.
+
+        :param connection: connection.
+        :type connection: sqlite3.Connection
+        :return: True if cache is within limits, False otherwise.
+        :rtype: bool
+        """
+        entries, size = connection.execute("SELECT entries, size FROM totals WHERE id = 0").fetchone()
+        return entries <= self.max_entries and (self.max_size is None or size <= self.max_size)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Removes cached response.
+
+        :param key: key of the request.
+        :type key: str
+        """
+        with self.__lock:
+            self.__get_connection().execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Removes all cached responses and resets counters."""
+        with self.__lock:
+            self.__get_connection().execute("DELETE FROM entries")
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Returns stats of the cache.
+
+        :return: hits and misses of this instance, entries and size (in characters) of cached responses.
+        :rtype: dict[str, int]
+        """
+        with self.__lock:
+            entries, size = self.__get_connection().execute("SELECT entries, size FROM totals WHERE id = 0").fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "size": size}
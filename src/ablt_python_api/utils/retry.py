@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: retry.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file contains retry policy (exponential backoff with full jitter, Retry-After support) for aBLT API requests.
+"""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+DEFAULT_RETRYABLE_ENDPOINTS = ("v1/bots", "v1/chat", "v1/user/usage-statistics")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses Retry-After header value (delay in seconds or HTTP date).
+
+    :param value: Retry-After header value.
+    :type value: str
+    :return: delay in seconds or None if value is missing or malformed.
+    :rtype: float | None
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:  # pylint: disable=R0902
+    """This class describes when and how long to wait before retrying failed requests."""
+
+    def __init__(  # pylint: disable=R0917
+        self,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        total_budget: Optional[float] = 60.0,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retryable_endpoints: Iterable[str] = DEFAULT_RETRYABLE_ENDPOINTS,
+        retry_streaming: bool = False,
+        respect_retry_after: bool = True,
+    ):
+        """
+        Initializes the retry policy.
+
+        :param max_retries: max retries per request (not counting the first try), 0 disables retries.
+        :type max_retries: int
+        :param backoff: base delay (in seconds), the upper bound of delay is doubled after each retry.
+        :type backoff: float
+        :param max_backoff: max delay (in seconds) between retries, not applied to Retry-After.
+        :type max_backoff: float
+        :param total_budget: max time (in seconds) spent on request with all its retries, None means unlimited.
+        :type total_budget: float
+        :param retry_statuses: HTTP statuses treated as transient failures.
+        :type retry_statuses: Iterable[int]
+        :param retryable_endpoints: endpoints which are safe to retry (idempotent).
+        :type retryable_endpoints: Iterable[str]
+        :param retry_streaming: retry streaming requests too (only before the stream is started).
+        :type retry_streaming: bool
+        :param respect_retry_after: wait as long as server asks with Retry-After header.
+        :type respect_retry_after: bool
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.total_budget = total_budget
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retryable_endpoints = frozenset(retryable_endpoints)
+        self.retry_streaming = retry_streaming
+        self.respect_retry_after = respect_retry_after
+
+    def is_retryable(self, endpoint: str, streaming: bool = False) -> bool:
+        """
+        Checks whether requests to endpoint may be retried at all.
+
+        :param endpoint: The endpoint of the API request.
+        :type endpoint: str
+        :param streaming: whether request is streaming one.
+        :type streaming: bool
+        :return: True if request may be retried, otherwise False.
+        :rtype: bool
+        """
+        if self.max_retries <= 0 or endpoint not in self.retryable_endpoints:
+            return False
+        return self.retry_streaming or not streaming
+
+    def is_retryable_status(self, status: int) -> bool:
+        """
+        Checks whether HTTP status is transient failure.
+
+        :param status: HTTP status.
+        :type status: int
+        :return: True if status is transient failure, otherwise False.
+        :rtype: bool
+        """
+        return status in self.retry_statuses
+
+    def get_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Returns delay before the next retry: Retry-After if given, otherwise exponential backoff with full jitter.
+
+        :param attempt: number of retries already done (0 for the first retry).
+        :type attempt: int
+        :param retry_after: Retry-After header value.
+        :type retry_after: str
+        :return: delay in seconds.
+        :rtype: float
+        """
+        if self.respect_retry_after:
+            delay = parse_retry_after(retry_after)
+            if delay is not None:
+                return delay
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+    def can_retry(self, attempt: int, elapsed: float, delay: float) -> bool:
+        """
+        Checks whether one more retry fits into retries count and total budget.
+
+        :param attempt: number of retries already done.
+        :type attempt: int
+        :param elapsed: time (in seconds) already spent on the request.
+        :type elapsed: float
+        :param delay: delay (in seconds) before the next retry.
+        :type delay: float
+        :return: True if request may be retried once more, otherwise False.
+        :rtype: bool
+        """
+        if attempt >= self.max_retries:
+            return False
+        return self.total_budget is None or elapsed + delay <= self.total_budget
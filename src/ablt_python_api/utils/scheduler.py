@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: scheduler.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file contains request scheduler with priority classes and weighted fair queuing per user.
+"""
+
+import asyncio
+import heapq
+from contextlib import asynccontextmanager, contextmanager
+from itertools import count
+from threading import Event, Lock
+from typing import AsyncIterator, Callable, Iterable, Iterator, Optional
+
+
+class PriorityClass:  # pylint: disable=R0903
+    """This class describes priority class of requests."""
+
+    def __init__(self, name: str, priority: int = 0, max_concurrency: Optional[int] = None):
+        """
+        Init PriorityClass class
+
+        :param name: name of the class.
+        :type name: str
+        :param priority: priority of the class, the lower value is the higher priority.
+        :type priority: int
+        :param max_concurrency: max requests of the class in flight, None means only total limit.
+        :type max_concurrency: int
+        """
+        self.name = name
+        self.priority = priority
+        self.max_concurrency = max_concurrency
+
+
+DEFAULT_PRIORITY_CLASSES = (PriorityClass("interactive", 0), PriorityClass("batch", 1))
+
+
+class _Waiter:  # pylint: disable=R0903
+    """This class describes queued request."""
+
+    def __init__(self, class_name: str, notify: Callable[[], None]):
+        """
+        Init _Waiter class
+
+        :param class_name: name of priority class.
+        :type class_name: str
+        :param notify: callback to wake up the request.
+        :type notify: Callable
+        """
+        self.class_name = class_name
+        self.notify = notify
+        self.granted = False
+        self.cancelled = False
+
+
+class RequestScheduler:  # pylint: disable=R0902
+    """
+    This class schedules requests by priority classes and shares each class fairly between users.
+
+    Queued request of higher priority class always goes before queued requests of lower classes (unless its class
+    is at its own concurrency cap). Within the class, requests are served by weighted fair queuing (start-time fair
+    queuing) per user, so a user with many queued requests doesn't delay others. Scheduler may be shared by many
+    sync and async API instances.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        classes: Iterable[PriorityClass] = DEFAULT_PRIORITY_CLASSES,
+        default_class: str = "interactive",
+        user_weights: Optional[dict] = None,
+    ):
+        """
+        Initializes the scheduler.
+
+        :param max_concurrency: max requests of all classes in flight.
+        :type max_concurrency: int
+        :param classes: priority classes.
+        :type classes: Iterable[PriorityClass]
+        :param default_class: priority class of requests without explicit class.
+        :type default_class: str
+        :param user_weights: weights of users (share of the class), default weight is 1.
+        :type user_weights: dict
+
+        Raises:
+            ValueError: If max concurrency isn't positive or default class is unknown.
+        """
+        if max_concurrency <= 0:
+            raise ValueError("Max concurrency must be positive!")
+        self.max_concurrency = max_concurrency
+        self.user_weights = user_weights if user_weights is not None else {}
+        self.__classes = {priority_class.name: priority_class for priority_class in classes}
+        if default_class not in self.__classes:
+            raise ValueError(f"Unknown priority class: {default_class}")
+        self.default_class = default_class
+        self.__order = sorted(self.__classes.values(), key=lambda priority_class: priority_class.priority)
+        self.__queues: dict[str, list] = {name: [] for name in self.__classes}
+        self.__in_flight = {name: 0 for name in self.__classes}
+        self.__total = 0
+        self.__virtual_time = {name: 0.0 for name in self.__classes}
+        self.__user_finish: dict[tuple, float] = {}
+        self.__sequence = count()
+        self.__lock = Lock()
+
+    @property
+    def lowest_class(self) -> str:
+        """
+        Returns name of the lowest priority class (e.g. for batch requests).
+
+        :return: name of priority class.
+        :rtype: str
+        """
+        return self.__order[-1].name
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Returns count of queued and in-flight requests per priority class.
+
+        :return: stats per priority class.
+        :rtype: dict[str, dict[str, int]]
+        """
+        with self.__lock:
+            return {
+                name: {
+                    "queued": sum(not waiter.cancelled for _, _, waiter in self.__queues[name]),
+                    "in_flight": self.__in_flight[name],
+                }
+                for name in self.__classes
+            }
+
+    def __enqueue(
+        self, priority: Optional[str], user_id: Optional[int], cost: float, notify: Callable[[], None]
+    ) -> _Waiter:
+        """
+        Queues request and dispatches queued requests.
+
+        :param priority: name of priority class, None means default class.
+        :type priority: str
+        :param user_id: user ID for fair queuing.
+        :type user_id: int
+        :param cost: cost of the request.
+        :type cost: float
+        :param notify: callback to wake up the request.
+        :type notify: Callable
+        :return: waiter of the request.
+        :rtype: _Waiter
+
+        Raises:
+            ValueError: If priority class is unknown.
+        """
+        class_name = priority if priority is not None else self.default_class
+        if class_name not in self.__classes:
+            raise ValueError(f"Unknown priority class: {class_name}")
+        waiter = _Waiter(class_name, notify)
+        with self.__lock:
+            user_key = (class_name, user_id)
+            start = max(self.__virtual_time[class_name], self.__user_finish.get(user_key, 0.0))
+            finish = start + cost / self.user_weights.get(user_id, 1.0)
+            self.__user_finish[user_key] = finish
+            heapq.heappush(self.__queues[class_name], (finish, next(self.__sequence), waiter))
+            self.__dispatch()
+        return waiter
+
+    def __dispatch(self) -> None:
+        """Grants free slots to queued requests, must be called under the lock."""
+        while self.__total < self.max_concurrency:
+            for priority_class in self.__order:
+                queue = self.__queues[priority_class.name]
+                while queue and queue[0][2].cancelled:
+                    heapq.heappop(queue)
+                if queue and (
+                    priority_class.max_concurrency is None
+                    or self.__in_flight[priority_class.name] < priority_class.max_concurrency
+                ):
+                    break
+            else:
+                return
+            finish, _, waiter = heapq.heappop(queue)
+            self.__virtual_time[waiter.class_name] = finish
+            self.__in_flight[waiter.class_name] += 1
+            self.__total += 1
+            waiter.granted = True
+            waiter.notify()
+        if len(self.__user_finish) > 10 * self.max_concurrency:
+            # Users, which are behind virtual time, have no advantage to keep
+            self.__user_finish = {
+                key: finish for key, finish in self.__user_finish.items() if finish > self.__virtual_time[key[0]]
+            }
+
+    def release(self, class_name: str) -> None:
+        """
+        Frees the slot of finished request.
+
+        :param class_name: name of priority class of the request.
+        :type class_name: str
+        """
+        with self.__lock:
+            self.__in_flight[class_name] -= 1
+            self.__total -= 1
+            self.__dispatch()
+
+    def acquire(self, priority: Optional[str] = None, user_id: Optional[int] = None, cost: float = 1.0) -> str:
+        """
+        Blocks current thread until the request is scheduled.
+
+        :param priority: name of priority class, None means default class.
+        :type priority: str
+        :param user_id: user ID for fair queuing.
+        :type user_id: int
+        :param cost: cost of the request.
+        :type cost: float
+        :return: name of priority class to release the slot.
+        :rtype: str
+        """
+        event = Event()
+        waiter = self.__enqueue(priority, user_id, cost, event.set)
+        event.wait()
+        return waiter.class_name
+
+    async def acquire_async(
+        self, priority: Optional[str] = None, user_id: Optional[int] = None, cost: float = 1.0
+    ) -> str:
+        """
+        Waits (without blocking the event loop) until the request is scheduled.
+
+        :param priority: name of priority class, None means default class.
+        :type priority: str
+        :param user_id: user ID for fair queuing.
+        :type user_id: int
+        :param cost: cost of the request.
+        :type cost: float
+        :return: name of priority class to release the slot.
+        :rtype: str
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def notify() -> None:
+            """Wakes up the request, slot may be granted from other thread."""
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+        waiter = self.__enqueue(priority, user_id, cost, notify)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self.__lock:
+                waiter.cancelled = not waiter.granted
+            if waiter.granted:
+                self.release(waiter.class_name)
+            raise
+        return waiter.class_name
+
+    @contextmanager
+    def slot(self, priority: Optional[str] = None, user_id: Optional[int] = None, cost: float = 1.0) -> Iterator[str]:
+        """
+        Schedules the request and frees its slot on exit.
+
+        :param priority: name of priority class, None means default class.
+        :type priority: str
+        :param user_id: user ID for fair queuing.
+        :type user_id: int
+        :param cost: cost of the request.
+        :type cost: float
+        :return: name of priority class.
+        :rtype: str
+        """
+        class_name = self.acquire(priority, user_id, cost)
+        try:
+            yield class_name
+        finally:
+            self.release(class_name)
+
+    @asynccontextmanager
+    async def slot_async(
+        self, priority: Optional[str] = None, user_id: Optional[int] = None, cost: float = 1.0
+    ) -> AsyncIterator[str]:
+        """
+        Schedules the request (without blocking the event loop) and frees its slot on exit.
+
+        :param priority: name of priority class, None means default class.
+        :type priority: str
+        :param user_id: user ID for fair queuing.
+        :type user_id: int
+        :param cost: cost of the request.
+        :type cost: float
+        :return: name of priority class.
+        :rtype: str
+        """
+        class_name = await self.acquire_async(priority, user_id, cost)
+        try:
+            yield class_name
+        finally:
+            self.release(class_name)
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: single_flight.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file contains single-flight helpers, which coalesce concurrent identical calls into one.
+"""
+
+import asyncio
+from threading import Event, Lock
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+
+class _Call:  # pylint: disable=R0903
+    """This class describes call in flight."""
+
+    def __init__(self):
+        """Init _Call class"""
+        self.done = Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:  # pylint: disable=R0903
+    """
+    This class coalesces concurrent identical calls (from many threads) into one.
+
+    While call with the key is in flight, other calls with the same key wait for it and get its result (or its
+    exception) instead of calling function again. Result is shared, so callers must not modify it.
+    """
+
+    def __init__(self):
+        """Init SingleFlight class"""
+        self.__lock = Lock()
+        self.__calls: dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Calls function, unless call with the same key is in flight, then waits for its result.
+
+        :param key: key of the call.
+        :type key: Hashable
+        :param func: function to call.
+        :type func: Callable
+        :param args: arguments of the function.
+        :type args: Any
+        :return: result of the function.
+        :rtype: Any
+        """
+        with self.__lock:
+            call = self.__calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.__calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func(*args)
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:  # pylint: disable=R0903
+    """
+    This class coalesces concurrent identical calls (from many coroutines) into one.
+
+    While call with the key is in flight, other calls with the same key await it and get its result (or its
+    exception) instead of calling function again. Call runs as a separate task, so cancellation of one caller
+    doesn't cancel others. Result is shared, so callers must not modify it.
+    """
+
+    def __init__(self):
+        """Init AsyncSingleFlight class"""
+        self.__tasks: dict[Hashable, asyncio.Task] = {}
+
+    def __forget(self, key: Hashable, task: asyncio.Task) -> None:
+        """
+        Removes finished task of the call.
+
+        :param key: key of the call.
+        :type key: Hashable
+        :param task: finished task.
+        :type task: asyncio.Task
+        """
+        if self.__tasks.get(key) is task:
+            del self.__tasks[key]
+        if not task.cancelled():
+            task.exception()  # exception is retrieved, even if all callers are gone
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """
+        Awaits function, unless call with the same key is in flight, then awaits its result.
+
+        :param key: key of the call.
+        :type key: Hashable
+        :param func: coroutine function to call.
+        :type func: Callable
+        :param args: arguments of the function.
+        :type args: Any
+        :return: result of the function.
+        :rtype: Any
+        """
+        task = self.__tasks.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = self.__tasks[key] = asyncio.ensure_future(func(*args))
+            task.add_done_callback(lambda done_task: self.__forget(key, done_task))
+        return await asyncio.shield(task)
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: statistics_cache.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file contains cache of usage statistics by days, which keeps closed (immutable) days only, splitting of date
+ranges into chunks and merging of dates into covering ranges.
+"""
+
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from threading import Lock
+from typing import Hashable, Iterable, Optional
+
+from ..schemas import StatisticTotalSchema
+
+STATISTIC_FIELDS = tuple(StatisticTotalSchema.model_fields)
+
+
+def split_date_range(start_date: date, end_date: date, chunk_days: Optional[int] = None) -> list[tuple]:
+    """
+    Splits date range into chunks of at most `chunk_days` days.
+
+    :param start_date: start date of the range.
+    :type start_date: date
+    :param end_date: end date of the range (inclusive).
+    :type end_date: date
+    :param chunk_days: max days in chunk, None means the range isn't split.
+    :type chunk_days: int
+    :return: list of (start date, end date) tuples of chunks, empty if start date is after end date.
+    :rtype: list[tuple]
+
+    Raises:
+        ValueError: If chunk days aren't positive.
+    """
+    if chunk_days is not None and chunk_days <= 0:
+        raise ValueError("Chunk days must be positive!")
+    if start_date > end_date:
+        return []
+    if chunk_days is None:
+        return [(start_date, end_date)]
+    chunks = []
+    while start_date <= end_date:
+        chunk_end = min(start_date + timedelta(days=chunk_days - 1), end_date)
+        chunks.append((start_date, chunk_end))
+        start_date = chunk_end + timedelta(days=1)
+    return chunks
+
+
+def get_covering_ranges(days: Iterable[date], max_gap_days: int = 0) -> list[tuple]:
+    """
+    Merges days into covering ranges: days with at most `max_gap_days` days between them share a range.
+
+    :param days: days to cover.
+    :type days: Iterable[date]
+    :param max_gap_days: max count of not needed days between days of the same range.
+    :type max_gap_days: int
+    :return: list of (start date, end date) tuples of ranges.
+    :rtype: list[tuple]
+    """
+    ranges: list[tuple] = []
+    for day in sorted(set(days)):
+        if ranges and (day - ranges[-1][1]).days - 1 <= max_gap_days:
+            ranges[-1] = (ranges[-1][0], day)
+        else:
+            ranges.append((day, day))
+    return ranges
+
+
+class StatisticsCache:
+    """
+    This class is cache of usage statistics items (StatisticItemSchema) by user and day.
+
+    Statistics of closed days (older than settle days before today) can't change anymore, so they are kept forever,
+    while recent days are always requested again. Request for a range needs only its missing sub-ranges, and total is
+    recomputed from items. Closed days without item in response are remembered too. Least recently used users are
+    evicted when cache exceeds max users. Cache is safe for threads and coroutines.
+    """
+
+    def __init__(self, settle_days: int = 1, max_users: int = 1024):
+        """
+        Init StatisticsCache class
+
+        :param settle_days: count of days before today, which are still open (to cover time zone of the server).
+        :type settle_days: int
+        :param max_users: max count of cached users (of all API keys).
+        :type max_users: int
+
+        Raises:
+            ValueError: If settle days are negative or max users isn't positive.
+        """
+        if settle_days < 0:
+            raise ValueError("Settle days mustn't be negative!")
+        if max_users <= 0:
+            raise ValueError("Max users must be positive!")
+        self.settle_days = settle_days
+        self.max_users = max_users
+        self.__days: OrderedDict[tuple[Hashable, int], dict[date, Optional[dict]]] = OrderedDict()
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        """
+        Returns count of cached days (of all users).
+
+        :return: count of cached days.
+        :rtype: int
+        """
+        with self.__lock:
+            return sum(len(days) for days in self.__days.values())
+
+    def is_closed(self, day: date) -> bool:
+        """
+        Checks if statistics of the day can't change anymore.
+
+        :param day: day of statistics.
+        :type day: date
+        :return: True if day is closed, False otherwise.
+        :rtype: bool
+        """
+        return day < datetime.now().date() - timedelta(days=self.settle_days)
+
+    def get_missing_ranges(self, key: Hashable, user_id: int, start_date: date, end_date: date) -> list[tuple]:
+        """
+        Returns sub-ranges of the range, which aren't cached (open days are never cached).
+
+        :param key: key of API (e.g. hash of base API URL and bearer token).
+        :type key: Hashable
+        :param user_id: The id of the user.
+        :type user_id: int
+        :param start_date: start date of the range.
+        :type start_date: date
+        :param end_date: end date of the range (inclusive).
+        :type end_date: date
+        :return: list of (start date, end date) tuples of missing sub-ranges.
+        :rtype: list[tuple]
+        """
+        with self.__lock:
+            days = self.__days.get((key, user_id), {})
+        ranges: list[tuple] = []
+        day = start_date
+        while day <= end_date:
+            if day not in days:
+                if ranges and ranges[-1][1] == day - timedelta(days=1):
+                    ranges[-1] = (ranges[-1][0], day)
+                else:
+                    ranges.append((day, day))
+            day += timedelta(days=1)
+        return ranges
+
+    def get_items(self, key: Hashable, user_id: int, start_date: date, end_date: date) -> dict[date, Optional[dict]]:
+        """
+        Returns cached items of the range and marks user as recently used.
+
+        :param key: key of API.
+        :type key: Hashable
+        :param user_id: The id of the user.
+        :type user_id: int
+        :param start_date: start date of the range.
+        :type start_date: date
+        :param end_date: end date of the range (inclusive).
+        :type end_date: date
+        :return: copies of items (StatisticItemSchema) by day, None for closed days without item.
+        :rtype: dict[date, dict | None]
+        """
+        with self.__lock:
+            days = self.__days.get((key, user_id))
+            if days is None:
+                return {}
+            self.__days.move_to_end((key, user_id))
+            return {
+                day: dict(item) if item is not None else None
+                for day, item in days.items()
+                if start_date <= day <= end_date
+            }
+
+    def update(self, key: Hashable, user_id: int, start_date: date, end_date: date, items: list[dict]) -> None:
+        """
+        Caches items of closed days of the requested range.
+
+        :param key: key of API.
+        :type key: Hashable
+        :param user_id: The id of the user.
+        :type user_id: int
+        :param start_date: start date of the requested range.
+        :type start_date: date
+        :param end_date: end date of the requested range (inclusive).
+        :type end_date: date
+        :param items: items (StatisticItemSchema) of the response.
+        :type items: list[dict]
+        """
+        received: dict[date, dict] = {}
+        for item in items:
+            try:
+                received[date.fromisoformat(str(item["date"]))] = dict(item)
+            except (KeyError, TypeError, ValueError):
+                continue
+        closed: dict[date, Optional[dict]] = {}
+        day = start_date
+        while day <= end_date and self.is_closed(day):
+            closed[day] = received.get(day)
+            day += timedelta(days=1)
+        if not closed:
+            return
+        with self.__lock:
+            self.__days.setdefault((key, user_id), {}).update(closed)
+            self.__days.move_to_end((key, user_id))
+            while len(self.__days) > self.max_users:
+                self.__days.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all cached statistics."""
+        with self.__lock:
+            self.__days.clear()
+
+    @staticmethod
+    def get_total(items: list[dict]) -> dict[str, int]:
+        """
+        Computes total statistics of items.
+
+        :param items: items (StatisticItemSchema).
+        :type items: list[dict]
+        :return: total statistics (StatisticTotalSchema).
+        :rtype: dict[str, int]
+        """
+        return {field: sum(item.get(field, 0) for item in items) for field in STATISTIC_FIELDS}
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: statistics_frame.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file contains columnar frame of usage statistics on NumPy arrays (numpy and pandas are optional dependencies).
+"""
+
+from typing import Any, Iterable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .statistics_cache import STATISTIC_FIELDS
+
+PERIODS = ("day", "week", "month")
+
+
+class StatisticsFrame:
+    """
+    This class is columnar frame of usage statistics: int64 counters (as columns of one 2D array) and datetime64 dates.
+
+    Rows are sorted by date (many rows of the same date are allowed, e.g. of many users), operations are vectorized
+    over all counters at once. Columns are views of the array, so they must not be modified.
+    """
+
+    def __init__(self, dates: Any, values: Any):
+        """
+        Init StatisticsFrame class
+
+        :param dates: dates of rows (datetime64[D] array or anything convertible to it).
+        :type dates: numpy.ndarray
+        :param values: counters of rows in order of STATISTIC_FIELDS (int64 array of shape (rows, counters)).
+        :type values: numpy.ndarray
+
+        Raises:
+            ImportError: If numpy isn't installed.
+            ValueError: If shapes of dates and values don't match.
+        """
+        if np is None:
+            raise ImportError("StatisticsFrame requires numpy, install it with: pip install ablt_python_api[numpy]")
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        values = np.asarray(values, dtype=np.int64).reshape(-1, len(STATISTIC_FIELDS))
+        if dates.shape != (values.shape[0],):
+            raise ValueError("Dates and values must have the same count of rows!")
+        order = np.argsort(dates, kind="stable")
+        if np.any(order != np.arange(len(order))):
+            dates, values = dates[order], values[order]
+        self.dates = dates
+        self.values = values
+
+    @classmethod
+    def from_items(cls, items: Iterable[dict]) -> "StatisticsFrame":
+        """
+        Builds frame from statistics items.
+
+        :param items: items (StatisticItemSchema).
+        :type items: Iterable[dict]
+        :return: frame.
+        :rtype: StatisticsFrame
+        """
+        items = list(items)
+        dates = [str(item["date"]) for item in items]
+        values = [[item.get(field, 0) for field in STATISTIC_FIELDS] for item in items]
+        return cls(dates, values)
+
+    @classmethod
+    def from_statistics(cls, statistics: dict) -> "StatisticsFrame":
+        """
+        Builds frame from usage statistics.
+
+        :param statistics: usage statistics (StatisticsSchema).
+        :type statistics: dict
+        :return: frame.
+        :rtype: StatisticsFrame
+        """
+        return cls.from_items(statistics.get("items", []))
+
+    @classmethod
+    def concatenate(cls, frames: Iterable["StatisticsFrame"]) -> "StatisticsFrame":
+        """
+        Joins rows of frames (e.g. of many users).
+
+        :param frames: frames.
+        :type frames: Iterable[StatisticsFrame]
+        :return: frame with rows of all frames.
+        :rtype: StatisticsFrame
+        """
+        frames = list(frames)
+        if not frames:
+            return cls([], [])
+        return cls(
+            np.concatenate([frame.dates for frame in frames]), np.concatenate([frame.values for frame in frames])
+        )
+
+    def __len__(self) -> int:
+        """
+        Returns count of rows.
+
+        :return: count of rows.
+        :rtype: int
+        """
+        return len(self.dates)
+
+    def __getitem__(self, field: str) -> Any:
+        """
+        Returns column of counter.
+
+        :param field: name of counter (e.g. total_tokens).
+        :type field: str
+        :return: int64 column (view).
+        :rtype: numpy.ndarray
+
+        Raises:
+            KeyError: If counter is unknown.
+        """
+        if field not in STATISTIC_FIELDS:
+            raise KeyError(field)
+        return self.values[:, STATISTIC_FIELDS.index(field)]
+
+    def __repr__(self) -> str:
+        """
+        Returns string representation of the frame.
+
+        :return: string representation.
+        :rtype: str
+        """
+        if not self.dates.size:
+            return "StatisticsFrame(rows=0)"
+        return f"StatisticsFrame(rows={len(self)}, dates={self.dates[0]}..{self.dates[-1]})"
+
+    def sum(self) -> dict[str, int]:
+        """
+        Computes total statistics.
+
+        :return: total statistics (StatisticTotalSchema).
+        :rtype: dict[str, int]
+        """
+        return dict(zip(STATISTIC_FIELDS, self.values.sum(axis=0).tolist()))
+
+    def percentile(self, q: float) -> dict[str, float]:
+        """
+        Computes percentile of each counter over rows.
+
+        :param q: percentile, from 0 to 100.
+        :type q: float
+        :return: percentile by counter, NaN for empty frame.
+        :rtype: dict[str, float]
+        """
+        if not self.dates.size:
+            return dict.fromkeys(STATISTIC_FIELDS, float("nan"))
+        return dict(zip(STATISTIC_FIELDS, np.percentile(self.values, q, axis=0).tolist()))
+
+    def rolling_sum(self, window: int) -> "StatisticsFrame":
+        """
+        Computes sums of counters over sliding window of rows (days, if there is a row per day).
+
+        :param window: count of rows in window.
+        :type window: int
+        :return: frame with sums of windows, dated by the last row of window.
+        :rtype: StatisticsFrame
+
+        Raises:
+            ValueError: If window isn't positive.
+        """
+        if window <= 0:
+            raise ValueError("Window must be positive!")
+        if len(self) < window:
+            return StatisticsFrame([], [])
+        cumulative = np.cumsum(self.values, axis=0)
+        first = window - 1
+        sums = cumulative[first:].copy()
+        sums[1:] -= cumulative[:-window]
+        return StatisticsFrame(self.dates[first:], sums)
+
+    def group_by(self, period: str = "week") -> "StatisticsFrame":
+        """
+        Sums counters by day, week (starting on Monday) or month.
+
+        :param period: "day", "week" or "month".
+        :type period: str
+        :return: frame with a row per period, dated by the first day of period.
+        :rtype: StatisticsFrame
+
+        Raises:
+            ValueError: If period is unknown.
+        """
+        if period not in PERIODS:
+            raise ValueError(f"Period must be one of {PERIODS}!")
+        if not self.dates.size:
+            return StatisticsFrame([], [])
+        if period == "day":
+            keys = self.dates
+        elif period == "week":
+            days = self.dates.astype(np.int64)
+            # 1970-01-01 is Thursday, so Monday of the week is 3 days before it
+            keys = (days - (days + 3) % 7).astype("datetime64[D]")
+        else:
+            keys = self.dates.astype("datetime64[M]").astype("datetime64[D]")
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        return StatisticsFrame(keys[starts], np.add.reduceat(self.values, starts, axis=0))
+
+    def to_pandas(self, copy: bool = False) -> Any:
+        """
+        Converts frame to pandas DataFrame indexed by date, counters share memory with the frame unless copied.
+
+        :param copy: copy counters instead of sharing them.
+        :type copy: bool
+        :return: DataFrame with a column per counter.
+        :rtype: pandas.DataFrame
+
+        Raises:
+            ImportError: If pandas isn't installed.
+        """
+        try:
+            import pandas as pd  # pylint: disable=C0415
+        except ImportError as error:
+            raise ImportError(
+                "to_pandas requires pandas, install it with: pip install ablt_python_api[pandas]"
+            ) from error
+        return pd.DataFrame(
+            self.values, index=pd.DatetimeIndex(self.dates, name="date"), columns=STATISTIC_FIELDS, copy=copy
+        )
+
+    def to_items(self) -> list[dict]:
+        """
+        Converts frame to statistics items.
+
+        :return: items (StatisticItemSchema).
+        :rtype: list[dict]
+        """
+        return [
+            {**dict(zip(STATISTIC_FIELDS, row)), "date": str(day)}
+            for day, row in zip(self.dates.tolist(), self.values.tolist())
+        ]
+
+    def copy(self) -> "StatisticsFrame":
+        """
+        Returns copy of the frame.
+
+        :return: frame which doesn't share memory with this one.
+        :rtype: StatisticsFrame
+        """
+        return StatisticsFrame(self.dates.copy(), self.values.copy())
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: timeouts.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file contains per-phase timeouts for aBLT chat requests.
+"""
+
+from time import monotonic
+from typing import Optional
+
+
+class ChatTimeout:
+    """This class describes chat timeouts: connect, time to the first chunk, idle between chunks and total deadline."""
+
+    def __init__(
+        self,
+        connect: Optional[float] = None,
+        first_chunk: Optional[float] = None,
+        idle: Optional[float] = None,
+        total: Optional[float] = None,
+    ):
+        """
+        Initializes chat timeouts, None means no limit for the phase.
+
+        :param connect: max time (in seconds) to establish connection.
+        :type connect: float
+        :param first_chunk: max time (in seconds) from sending the request to the first chunk (or response headers).
+        :type first_chunk: float
+        :param idle: max time (in seconds) between two chunks of the streaming response.
+        :type idle: float
+        :param total: max time (in seconds) for the whole chat call, including retries.
+        :type total: float
+        """
+        self.connect = connect
+        self.first_chunk = first_chunk
+        self.idle = idle
+        self.total = total
+
+    def is_set(self) -> bool:
+        """
+        Checks whether any timeout is set.
+
+        :return: True if any timeout is set, otherwise False.
+        :rtype: bool
+        """
+        return any(value is not None for value in (self.connect, self.first_chunk, self.idle, self.total))
+
+    def get_wait(self, started: float, phase_started: float, phase: str) -> tuple[Optional[float], str]:
+        """
+        Returns how long to wait for the next piece of data and which timeout fires if it doesn't come.
+
+        :param started: monotonic time when the chat call was started.
+        :type started: float
+        :param phase_started: monotonic time when the current phase was started.
+        :type phase_started: float
+        :param phase: current phase: 'first_chunk' or 'idle'.
+        :type phase: str
+        :return: time to wait (None means forever) and name of the timeout.
+        :rtype: tuple
+        """
+        now = monotonic()
+        limit = self.first_chunk if phase == "first_chunk" else self.idle
+        if limit is not None:
+            limit = max(0.0, limit - (now - phase_started))
+        if self.total is not None:
+            remaining = max(0.0, self.total - (now - started))
+            if limit is None or remaining <= limit:
+                return remaining, "total"
+        return limit, phase
+
+    def can_retry(self, started: float, delay: float) -> bool:
+        """
+        Checks whether the retry after delay still fits into first chunk and total deadlines.
+
+        :param started: monotonic time when the chat call was started.
+        :type started: float
+        :param delay: delay (in seconds) before the retry.
+        :type delay: float
+        :return: True if retry makes sense, otherwise False.
+        :rtype: bool
+        """
+        elapsed = monotonic() - started + delay
+        return all(limit is None or elapsed < limit for limit in (self.first_chunk, self.total))
@@ -5,17 +5,19 @@ Author: Iliya Vereshchagin
 Copyright (c) 2023 aBLT.ai. All rights reserved.
 
 Created: 06.11.2023
-Last Modified: 20.11.2023
+Last Modified: 17.10.2026
 
 Description:
 This file tests for async bots.
 """
 
+import asyncio
 from random import choice
 from secrets import token_hex
 
 import pytest
 
+from src.ablt_python_api.ablt_api_async import ABLTApi
 from src.ablt_python_api.schemas import BotSchema
 from tests.test_data import ensured_bots, KEY_LENGTH
 
@@ -124,3 +126,77 @@ async def test_async_bots_name_not_exist(api):
     """
     bot_by_name = await api.find_bot_by_name(bot_name=choice(("", token_hex(KEY_LENGTH))))
     assert bot_by_name is None
+
+
+@pytest.mark.asyncio
+async def test_async_bots_coalesced(api):
+    """
+    This method tests for async bots: concurrent calls are coalesced.
+
+    :param api: api fixture
+    """
+    results = await asyncio.gather(*[api.get_bots() for _ in range(10)])
+    assert len(results[0]) > 0
+    assert all(bots is results[0] for bots in results)
+
+
+@pytest.mark.asyncio
+async def test_async_bots_find_bots_by_name(api):
+    """
+    This method tests for async bots: find bots by name.
+
+    :param api: api fixture
+    """
+    bots = await api.get_bots()
+    any_bot = choice(bots)
+    bots_by_name = await api.find_bots_by_name(bot_name=any_bot["name"])
+    assert any_bot in bots_by_name
+    assert all(bot["name"] == any_bot["name"] for bot in bots_by_name)
+    assert await api.find_bots_by_name(bot_name=token_hex(KEY_LENGTH)) == []
+
+
+@pytest.mark.asyncio
+async def test_async_bots_refresh_bots(api):
+    """
+    This method tests for async bots: refresh bots.
+
+    :param api: api fixture
+    """
+    assert await api.refresh_bots()
+    any_bot = choice(await api.get_bots())
+    assert await api.find_bot_by_slug(bot_slug=any_bot["slug"]) == any_bot
+
+
+@pytest.mark.asyncio
+async def test_async_bots_stale_while_revalidate(api):
+    """
+    This method tests for async bots: stale catalog is served while it's refreshed in background.
+
+    :param api: api fixture
+    """
+    swr_api = ABLTApi(bearer_token=api.get_bearer_token(), bots_ttl=0, bots_hard_ttl=None)
+    any_bot = choice(await swr_api.get_bots())
+    for _ in range(3):
+        assert await swr_api.find_bot_by_slug(bot_slug=any_bot["slug"]) == any_bot
+        await asyncio.sleep(1)
+    await swr_api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_bots_cache_file(api, tmp_path):
+    """
+    This method tests for async bots: bot catalog is saved to cache file and loaded from it.
+
+    :param api: api fixture
+    :param tmp_path: tmp_path pytest fixture
+    """
+    cache_path = tmp_path / "bots.json"
+    first_api = ABLTApi(bearer_token=api.get_bearer_token(), bots_cache_path=str(cache_path))
+    assert await first_api.refresh_bots()
+    any_bot = choice(await first_api.get_bots())
+    await first_api.aclose()
+    assert cache_path.exists()
+    second_api = ABLTApi(bearer_token=api.get_bearer_token(), bots_cache_path=str(cache_path), startup_check="skip")
+    assert await second_api.find_bot_by_uid(bot_uid=any_bot["uid"]) == any_bot
+    await second_api.aclose()
+    assert [path.name for path in tmp_path.iterdir()] == ["bots.json"]
@@ -5,18 +5,23 @@ Author: Iliya Vereshchagin
 Copyright (c) 2023 aBLT.ai. All rights reserved.
 
 Created: 03.11.2023
-Last Modified: 16.11.2023
+Last Modified: 17.10.2026
 
 Description:
 This file tests for async chats (non-streaming mode).
 """
+
 # pylint: disable=R0801
+import asyncio
 from logging import ERROR
 from random import choice, randint
 
 import pytest
 
+from src.ablt_python_api.ablt_api_async import ABLTApi
 from src.ablt_python_api.schemas import BotSchema, StatisticsSchema
+from src.ablt_python_api.utils.concurrency import AdaptiveConcurrencyLimiter
+from src.ablt_python_api.utils.response_cache import ResponseCache, SQLiteResponseCache
 from tests.test_data import (
     sample_questions,
     sample_messages,
@@ -260,3 +265,67 @@ async def test_async_chats_not_stream_use_search(api):
     :param api: api fixture (returns ABLTApi instance)
     """
     return api  # TBD
+
+
+@pytest.mark.asyncio
+async def test_async_chats_not_stream_concurrency_limiter(api):
+    """
+    This method tests for async chat with adaptive concurrency limiter
+
+    :param api: api fixture (returns ABLTApi instance)
+    """
+    bot = choice([BotSchema.model_validate(bot_dict) for bot_dict in await api.get_bots()])
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+    limited_api = ABLTApi(bearer_token=api.get_bearer_token(), concurrency_limiter=limiter)
+
+    async def get_response():
+        return [
+            message
+            async for message in limited_api.chat(
+                bot_uid=bot.uid, prompt=choice(sample_questions), max_words=MIN_WORDS, stream=False
+            )
+        ]
+
+    responses = await asyncio.gather(*[get_response() for _ in range(4)])
+    assert all(len(response) == 1 for response in responses)
+    assert limiter.in_flight == 0
+    assert limiter.limit >= limiter.min_limit
+
+
+@pytest.mark.asyncio
+async def test_async_chats_not_stream_response_cache(api):
+    """
+    This method tests for async chat with response cache
+
+    :param api: api fixture (returns ABLTApi instance)
+    """
+    bot = choice([BotSchema.model_validate(bot_dict) for bot_dict in await api.get_bots()])
+    cache = ResponseCache(max_entries=10)
+    cached_api = ABLTApi(bearer_token=api.get_bearer_token(), response_cache=cache)
+    prompt = choice(sample_questions)
+    first = await get_full_response(cached_api.chat(bot_uid=bot.uid, prompt=prompt, max_words=MIN_WORDS))
+    second = await get_full_response(cached_api.chat(bot_uid=bot.uid, prompt=prompt, max_words=MIN_WORDS))
+    assert first and first == second
+    assert cache.get_stats()["hits"] == 1 and cache.get_stats()["misses"] == 1
+    await get_full_response(cached_api.chat(bot_uid=bot.uid, prompt=prompt, max_words=MIN_WORDS, bypass_cache=True))
+    assert cache.get_stats()["hits"] == 1 and cache.get_stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_chats_not_stream_shared_response_cache(api, tmp_path):
+    """
+    This method tests for async chat with response cache shared by API instances (as by processes)
+
+    :param api: api fixture (returns ABLTApi instance)
+    :param tmp_path: tmp_path pytest fixture
+    """
+    bot = choice([BotSchema.model_validate(bot_dict) for bot_dict in await api.get_bots()])
+    prompt = choice(sample_questions)
+    with SQLiteResponseCache(str(tmp_path / "responses.db")) as first_cache:
+        first_api = ABLTApi(bearer_token=api.get_bearer_token(), response_cache=first_cache)
+        first = await get_full_response(first_api.chat(bot_uid=bot.uid, prompt=prompt, max_words=MIN_WORDS))
+    with SQLiteResponseCache(str(tmp_path / "responses.db")) as second_cache:
+        second_api = ABLTApi(bearer_token=api.get_bearer_token(), response_cache=second_cache)
+        second = await get_full_response(second_api.chat(bot_uid=bot.uid, prompt=prompt, max_words=MIN_WORDS))
+        assert first and first == second
+        assert second_cache.get_stats()["hits"] == 1 and second_cache.get_stats()["entries"] == 1
@@ -5,7 +5,7 @@ Author: Iliya Vereshchagin
 Copyright (c) 2023 aBLT.ai. All rights reserved.
 
 Created: 03.11.2023
-Last Modified: 05.12.2023
+Last Modified: 17.10.2026
 
 Description:
 This file tests for async constructor.
@@ -95,3 +95,87 @@ def test_async_constructor_default_init_with_incorrect_logger():
     """Test against constructor with incorrect logger."""
     with pytest.raises(AttributeError):
         ABLTApi(bearer_token=token_hex(KEY_LENGTH), logger=token_hex(KEY_LENGTH))
+
+
+@pytest.mark.asyncio
+async def test_async_constructor_context_manager(caplog):
+    """
+    Test against constructor used as async context manager (pooled session).
+
+    :param caplog: caplog pytest fixture
+    """
+    caplog.set_level(INFO)
+    async with ABLTApi(bearer_token=token_hex(KEY_LENGTH)) as api:
+        assert await api.health_check()
+        assert await api.health_check()
+    assert "ABLT chat API is working like a charm" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_async_constructor_aclose():
+    """Test against closing pooled session twice and reusing API after close."""
+    api = ABLTApi(bearer_token=token_hex(KEY_LENGTH))
+    await api.aclose()
+    await api.aclose()
+    assert await api.health_check()
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_constructor_shared_transport():
+    """Test against instances with different tokens sharing one transport."""
+    first_api = ABLTApi(bearer_token=token_hex(KEY_LENGTH), shared_transport=True)
+    second_api = ABLTApi(bearer_token=token_hex(KEY_LENGTH), shared_transport=True)
+    assert first_api.get_transport() is second_api.get_transport()
+    assert first_api.get_bearer_token() != second_api.get_bearer_token()
+    assert await second_api.health_check()
+    await first_api.aclose()
+    assert await second_api.health_check()
+
+
+@pytest.mark.asyncio
+async def test_async_constructor_create(caplog):
+    """
+    Test against async factory with eager health check.
+
+    :param caplog: caplog pytest fixture
+    """
+    caplog.set_level(INFO)
+    api = await ABLTApi.create(bearer_token=token_hex(KEY_LENGTH))
+    assert "ABLT chat API is working like a charm" in caplog.text
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_constructor_create_skip_check(caplog):
+    """
+    Test against async factory without health check.
+
+    :param caplog: caplog pytest fixture
+    """
+    caplog.set_level(INFO)
+    api = await ABLTApi.create(bearer_token=token_hex(KEY_LENGTH), startup_check="skip")
+    assert "ABLT chat API is working like a charm" not in caplog.text
+    assert len(await api.get_bots()) > 0
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_constructor_lazy_check(caplog):
+    """
+    Test against lazy health check, done before the first request.
+
+    :param caplog: caplog pytest fixture
+    """
+    caplog.set_level(INFO)
+    api = ABLTApi(bearer_token=token_hex(KEY_LENGTH), startup_check="lazy")
+    assert "ABLT chat API is working like a charm" not in caplog.text
+    assert len(await api.get_bots()) > 0
+    assert "ABLT chat API is working like a charm" in caplog.text
+    await api.aclose()
+
+
+def test_async_constructor_unknown_startup_check():
+    """Test against constructor with unknown startup check mode."""
+    with pytest.raises(ValueError):
+        ABLTApi(bearer_token=token_hex(KEY_LENGTH), startup_check=token_hex(KEY_LENGTH))
@@ -5,20 +5,25 @@ Author: Iliya Vereshchagin
 Copyright (c) 2023 aBLT.ai. All rights reserved.
 
 Created: 06.11.2023
-Last Modified: 30.01.2024
+Last Modified: 17.10.2026
 
 Description:
 This file tests for async other helper stuff.
 """
 
+import asyncio
 from secrets import token_hex
 
 import pytest
 from aiohttp import client_exceptions
 
 from src.ablt_python_api.ablt_api_async import ABLTApi
-from tests.test_data import KEY_LENGTH
-
+from src.ablt_python_api.utils.circuit_breaker import CircuitBreaker
+from src.ablt_python_api.utils.exceptions import CircuitOpenError
+from src.ablt_python_api.utils.rate_limiter import RateLimiter
+from src.ablt_python_api.utils.retry import RetryPolicy
+from src.ablt_python_api.utils.scheduler import PriorityClass, RequestScheduler
+from tests.test_data import KEY_LENGTH, MIN_WORDS
 
 test_api = ABLTApi(bearer_token=token_hex(KEY_LENGTH))
 
@@ -170,3 +175,71 @@ async def test_async_other_set_logger():
     test_api.set_logger(new_logger=token_hex(KEY_LENGTH))
     with pytest.raises(AttributeError):
         await test_api.health_check()
+
+
+@pytest.mark.asyncio
+async def test_async_other_retry_policy():
+    """This method tests for async other: custom retry policy."""
+    policy = RetryPolicy(max_retries=0)
+    assert not policy.is_retryable("v1/bots")
+    assert RetryPolicy().get_delay(attempt=0, retry_after="3") == 3.0
+    assert RetryPolicy(backoff=1, max_backoff=2).get_delay(attempt=5) <= 2
+    retry_api = ABLTApi(bearer_token=token_hex(KEY_LENGTH), retry_policy=policy)
+    assert len(await retry_api.get_bots()) > 0
+
+
+@pytest.mark.asyncio
+async def test_async_other_circuit_breaker():
+    """This method tests for async other: circuit breaker."""
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    breaker_api = ABLTApi(bearer_token=token_hex(KEY_LENGTH), circuit_breaker=breaker)
+    assert len(await breaker_api.get_bots()) > 0
+    assert breaker.get_state("v1/bots") == "closed"
+    breaker.record_failure("v1/bots")
+    breaker.record_failure("v1/bots")
+    assert breaker.get_state("v1/bots") == "open"
+    with pytest.raises(CircuitOpenError):
+        await breaker_api.get_bots()
+    assert await breaker_api.health_check()
+
+
+@pytest.mark.asyncio
+async def test_async_other_rate_limiter():
+    """This method tests for async other: rate limiter."""
+    limiter = RateLimiter(rate=1, burst=1)
+    assert limiter.reserve("token", "v1/bots") == 0
+    assert limiter.reserve("token", "v1/bots") > 0
+    assert limiter.reserve("other_token", "v1/bots") == 0
+    assert limiter.reserve("token", "health-check") == 0
+    limiter_api = ABLTApi(bearer_token=token_hex(KEY_LENGTH), rate_limiter=RateLimiter(rate=2, burst=2))
+    for _ in range(3):
+        assert len(await limiter_api.get_bots()) > 0
+
+
+@pytest.mark.asyncio
+async def test_async_other_scheduler():
+    """This method tests for async other: request scheduler."""
+    scheduler = RequestScheduler(max_concurrency=1)
+    order = []
+
+    async def schedule(priority, user_id):
+        async with scheduler.slot_async(priority, user_id) as class_name:
+            order.append((class_name, user_id))
+
+    tasks = []
+    async with scheduler.slot_async("batch"):
+        for priority, user_id in (("batch", 1), ("batch", 1), ("batch", 2), ("interactive", 3)):
+            tasks.append(asyncio.create_task(schedule(priority, user_id)))
+            await asyncio.sleep(0)
+        cancelled = asyncio.create_task(schedule("interactive", 4))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+    await asyncio.gather(*tasks)
+    assert order == [("interactive", 3), ("batch", 1), ("batch", 2), ("batch", 1)]
+    assert scheduler.get_stats()["interactive"] == {"queued": 0, "in_flight": 0}
+    scheduler_api = ABLTApi(
+        bearer_token=token_hex(KEY_LENGTH),
+        scheduler=RequestScheduler(classes=[PriorityClass("interactive"), PriorityClass("batch", 1, 1)]),
+    )
+    messages = [message async for message in scheduler_api.chat(bot_slug="omni", prompt="Hi!", max_words=MIN_WORDS)]
+    assert "".join(messages)
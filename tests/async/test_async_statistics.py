@@ -5,7 +5,7 @@ Author: Iliya Vereshchagin
 Copyright (c) 2023 aBLT.ai. All rights reserved.
 
 Created: 06.11.2023
-Last Modified: 17.11.2023
+Last Modified: 17.10.2026
 
 Description:
 This file tests for async bots.
@@ -18,7 +18,10 @@ from secrets import token_hex
 
 import pytest
 
+from src.ablt_python_api.ablt_api_async import ABLTApi
 from src.ablt_python_api.schemas import StatisticsSchema, StatisticItemSchema, StatisticTotalSchema
+from src.ablt_python_api.utils.statistics_cache import StatisticsCache
+from src.ablt_python_api.utils.statistics_frame import StatisticsFrame
 from tests.test_data import (
     LOWER_USER_ID,
     UPPER_USER_ID,
@@ -237,3 +240,91 @@ async def test_async_statistics_wrong_user_id_total(api, caplog):
     response = await api.get_statistics_total(user_id=token_hex(KEY_LENGTH))
     assert response is None
     assert "Error: user_id should be int" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_async_statistics_cache(api, random_date_generator):
+    """
+    This method tests for async statistics: with statistics cache (closed days are requested once)
+
+    :param api: api fixture
+    :param random_date_generator: random_date_generator fixture
+    """
+    user_id = randint(LOWER_USER_ID, UPPER_USER_ID)
+    start_date = random_date_generator(days=DATE_TEST_PERIOD)
+    cache = StatisticsCache()
+    cached_api = ABLTApi(bearer_token=api.get_bearer_token(), statistics_cache=cache)
+    expected = await api.get_usage_statistics(user_id=user_id, start_date=start_date)
+    assert await cached_api.get_usage_statistics(user_id=user_id, start_date=start_date) == expected
+    assert len(cache) >= len(expected["items"]) - 2
+    assert await cached_api.get_usage_statistics(user_id=user_id, start_date=start_date) == expected
+
+
+@pytest.mark.asyncio
+async def test_async_statistics_chunks(api, random_date_generator):
+    """
+    This method tests for async statistics: long range is requested by chunks
+
+    :param api: api fixture
+    :param random_date_generator: random_date_generator fixture
+    """
+    user_id = randint(LOWER_USER_ID, UPPER_USER_ID)
+    start_date = random_date_generator(days=DATE_TEST_PERIOD)
+    chunked_api = ABLTApi(bearer_token=api.get_bearer_token(), statistics_chunk_days=3, statistics_concurrency=2)
+    expected = await api.get_usage_statistics(user_id=user_id, start_date=start_date)
+    assert await chunked_api.get_usage_statistics(user_id=user_id, start_date=start_date) == expected
+
+
+@pytest.mark.asyncio
+async def test_async_statistics_for_days(api, random_date_generator):
+    """
+    This method tests for async statistics: for many days
+
+    :param api: api fixture
+    :param random_date_generator: random_date_generator fixture
+    """
+    user_id = randint(LOWER_USER_ID, UPPER_USER_ID)
+    dates = {random_date_generator(days=DATE_TEST_PERIOD) for _ in range(3)}
+    response = await api.get_statistics_for_days(dates, user_id=user_id)
+    assert sorted(response) == sorted(dates)
+    for date, usage_info in response.items():
+        assert usage_info == await api.get_statistics_for_a_day(date=date, user_id=user_id)
+    response = await api.get_statistics_for_days(dates, user_ids=[user_id, user_id + 1])
+    assert sorted(response) == [user_id, user_id + 1] and sorted(response[user_id]) == sorted(dates)
+
+
+@pytest.mark.asyncio
+async def test_async_statistics_as_frame(api, random_date_generator):
+    """
+    This method tests for async statistics: as columnar frame
+
+    :param api: api fixture
+    :param random_date_generator: random_date_generator fixture
+    """
+    pytest.importorskip("numpy")
+    start_date = random_date_generator(days=DATE_TEST_PERIOD)
+    expected = StatisticsSchema.model_validate(await api.get_usage_statistics(start_date=start_date))
+    response = await api.get_usage_statistics(start_date=start_date, as_frame=True)
+    assert isinstance(response, StatisticsFrame) and len(response) == len(expected.items)
+    assert response.sum() == expected.total.model_dump()
+    assert response.group_by("month").sum() == response.sum()
+    assert response["total_words"].tolist() == [item.total_words for item in expected.items]
+
+
+@pytest.mark.asyncio
+async def test_async_statistics_many(api, random_date_generator):
+    """
+    This method tests for async statistics: for many users
+
+    :param api: api fixture
+    :param random_date_generator: random_date_generator fixture
+    """
+    user_ids = list(range(LOWER_USER_ID, LOWER_USER_ID + 5))
+    start_date = random_date_generator(days=DATE_TEST_PERIOD)
+    response = await api.get_usage_statistics_many(user_ids, start_date=start_date, concurrency=3)
+    assert sorted(response["users"]) == user_ids and not response["failed"]
+    for user_id, statistics in response["users"].items():
+        assert statistics == await api.get_usage_statistics(user_id=user_id, start_date=start_date)
+    assert StatisticTotalSchema.model_validate(response["total"]).total_words == sum(
+        statistics["total"]["total_words"] for statistics in response["users"].values()
+    )
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_sync_batch.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for multi-process batch runner.
+"""
+
+import json
+from random import choice
+
+import pytest
+
+from src.ablt_python_api.batch import run_batch
+from src.ablt_python_api.schemas import BotSchema
+from tests.test_data import sample_questions, MIN_WORDS
+
+
+@pytest.mark.sync
+@pytest.mark.parametrize("ordered", [False, True], ids=["unordered", "ordered"])
+def test_sync_batch(api, tmp_path, ordered):
+    """
+    This method tests for batch runner
+
+    :param api: api fixture (returns ABLTApi instance)
+    :param tmp_path: tmp_path pytest fixture
+    :param ordered: write results in order of requests
+    """
+    bot = choice([BotSchema.model_validate(bot_dict) for bot_dict in api.get_bots()])
+    input_path = tmp_path / "requests.jsonl"
+    output_path = tmp_path / "results.jsonl"
+    lines = [
+        json.dumps({"bot_uid": bot.uid, "prompt": question, "max_words": MIN_WORDS}) for question in sample_questions
+    ]
+    lines.insert(3, "not a json")
+    input_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    summary = run_batch(
+        str(input_path),
+        str(output_path),
+        workers=2,
+        concurrency=2,
+        bearer_token=api.get_bearer_token(),
+        ordered=ordered,
+    )
+    results = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+    assert summary["requests"] == len(lines) and summary["failed"] == 1
+    assert sorted(result["index"] for result in results) == list(range(len(lines)))
+    if ordered:
+        assert [result["index"] for result in results] == list(range(len(lines)))
+        assert not results[3]["ok"]
+    assert summary["latency_p50"] <= summary["latency_p99"]
+    assert len(list(tmp_path.iterdir())) == 2  # part files are removed
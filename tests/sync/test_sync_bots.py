@@ -5,17 +5,20 @@ Author: Iliya Vereshchagin
 Copyright (c) 2023 aBLT.ai. All rights reserved.
 
 Created: 20.11.2023
-Last Modified: 20.11.2023
+Last Modified: 17.10.2026
 
 Description:
 This file tests for sync bots.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from random import choice
 from secrets import token_hex
+from time import sleep
 
 import pytest
 
+from src.ablt_python_api.ablt_api_sync import ABLTApi
 from src.ablt_python_api.schemas import BotSchema
 from tests.test_data import ensured_bots, KEY_LENGTH
 
@@ -124,3 +127,76 @@ def test_sync_bots_name_not_exist(api):
     """
     bot_by_name = api.find_bot_by_name(bot_name=choice(("", token_hex(KEY_LENGTH))))
     assert bot_by_name is None
+
+
+@pytest.mark.sync
+def test_sync_bots_coalesced(api):
+    """
+    This method tests for bots: concurrent calls are coalesced.
+
+    :param api: api fixture
+    """
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        results = list(executor.map(lambda _: api.find_bot_by_slug(bot_slug=ensured_bots[0]["slug"]), range(10)))
+    assert results[0] is not None
+    assert all(bot == results[0] for bot in results)
+
+
+@pytest.mark.sync
+def test_sync_bots_find_bots_by_name(api):
+    """
+    This method tests for bots: find bots by name.
+
+    :param api: api fixture
+    """
+    bots = api.get_bots()
+    any_bot = choice(bots)
+    bots_by_name = api.find_bots_by_name(bot_name=any_bot["name"])
+    assert any_bot in bots_by_name
+    assert all(bot["name"] == any_bot["name"] for bot in bots_by_name)
+    assert api.find_bots_by_name(bot_name=token_hex(KEY_LENGTH)) == []
+
+
+@pytest.mark.sync
+def test_sync_bots_refresh_bots(api):
+    """
+    This method tests for bots: refresh bots.
+
+    :param api: api fixture
+    """
+    assert api.refresh_bots()
+    any_bot = choice(api.get_bots())
+    assert api.find_bot_by_slug(bot_slug=any_bot["slug"]) == any_bot
+
+
+@pytest.mark.sync
+def test_sync_bots_stale_while_revalidate(api):
+    """
+    This method tests for bots: stale catalog is served while it's refreshed in background.
+
+    :param api: api fixture
+    """
+    swr_api = ABLTApi(bearer_token=api.get_bearer_token(), bots_ttl=0, bots_hard_ttl=None)
+    any_bot = choice(swr_api.get_bots())
+    for _ in range(3):
+        assert swr_api.find_bot_by_slug(bot_slug=any_bot["slug"]) == any_bot
+        sleep(1)
+    swr_api.close()
+
+
+@pytest.mark.sync
+def test_sync_bots_cache_file(api, tmp_path):
+    """
+    This method tests for bots: bot catalog is saved to cache file and loaded from it.
+
+    :param api: api fixture
+    :param tmp_path: tmp_path pytest fixture
+    """
+    cache_path = tmp_path / "bots.json"
+    with ABLTApi(bearer_token=api.get_bearer_token(), bots_cache_path=str(cache_path)) as first_api:
+        assert first_api.refresh_bots()
+        any_bot = choice(first_api.get_bots())
+    assert cache_path.exists()
+    with ABLTApi(bearer_token=api.get_bearer_token(), bots_cache_path=str(cache_path)) as second_api:
+        assert second_api.find_bot_by_uid(bot_uid=any_bot["uid"]) == any_bot
+    assert [path.name for path in tmp_path.iterdir()] == ["bots.json"]
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_sync_chats_many.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for sync bulk chats.
+"""
+
+from random import choice
+
+import pytest
+
+from src.ablt_python_api.schemas import BotSchema
+from tests.test_data import sample_questions, MIN_WORDS
+
+
+@pytest.mark.sync
+@pytest.mark.parametrize("stream", [False, True], ids=["not_stream", "stream"])
+def test_sync_chats_many(api, stream):
+    """
+    This method tests for sync bulk chats
+
+    :param api: api fixture (returns ABLTApi instance)
+    :param stream: streaming mode
+    """
+    bot = choice([BotSchema.model_validate(bot_dict) for bot_dict in api.get_bots()])
+    requests = [
+        {"bot_uid": bot.uid, "prompt": question, "max_words": MIN_WORDS, "stream": stream}
+        for question in sample_questions[:5]
+    ]
+    results = list(api.chat_many(requests, concurrency=3))
+    assert sorted(result.index for result in results) == list(range(len(requests)))
+    assert all(result.ok and result.response for result in results)
+
+
+@pytest.mark.sync
+def test_sync_chats_many_ordered_with_errors(api):
+    """
+    This method tests for sync bulk chats in order, with failed requests
+
+    :param api: api fixture (returns ABLTApi instance)
+    """
+    bot = choice([BotSchema.model_validate(bot_dict) for bot_dict in api.get_bots()])
+    requests = [
+        {"bot_uid": bot.uid, "prompt": choice(sample_questions), "max_words": MIN_WORDS, "stream": False},
+        {"prompt": choice(sample_questions), "stream": False},
+        {"bot_uid": bot.uid, "unknown_param": True},
+        {"bot_uid": bot.uid, "prompt": choice(sample_questions), "max_words": MIN_WORDS, "stream": False},
+    ]
+    results = list(api.chat_many(requests, concurrency=2, ordered=True))
+    assert [result.index for result in results] == list(range(len(requests)))
+    assert [result.ok for result in results] == [True, False, False, True]
+    assert results[1].error is None and results[1].response is None
+    assert isinstance(results[2].error, TypeError)
+
+
+@pytest.mark.sync
+def test_sync_chats_many_close(api):
+    """
+    This method tests for sync bulk chats stopped by caller
+
+    :param api: api fixture (returns ABLTApi instance)
+    """
+    bot = choice([BotSchema.model_validate(bot_dict) for bot_dict in api.get_bots()])
+    requests = ({"bot_uid": bot.uid, "prompt": question, "stream": True} for question in sample_questions)
+    results = api.chat_many(requests, concurrency=2)
+    for result in results:
+        assert result.index >= 0
+        break
+    results.close()
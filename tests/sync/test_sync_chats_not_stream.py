@@ -5,7 +5,7 @@ Author: Iliya Vereshchagin
 Copyright (c) 2023 aBLT.ai. All rights reserved.
 
 Created: 20.11.2023
-Last Modified: 20.11.2023
+Last Modified: 17.10.2026
 
 Description:
 This file tests for sync chats (non-streaming mode).
@@ -16,7 +16,9 @@ from random import choice, randint
 
 import pytest
 
+from src.ablt_python_api.ablt_api_sync import ABLTApi
 from src.ablt_python_api.schemas import BotSchema, StatisticsSchema
+from src.ablt_python_api.utils.response_cache import ResponseCache, SQLiteResponseCache
 from tests.test_data import (
     sample_questions,
     sample_messages,
@@ -256,3 +258,42 @@ def test_sync_chats_not_stream_use_search(api):
     :param api: api fixture (returns ABLTApi instance)
     """
     return api  # TBD
+
+
+@pytest.mark.sync
+def test_sync_chats_not_stream_response_cache(api):
+    """
+    This method tests for sync chat with response cache
+
+    :param api: api fixture (returns ABLTApi instance)
+    """
+    bot = choice([BotSchema.model_validate(bot_dict) for bot_dict in api.get_bots()])
+    cache = ResponseCache(max_entries=10)
+    cached_api = ABLTApi(bearer_token=api.get_bearer_token(), response_cache=cache)
+    prompt = choice(sample_questions)
+    first = get_full_response(cached_api.chat(bot_uid=bot.uid, prompt=prompt, max_words=MIN_WORDS))
+    second = get_full_response(cached_api.chat(bot_uid=bot.uid, prompt=prompt, max_words=MIN_WORDS))
+    assert first and first == second
+    assert cache.get_stats()["hits"] == 1 and cache.get_stats()["misses"] == 1
+    get_full_response(cached_api.chat(bot_uid=bot.uid, prompt=prompt, max_words=MIN_WORDS, bypass_cache=True))
+    assert cache.get_stats()["hits"] == 1 and cache.get_stats()["misses"] == 1
+
+
+@pytest.mark.sync
+def test_sync_chats_not_stream_shared_response_cache(api, tmp_path):
+    """
+    This method tests for sync chat with response cache shared by API instances (as by processes)
+
+    :param api: api fixture (returns ABLTApi instance)
+    :param tmp_path: tmp_path pytest fixture
+    """
+    bot = choice([BotSchema.model_validate(bot_dict) for bot_dict in api.get_bots()])
+    prompt = choice(sample_questions)
+    with SQLiteResponseCache(str(tmp_path / "responses.db")) as first_cache:
+        first_api = ABLTApi(bearer_token=api.get_bearer_token(), response_cache=first_cache)
+        first = get_full_response(first_api.chat(bot_uid=bot.uid, prompt=prompt, max_words=MIN_WORDS))
+    with SQLiteResponseCache(str(tmp_path / "responses.db")) as second_cache:
+        second_api = ABLTApi(bearer_token=api.get_bearer_token(), response_cache=second_cache)
+        second = get_full_response(second_api.chat(bot_uid=bot.uid, prompt=prompt, max_words=MIN_WORDS))
+        assert first and first == second
+        assert second_cache.get_stats()["hits"] == 1 and second_cache.get_stats()["entries"] == 1
@@ -5,7 +5,7 @@ Author: Iliya Vereshchagin
 Copyright (c) 2023 aBLT.ai. All rights reserved.
 
 Created: 20.11.2023
-Last Modified: 20.11.2023
+Last Modified: 17.10.2026
 
 Description:
 This file tests for sync chats (streaming mode).
@@ -17,7 +17,8 @@ from random import choice, randint
 import pytest
 
 from src.ablt_python_api.schemas import BotSchema, StatisticsSchema
-from src.ablt_python_api.utils.exceptions import DoneException
+from src.ablt_python_api.utils.exceptions import ChatTimeoutError, DoneException
+from src.ablt_python_api.utils.timeouts import ChatTimeout
 from tests.test_data import (
     sample_questions,
     sample_messages,
@@ -250,3 +251,35 @@ def test_sync_chats_stream_use_search(api):
     :param api: api fixture (returns ABLTApi instance)
     """
     return api  # TBD
+
+
+@pytest.mark.sync
+def test_sync_chats_stream_with_timeouts(api):
+    """
+    This method tests for sync chat with generous per-phase timeouts
+
+    :param api: api fixture (returns ABLTApi instance)
+    """
+    bot = choice([BotSchema.model_validate(bot_dict) for bot_dict in api.get_bots()])
+    timeout = ChatTimeout(connect=10, first_chunk=60, idle=30, total=120)
+    sync_generator = api.chat(
+        bot_slug=bot.slug, prompt=choice(sample_questions), max_words=MIN_WORDS, stream=True, timeout=timeout
+    )
+    response = get_full_response(sync_generator)
+    assert response is not None
+
+
+@pytest.mark.sync
+def test_sync_chats_stream_total_timeout_exceeded(api):
+    """
+    This method tests for sync chat exceeding total timeout
+
+    :param api: api fixture (returns ABLTApi instance)
+    """
+    bot = choice([BotSchema.model_validate(bot_dict) for bot_dict in api.get_bots()])
+    sync_generator = api.chat(
+        bot_slug=bot.slug, prompt=choice(sample_questions), stream=True, timeout=ChatTimeout(total=0.001)
+    )
+    with pytest.raises(ChatTimeoutError) as error:
+        get_full_response(sync_generator)
+    assert error.value.phase == "total"
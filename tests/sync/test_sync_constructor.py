@@ -5,7 +5,7 @@ Author: Iliya Vereshchagin
 Copyright (c) 2023 aBLT.ai. All rights reserved.
 
 Created: 20.11.2023
-Last Modified: 05.12.2023
+Last Modified: 17.10.2026
 
 Description:
 This file tests for sync constructor.
@@ -104,3 +104,45 @@ def test_sync_constructor_default_init_with_incorrect_logger():
             bearer_token=token_hex(KEY_LENGTH),
             logger=token_hex(KEY_LENGTH),
         )
+
+
+@pytest.mark.sync
+def test_sync_constructor_context_manager(caplog):
+    """
+    Test against constructor used as context manager (pooled session).
+
+    :param caplog: caplog pytest fixture
+    """
+    caplog.set_level(INFO)
+    with ABLTApi(bearer_token=token_hex(KEY_LENGTH), pool_maxsize=2) as api:
+        assert api.health_check()
+        assert api.health_check()
+    assert "ABLT chat API is working like a charm" in caplog.text
+
+
+@pytest.mark.sync
+def test_sync_constructor_close():
+    """Test against closing pooled session twice and reusing API after close."""
+    api = ABLTApi(bearer_token=token_hex(KEY_LENGTH))
+    api.close()
+    api.close()
+    assert api.health_check()
+    api.close()
+
+
+@pytest.mark.sync
+def test_sync_constructor_shared_transport(caplog):
+    """
+    Test against instances with different tokens sharing one transport.
+
+    :param caplog: caplog pytest fixture
+    """
+    caplog.set_level(INFO)
+    first_api = ABLTApi(bearer_token=token_hex(KEY_LENGTH), shared_transport=True)
+    caplog.clear()
+    second_api = ABLTApi(bearer_token=token_hex(KEY_LENGTH), shared_transport=True)
+    assert "ABLT chat API is working like a charm" not in caplog.text
+    assert first_api.get_transport() is second_api.get_transport()
+    assert first_api.get_bearer_token() != second_api.get_bearer_token()
+    first_api.close()
+    assert second_api.health_check()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_sync_job_queue.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for durable job queue drained by sync API.
+"""
+
+from random import choice
+
+import pytest
+
+from src.ablt_python_api.job_queue import ChatJobQueue
+from src.ablt_python_api.schemas import BotSchema
+from tests.test_data import sample_questions, MIN_WORDS
+
+
+@pytest.mark.sync
+def test_sync_job_queue_drain(api, tmp_path):
+    """
+    This method tests for durable job queue drained by sync API
+
+    :param api: api fixture (returns ABLTApi instance)
+    :param tmp_path: tmp_path pytest fixture
+    """
+    bot = choice([BotSchema.model_validate(bot_dict) for bot_dict in api.get_bots()])
+    requests = [
+        {"bot_uid": bot.uid, "prompt": question, "max_words": MIN_WORDS, "stream": False}
+        for question in sample_questions[:4]
+    ]
+    with ChatJobQueue(str(tmp_path / "jobs.db")) as queue:
+        assert queue.add_many(requests) == len(requests)
+        assert queue.add_many(requests) == 0
+        assert queue.add({"bot_uid": bot.uid, "unknown_param": True})
+        counts = queue.drain(api, concurrency=2, max_attempts=2)
+        assert counts == {"pending": 0, "in_flight": 0, "done": len(requests), "failed": 1}
+        assert all(job["response"] for job in queue.results())
+        assert "TypeError" in next(queue.results("failed"))["error"]
+
+
+@pytest.mark.sync
+def test_sync_job_queue_resume(api, tmp_path):
+    """
+    This method tests for durable job queue resumed after crash
+
+    :param api: api fixture (returns ABLTApi instance)
+    :param tmp_path: tmp_path pytest fixture
+    """
+    bot = choice([BotSchema.model_validate(bot_dict) for bot_dict in api.get_bots()])
+    requests = [
+        {"bot_uid": bot.uid, "prompt": question, "max_words": MIN_WORDS, "stream": False}
+        for question in sample_questions[:3]
+    ]
+    with ChatJobQueue(str(tmp_path / "jobs.db")) as queue:
+        queue.add_many(requests)
+        (job_id, _), (crashed_job_id, _) = queue.claim(2)
+        queue.complete(job_id, "checkpointed response")
+        assert queue.counts()["in_flight"] == 1 and crashed_job_id != job_id
+    with ChatJobQueue(str(tmp_path / "jobs.db")) as queue:
+        counts = queue.drain(api, concurrency=2, requeue_in_flight=True)
+        assert counts["done"] == len(requests)
+        assert next(queue.results())["response"] == "checkpointed response"
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: conftest.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file contains pytest fixtures for offline unit tests: stub aBLT API server on loopback and fake clock.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import date, timedelta
+from threading import Event, Thread
+from typing import Optional
+
+import pytest
+from aiohttp import web
+
+STUB_BOTS = [
+    {
+        "uid": "uid-1",
+        "slug": "omni",
+        "model": "gpt-4",
+        "name": "Omni",
+        "description": "Omni bot",
+        "welcome_message": "Hi",
+        "avatar_url": None,
+    },
+    {
+        "uid": "uid-2",
+        "slug": "eco",
+        "model": "gpt-4",
+        "name": "Eco",
+        "description": "Eco bot",
+        "welcome_message": "Hi",
+        "avatar_url": None,
+    },
+]
+STUB_ETAG = '"bots-v1"'
+STUB_FIELDS = (
+    "original_tokens",
+    "enchancement_tokens",
+    "response_tokens",
+    "total_tokens",
+    "original_words",
+    "enchancement_words",
+    "response_words",
+    "total_words",
+)
+
+
+class StubServer:  # pylint: disable=R0902
+    """This class is stub of aBLT API served on loopback (no network access is needed)."""
+
+    def __init__(self):
+        """Init StubServer class"""
+        self.url = ""
+        self.calls: dict = {}
+        self.statistics_ranges: list = []
+        self.failures = 0
+        self.failure_status = 400
+        self.failure_headers: dict = {}
+        self.extra_items: list = []
+        self.chat_delays: dict = {}
+        self.stream_stalls: dict = {}
+        self.__loop = asyncio.new_event_loop()
+        self.__runner = None
+        self.__thread = Thread(target=self.__loop.run_forever, name="stub-server", daemon=True)
+
+    def reset(self) -> None:
+        """Resets counters and failures."""
+        self.calls.clear()
+        self.statistics_ranges.clear()
+        self.failures = 0
+        self.failure_status = 400
+        self.failure_headers = {}
+        self.extra_items.clear()
+        self.chat_delays.clear()
+        self.stream_stalls.clear()
+
+    def start(self) -> None:
+        """Starts the server in background thread."""
+        self.__thread.start()
+        started = Event()
+
+        async def serve() -> None:
+            """Starts the server on free port."""
+            app = web.Application()
+            app.add_routes(
+                [
+                    web.get("/health-check", self.__health),
+                    web.get("/v1/bots", self.__bots),
+                    web.post("/v1/chat", self.__chat),
+                    web.post("/v1/user/usage-statistics", self.__statistics),
+                ]
+            )
+            self.__runner = web.AppRunner(app)
+            await self.__runner.setup()
+            site = web.TCPSite(self.__runner, "127.0.0.1", 0)
+            await site.start()
+            self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"  # pylint: disable=W0212
+            started.set()
+
+        asyncio.run_coroutine_threadsafe(serve(), self.__loop).result()
+        started.wait()
+
+    def stop(self) -> None:
+        """Stops the server."""
+        asyncio.run_coroutine_threadsafe(self.__runner.cleanup(), self.__loop).result()
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+        self.__loop.close()
+
+    def __count(self, name: str) -> Optional[web.Response]:
+        """
+        Counts the call and returns failure response, if failures are requested.
+
+        :param name: name of the endpoint.
+        :type name: str
+        :return: failure response or None.
+        :rtype: Optional[web.Response]
+        """
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if self.failures > 0:
+            self.failures -= 1
+            return web.json_response(
+                {"detail": "stub failure"}, status=self.failure_status, headers=self.failure_headers
+            )
+        return None
+
+    async def __health(self, _request: web.Request) -> web.Response:
+        """Serves health check."""
+        return self.__count("health") or web.json_response({"status": "ok"})
+
+    async def __bots(self, request: web.Request) -> web.Response:
+        """Serves bot list with ETag."""
+        failure = self.__count("bots")
+        if failure is not None:
+            return failure
+        if request.headers.get("If-None-Match") == STUB_ETAG:
+            return web.Response(status=304, headers={"ETag": STUB_ETAG})
+        return web.json_response(STUB_BOTS, headers={"ETag": STUB_ETAG})
+
+    async def __chat(self, request: web.Request) -> web.StreamResponse:
+        """Serves chat, the response echoes bearer token and prompt (and is delayed, if delay of prompt is set)."""
+        failure = self.__count("chat")
+        if failure is not None:
+            return failure
+        payload = await request.json()
+        await asyncio.sleep(self.chat_delays.get(payload.get("prompt"), 0))
+        token = request.headers.get("Authorization", "").split(" ")[-1]
+        if payload.get("stream"):
+            return await self.__chat_stream(request, [f"{token}: ", str(payload.get("prompt"))])
+        return web.json_response({"content": f"{token}: {payload.get('prompt')}"})
+
+    async def __chat_stream(self, request: web.Request, chunks: list) -> web.StreamResponse:
+        """
+        Serves streaming chat: chunks are sent as server-sent events, stalled before chunk if stall of chunk is set.
+
+        :param request: chat request.
+        :type request: web.Request
+        :param chunks: content of chunks.
+        :type chunks: list
+        :return: streaming response.
+        :rtype: web.StreamResponse
+        """
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        events = [f"data: {json.dumps({'content': chunk})}\n\n" for chunk in chunks] + ["data: [DONE]\n\n"]
+        try:
+            for index, event in enumerate(events):
+                await asyncio.sleep(self.stream_stalls.get(index, 0))
+                await response.write(event.encode())
+            await response.write_eof()
+        except ConnectionResetError:
+            pass  # client has given up on stalled stream
+        return response
+
+    async def __statistics(self, request: web.Request) -> web.Response:
+        """Serves usage statistics: counters of a day are derived from the day and user id."""
+        failure = self.__count("statistics")
+        if failure is not None:
+            return failure
+        payload = await request.json()
+        self.statistics_ranges.append((payload["start_date"], payload["end_date"]))
+        day, end = date.fromisoformat(payload["start_date"]), date.fromisoformat(payload["end_date"])
+        items = []
+        while day <= end:
+            count = (day.toordinal() + payload["user_id"]) % 7
+            items.append(
+                {
+                    "original_tokens": count,
+                    "enchancement_tokens": count,
+                    "response_tokens": count,
+                    "total_tokens": 3 * count,
+                    "original_words": count,
+                    "enchancement_words": count,
+                    "response_words": count,
+                    "total_words": 3 * count,
+                    "date": day.isoformat(),
+                }
+            )
+            day += timedelta(days=1)
+        total = {field: sum(item[field] for item in items) for field in STUB_FIELDS}
+        items.extend(self.extra_items)
+        return web.Response(text=json.dumps({"total": total, "items": items}), content_type="application/json")
+
+
+class FakeClock:
+    """This class is fake monotonic clock, which is moved by tests (and by sleep)."""
+
+    def __init__(self, now: float = 1000.0):
+        """
+        Init FakeClock class
+
+        :param now: initial time.
+        :type now: float
+        """
+        self.now = now
+
+    def __call__(self) -> float:
+        """
+        Returns current time.
+
+        :return: current time.
+        :rtype: float
+        """
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """
+        Moves the clock.
+
+        :param seconds: seconds to move.
+        :type seconds: float
+        """
+        self.now += seconds
+
+
+@pytest.fixture(scope="session")
+def stub_server():
+    """
+    This fixture returns stub aBLT API server (on loopback) for the whole session.
+
+    :return: StubServer instance
+    :rtype: StubServer
+    """
+    server = StubServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture()
+def stub(stub_server):
+    """
+    This fixture returns stub server with reset counters.
+
+    :param stub_server: stub_server fixture
+    :return: StubServer instance
+    :rtype: StubServer
+    """
+    stub_server.reset()
+    return stub_server
+
+
+@pytest.fixture()
+def logger():
+    """
+    This fixture returns logger for API instances, so tests don't write log files.
+
+    :return: logger
+    :rtype: logging.Logger
+    """
+    return logging.getLogger("ablt-unit-tests")
+
+
+@pytest.fixture()
+def fake_clock():
+    """
+    This fixture returns fake monotonic clock.
+
+    :return: FakeClock instance
+    :rtype: FakeClock
+    """
+    return FakeClock()
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_unit_batch.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for bounded batch helpers and their results (offline).
+"""
+
+import asyncio
+
+import pytest
+
+from src.ablt_python_api.ablt_api_async import ABLTApi as ABLTApiAsync
+from src.ablt_python_api.ablt_api_sync import ABLTApi
+from src.ablt_python_api.utils.batch import BatchResult, ChatResult, iter_bounded, iter_bounded_threaded
+
+
+def fail_odd(request: dict) -> int:
+    """
+    Returns value of request, raises for odd ones.
+
+    :param request: request.
+    :type request: dict
+    :return: value of request.
+    :rtype: int
+    """
+    if request["value"] % 2:
+        raise ValueError(request["value"])
+    return request["value"]
+
+
+def test_unit_iter_bounded_threaded():
+    """This method tests for ordered threaded batch with per-item error isolation"""
+    results = list(
+        iter_bounded_threaded(lambda request, _: fail_odd(request), ({"value": i} for i in range(6)), 3, True)
+    )
+    assert [result.index for result in results] == list(range(6))
+    assert all(isinstance(result, ChatResult) for result in results)
+    assert [result.ok for result in results] == [True, False] * 3
+    assert isinstance(results[1].error, ValueError)
+    with pytest.raises(ValueError):
+        list(iter_bounded_threaded(fail_odd, [], 0))
+
+
+@pytest.mark.asyncio
+async def test_unit_iter_bounded():
+    """This method tests for async batch with bounded concurrency and custom result type"""
+    in_flight, peak = 0, 0
+
+    async def run(request: dict) -> int:
+        """Tracks requests in flight."""
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return fail_odd(request)
+
+    results = [
+        result async for result in iter_bounded(run, ({"value": i} for i in range(10)), 3, result_type=BatchResult)
+    ]
+    assert peak <= 3 and sorted(result.index for result in results) == list(range(10))
+    assert all(type(result) is BatchResult for result in results)  # pylint: disable=C0123
+    assert sum(result.ok for result in results) == 5
+
+
+def test_unit_sync_statistics_many_results(stub, logger):
+    """
+    This method tests for sync statistics of many users, which are yielded as BatchResult
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    api = ABLTApi(bearer_token="token", base_api_url=stub.url, logger=logger)
+    results = list(api.iter_usage_statistics_many([1, 2, 3], "2024-01-01", "2024-01-02", ordered=True))
+    assert [result.request["user_id"] for result in results] == [1, 2, 3]
+    assert all(type(result) is BatchResult and result.ok for result in results)  # pylint: disable=C0123
+    assert all(len(result.response["items"]) == 2 for result in results)
+    assert repr(results[0]).startswith("BatchResult(index=0, ok=True")
+
+
+@pytest.mark.asyncio
+async def test_unit_async_statistics_many_results(stub, logger):
+    """
+    This method tests for async statistics of many users, which are yielded as BatchResult
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    api = ABLTApiAsync(bearer_token="token", base_api_url=stub.url, logger=logger, startup_check="skip")
+    results = [result async for result in api.iter_usage_statistics_many([1, 2, 3], "2024-01-01", "2024-01-02")]
+    assert sorted(result.request["user_id"] for result in results) == [1, 2, 3]
+    assert all(type(result) is BatchResult and result.ok for result in results)  # pylint: disable=C0123
+    statistics = await api.get_usage_statistics_many([1, 2], "2024-01-01", "2024-01-02")
+    assert sorted(statistics["users"]) == [1, 2] and statistics["failed"] == []
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_unit_async_chat_many_ordered_window(stub, logger):
+    """
+    This method tests for async ordered chat_many, which doesn't run far ahead of stalled request
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    api = ABLTApiAsync(bearer_token="token", base_api_url=stub.url, logger=logger, startup_check="skip")
+    stub.chat_delays["Question 0"] = 0.5
+    requests = [{"bot_uid": "uid-1", "prompt": f"Question {index}"} for index in range(50)]
+    results = api.chat_many(requests, concurrency=4, ordered=True)
+    first = asyncio.create_task(results.__anext__())
+    await asyncio.sleep(0.3)
+    # Only requests within the window (stalled one and 3 after it) are sent, so at most 3 results are buffered
+    assert not first.done() and stub.calls["chat"] == 4
+    assert (await first).index == 0
+    assert [result.index async for result in results] == list(range(1, 50))
+    assert stub.calls["chat"] == 50
+    await api.aclose()
+
+
+def test_unit_sync_chat_many_ordered_window(stub, logger):
+    """
+    This method tests for sync ordered chat_many, which doesn't run far ahead of slow first request
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    api = ABLTApi(bearer_token="token", base_api_url=stub.url, logger=logger)
+    stub.chat_delays["Question 0"] = 0.5
+    requests = [{"bot_uid": "uid-1", "prompt": f"Question {index}"} for index in range(50)]
+    results = api.chat_many(requests, concurrency=4, ordered=True)
+    first = next(results)
+    # Only requests within the window were sent before the slow one has completed
+    assert first.index == 0 and first.latency >= 0.5 and stub.calls["chat"] == 4
+    assert [result.index for result in results] == list(range(1, 50))
+    assert stub.calls["chat"] == 50
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_unit_batch_runner.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for multi-process batch runner (offline).
+"""
+
+import json
+
+import pytest
+
+from src.ablt_python_api.batch import run_batch
+
+
+@pytest.mark.parametrize("ordered", [False, True], ids=["unordered", "ordered"])
+def test_unit_batch_runner_stalled_request(stub, tmp_path, ordered):
+    """
+    This method tests for batch runner, which writes results of a stalled request's shard without waiting for it
+
+    :param stub: stub fixture (returns StubServer)
+    :param tmp_path: tmp_path fixture
+    :param ordered: write results in order of requests
+    """
+    input_path = tmp_path / "requests.jsonl"
+    output_path = tmp_path / "results.jsonl"
+    lines = [json.dumps({"bot_uid": "uid-1", "prompt": f"Question {index}", "stream": False}) for index in range(20)]
+    lines.insert(3, "not a json")
+    input_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    stub.chat_delays["Question 0"] = 0.5
+    summary = run_batch(
+        str(input_path),
+        str(output_path),
+        workers=2,
+        concurrency=2,
+        bearer_token="token",
+        base_api_url=stub.url,
+        ordered=ordered,
+    )
+    results = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+    assert summary["requests"] == len(lines) and summary["failed"] == 1
+    assert sorted(result["index"] for result in results) == list(range(len(lines)))
+    if ordered:
+        assert [result["index"] for result in results] == list(range(len(lines)))
+        assert not results[3]["ok"] and results[4]["response"] == "token: Question 3"
+    else:
+        # Stalled request is written last in its shard, results after it aren't held back
+        shard = [result["index"] for result in results if result["index"] % 2 == 0]
+        assert shard[-1] == 0 and sorted(shard[:-1]) == list(range(2, len(lines), 2))
+    assert len(list(tmp_path.iterdir())) == 2  # part files are removed
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_unit_bot_catalog.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for bot catalog and its refresh (offline).
+"""
+
+import pytest
+
+from src.ablt_python_api.ablt_api_async import ABLTApi as ABLTApiAsync
+from src.ablt_python_api.ablt_api_sync import ABLTApi
+from src.ablt_python_api.utils.bot_catalog import BotCatalog
+from tests.unit.conftest import STUB_BOTS
+
+
+def test_unit_bot_catalog_ttl(fake_clock, monkeypatch):
+    """
+    This method tests for soft and hard TTL and indexes of bot catalog
+
+    :param fake_clock: fake_clock fixture
+    :param monkeypatch: monkeypatch fixture
+    """
+    monkeypatch.setattr("src.ablt_python_api.utils.bot_catalog.monotonic", fake_clock)
+    catalog = BotCatalog(ttl=10, hard_ttl=100)
+    assert not catalog.is_usable()
+    catalog.update(STUB_BOTS, etag='"v1"')
+    assert catalog.is_fresh() and catalog.get_validators() == {"If-None-Match": '"v1"'}
+    assert catalog.get_by_slug("eco")["uid"] == "uid-2" and catalog.get_by_uid("uid-3") is None
+    assert [bot["uid"] for bot in catalog.get_by_name("Omni")] == ["uid-1"]
+    fake_clock.advance(11)
+    assert not catalog.is_fresh() and catalog.is_usable()
+    catalog.touch()
+    assert catalog.is_fresh()
+    fake_clock.advance(101)
+    assert not catalog.is_usable()
+
+
+def test_unit_bot_catalog_file(tmp_path):
+    """
+    This method tests for cache file of bot catalog, which is ignored for another API key
+
+    :param tmp_path: tmp_path fixture
+    """
+    path = str(tmp_path / "bots.json")
+    catalog = BotCatalog(path=path, key="key")
+    catalog.update(STUB_BOTS, etag='"v1"')
+    catalog.save()
+    assert BotCatalog(path=path, key="key").get_bots() == STUB_BOTS
+    assert not BotCatalog(path=path, key="other").is_loaded()
+
+
+def test_unit_sync_refresh_bots(stub, logger):
+    """
+    This method tests for sync refresh of bots, which reports failures explicitly
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    api = ABLTApi(bearer_token="token", base_api_url=stub.url, logger=logger)
+    assert api.refresh_bots() is True
+    # Revalidation by ETag returns 304, catalog is kept
+    assert api.refresh_bots() is True
+    assert api.find_bot_by_slug("eco")["uid"] == "uid-2"
+    stub.failures = 100
+    assert api.refresh_bots() is False
+    assert api.get_bots() == []
+    stub.failures = 0
+    assert api.find_bot_by_uid("uid-1")["slug"] == "omni"
+
+
+@pytest.mark.asyncio
+async def test_unit_async_refresh_bots(stub, logger):
+    """
+    This method tests for async refresh of bots, which reports failures explicitly
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    api = ABLTApiAsync(bearer_token="token", base_api_url=stub.url, logger=logger, startup_check="skip")
+    assert await api.refresh_bots() is True
+    assert await api.refresh_bots() is True
+    assert (await api.find_bot_by_slug("eco"))["uid"] == "uid-2"
+    stub.failures = 100
+    assert await api.refresh_bots() is False
+    assert await api.get_bots() == []
+    stub.failures = 0
+    assert (await api.find_bot_by_uid("uid-1"))["slug"] == "omni"
+    await api.aclose()
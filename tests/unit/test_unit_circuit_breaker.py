@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_unit_circuit_breaker.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for circuit breaker (offline).
+"""
+
+import pytest
+
+from src.ablt_python_api.ablt_api_sync import ABLTApi
+from src.ablt_python_api.utils.circuit_breaker import CircuitBreaker
+from src.ablt_python_api.utils.exceptions import CircuitOpenError
+from src.ablt_python_api.utils.retry import RetryPolicy
+
+
+@pytest.fixture()
+def breaker_clock(fake_clock, monkeypatch):
+    """
+    This fixture returns fake clock of circuit breaker.
+
+    :param fake_clock: fake_clock fixture
+    :param monkeypatch: monkeypatch fixture
+    :return: FakeClock instance
+    :rtype: FakeClock
+    """
+    monkeypatch.setattr("src.ablt_python_api.utils.circuit_breaker.monotonic", fake_clock)
+    return fake_clock
+
+
+def test_unit_circuit_breaker_consecutive_failures(breaker_clock):
+    """
+    This method tests for circuit, which is opened by consecutive failures and closed by successful probe
+
+    :param breaker_clock: breaker_clock fixture
+    """
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30.0)
+    for _ in range(2):
+        assert breaker.acquire("v1/chat") is False
+        breaker.record_failure("v1/chat")
+    breaker.record_success("v1/chat")
+    for _ in range(3):
+        breaker.record_failure("v1/chat")
+    assert breaker.get_state("v1/chat") == "open" and breaker.get_state("v1/bots") == "closed"
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire("v1/chat")
+    assert breaker.acquire("health-check") is False
+    breaker_clock.advance(31)
+    # Only one caller probes recovery, others fail fast until the probe is done
+    assert breaker.acquire("v1/chat") is True and breaker.get_state("v1/chat") == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire("v1/chat")
+    breaker.record_success("v1/chat")
+    assert breaker.get_state("v1/chat") == "closed" and breaker.acquire("v1/chat") is False
+
+
+def test_unit_circuit_breaker_failed_probe(breaker_clock):
+    """
+    This method tests for circuit, which is opened again by failed probe or replaces stuck probe
+
+    :param breaker_clock: breaker_clock fixture
+    """
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0)
+    breaker.record_failure("v1/bots")
+    breaker_clock.advance(11)
+    assert breaker.acquire("v1/bots") is True
+    breaker.record_failure("v1/bots")
+    assert breaker.get_state("v1/bots") == "open"
+    breaker_clock.advance(11)
+    assert breaker.acquire("v1/bots") is True
+    breaker_clock.advance(11)
+    assert breaker.acquire("v1/bots") is True
+
+
+def test_unit_circuit_breaker_error_rate():
+    """This method tests for circuit, which is opened by error rate in the window of outcomes"""
+    breaker = CircuitBreaker(failure_threshold=100, error_rate_threshold=0.75, window_size=4, min_calls=4)
+    for _ in range(3):
+        breaker.record_failure("v1/chat")
+        breaker.record_success("v1/chat")
+    breaker.record_failure("v1/chat")
+    assert breaker.get_state("v1/chat") == "closed"
+    breaker.record_failure("v1/chat")
+    assert breaker.get_state("v1/chat") == "open"
+    assert breaker.is_failure_status(503) and not breaker.is_failure_status(429)
+
+
+def test_unit_sync_circuit_breaker(stub, logger, breaker_clock):
+    """
+    This method tests for sync requests, which fail fast while circuit is open and probe recovery with health check
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    :param breaker_clock: breaker_clock fixture
+    """
+    api = ABLTApi(
+        bearer_token="token",
+        base_api_url=stub.url,
+        logger=logger,
+        retry_policy=RetryPolicy(max_retries=0),
+        circuit_breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=30.0),
+    )
+    stub.failures, stub.failure_status = 2, 503
+    for _ in range(2):
+        assert not list(api.chat(bot_uid="uid-1", prompt="Hello"))
+    with pytest.raises(CircuitOpenError):
+        list(api.chat(bot_uid="uid-1", prompt="Hello"))
+    assert stub.calls["chat"] == 2
+    breaker_clock.advance(31)
+    assert list(api.chat(bot_uid="uid-1", prompt="Hello")) == ["token: Hello"]
+    assert stub.calls["chat"] == 3 and stub.calls["health"] == 2
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_unit_concurrency.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for adaptive (AIMD) concurrency limiter (offline).
+"""
+
+import asyncio
+
+import pytest
+
+from src.ablt_python_api.utils.concurrency import AdaptiveConcurrencyLimiter
+
+
+@pytest.fixture()
+def limiter_clock(fake_clock, monkeypatch):
+    """
+    This fixture returns fake clock of concurrency limiter.
+
+    :param fake_clock: fake_clock fixture
+    :param monkeypatch: monkeypatch fixture
+    :return: FakeClock instance
+    :rtype: FakeClock
+    """
+    monkeypatch.setattr("src.ablt_python_api.utils.concurrency.monotonic", fake_clock)
+    return fake_clock
+
+
+@pytest.mark.asyncio
+async def test_unit_concurrency_additive_increase():
+    """This method tests for limit, which grows by one per limit of successful requests while it's reached"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3)
+    await limiter.acquire()
+    # Idle limiter has no evidence of spare capacity
+    limiter.release(latency=1.0)
+    assert limiter.limit == 2
+    for _ in range(2):
+        await limiter.acquire()
+    for _ in range(3):
+        limiter.release(latency=1.0)
+        await limiter.acquire()
+    assert limiter.limit == 3 and limiter.in_flight == 2
+    for _ in range(10):
+        await limiter.acquire()
+        limiter.release(latency=1.0)
+    assert limiter.limit == 3
+
+
+@pytest.mark.asyncio
+async def test_unit_concurrency_multiplicative_decrease(limiter_clock):
+    """
+    This method tests for limit, which is cut on overload once per cooldown, but not below min limit
+
+    :param limiter_clock: limiter_clock fixture
+    """
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=3, decrease_factor=0.5, cooldown=1.0)
+    for _ in range(3):
+        await limiter.acquire()
+    limiter.release(overloaded=True)
+    limiter.release(overloaded=True)
+    assert limiter.limit == 4
+    limiter_clock.advance(1)
+    limiter.release(overloaded=True)
+    assert limiter.limit == 3 and limiter.in_flight == 0
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(initial_limit=1, min_limit=2)
+
+
+@pytest.mark.usefixtures("limiter_clock")
+@pytest.mark.asyncio
+async def test_unit_concurrency_latency_rise():
+    """This method tests for limit, which is cut when short-term latency rises above long-term one"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, decrease_factor=0.5, latency_tolerance=1.5)
+    for _ in range(5):
+        await limiter.acquire()
+        limiter.release(latency=1.0)
+    assert limiter.limit == 10
+    await limiter.acquire()
+    limiter.release(latency=10.0)
+    assert limiter.limit == 5
+
+
+@pytest.mark.usefixtures("limiter_clock")
+@pytest.mark.asyncio
+async def test_unit_concurrency_waiters():
+    """This method tests for waiters, which get free slots in order of arrival, and timeouts treated as overload"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=1, decrease_factor=0.5)
+    order = []
+
+    async def request(index: int) -> None:
+        """Takes a slot, records the order and holds the slot for a while."""
+        async with limiter.slot() as sample:
+            order.append(index)
+            await asyncio.sleep(0.01)
+            sample.mark_first_chunk()
+
+    await asyncio.gather(*(request(index) for index in range(6)))
+    assert order == list(range(6)) and limiter.in_flight == 0
+    with pytest.raises(asyncio.TimeoutError):
+        async with limiter.slot():
+            raise asyncio.TimeoutError()
+    assert limiter.limit == 1
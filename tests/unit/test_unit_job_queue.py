@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_unit_job_queue.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for durable job queue (offline).
+"""
+
+from threading import get_ident
+
+import pytest
+
+from src.ablt_python_api.ablt_api_async import ABLTApi as ABLTApiAsync
+from src.ablt_python_api.ablt_api_sync import ABLTApi
+from src.ablt_python_api.job_queue import ChatJobQueue
+
+REQUESTS = [{"bot_uid": "uid-1", "prompt": f"Question {index}", "stream": False} for index in range(5)]
+
+
+def test_unit_job_queue_claim_and_lease(tmp_path, fake_clock, monkeypatch):
+    """
+    This method tests for claims, leases, checkpoints and attempts of job queue
+
+    :param tmp_path: tmp_path fixture
+    :param fake_clock: fake_clock fixture
+    :param monkeypatch: monkeypatch fixture
+    """
+    monkeypatch.setattr("src.ablt_python_api.job_queue.time", fake_clock)
+    with ChatJobQueue(str(tmp_path / "jobs.db"), lease_timeout=60) as queue:
+        assert queue.add_many(REQUESTS) == len(REQUESTS)
+        assert queue.add(REQUESTS[0]) is False
+        (first, _), (second, _) = queue.claim(2)
+        queue.complete(first, "response")
+        queue.fail(second, "error", max_attempts=1)
+        assert queue.counts() == {"pending": 3, "in_flight": 0, "done": 1, "failed": 1}
+        (crashed, _), *_ = queue.claim(3)
+        assert queue.claim(1) == []
+        fake_clock.advance(61)
+        assert [job_id for job_id, _ in queue.claim(1)] == [crashed]
+        assert queue.retry_failed() == 1
+        assert queue.requeue_in_flight() == 3
+        assert queue.counts()["pending"] == 4
+
+
+def test_unit_sync_job_queue_drain(stub, logger, tmp_path):
+    """
+    This method tests for sync drain of job queue, which doesn't requeue in-flight jobs by default
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    :param tmp_path: tmp_path fixture
+    """
+    api = ABLTApi(bearer_token="token", base_api_url=stub.url, logger=logger)
+    with ChatJobQueue(str(tmp_path / "jobs.db")) as queue:
+        queue.add_many(REQUESTS)
+        (job_id, _), *_ = queue.claim(1)
+        counts = queue.drain(api, concurrency=2)
+        assert counts == {"pending": 0, "in_flight": 1, "done": len(REQUESTS) - 1, "failed": 0}
+        counts = queue.drain(api, concurrency=2, requeue_in_flight=True)
+        assert counts["done"] == len(REQUESTS)
+        assert {job["id"]: job["response"] for job in queue.results()}[job_id] == "token: Question 0"
+    assert stub.calls["chat"] == len(REQUESTS)
+
+
+@pytest.mark.asyncio
+async def test_unit_async_job_queue_drain(stub, logger, tmp_path):
+    """
+    This method tests for async drain of job queue with retries of failed attempts
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    :param tmp_path: tmp_path fixture
+    """
+    api = ABLTApiAsync(bearer_token="token", base_api_url=stub.url, logger=logger, startup_check="skip")
+    stub.failures = 2
+    with ChatJobQueue(str(tmp_path / "jobs.db")) as queue:
+        queue.add_many(REQUESTS)
+        (job_id, _), *_ = queue.claim(1)
+        counts = await queue.drain_async(api, concurrency=2, max_attempts=3)
+        assert counts == {"pending": 0, "in_flight": 1, "done": len(REQUESTS) - 1, "failed": 0}
+        counts = await queue.drain_async(api, concurrency=2, requeue_in_flight=True)
+        assert counts["done"] == len(REQUESTS)
+        assert {job["id"]: job["response"] for job in queue.results()}[job_id] == "token: Question 0"
+    assert stub.calls["chat"] == len(REQUESTS) + 2
+
+
+@pytest.mark.asyncio
+async def test_unit_async_job_queue_drain_off_loop(stub, logger, tmp_path, monkeypatch):
+    """
+    This method tests for database calls of async drain, which mustn't run in thread of the event loop
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    :param tmp_path: tmp_path fixture
+    :param monkeypatch: monkeypatch fixture
+    """
+    api = ABLTApiAsync(bearer_token="token", base_api_url=stub.url, logger=logger, startup_check="skip")
+    threads = set()
+    with ChatJobQueue(str(tmp_path / "jobs.db")) as queue:
+        for name in ("claim", "complete", "counts", "requeue_in_flight"):
+            method = getattr(queue, name)
+            monkeypatch.setattr(
+                queue, name, lambda *args, method=method, **kwargs: threads.add(get_ident()) or method(*args, **kwargs)
+            )
+        queue.add_many(REQUESTS)
+        threads.clear()
+        counts = await queue.drain_async(api, concurrency=2, requeue_in_flight=True)
+    assert counts["done"] == len(REQUESTS)
+    assert threads and get_ident() not in threads
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_unit_rate_limiter.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for token bucket rate limiter (offline).
+"""
+
+import pytest
+
+from src.ablt_python_api.utils.rate_limiter import RateLimiter
+
+
+@pytest.fixture()
+def limiter_clock(fake_clock, monkeypatch):
+    """
+    This fixture returns fake clock of rate limiter, sleep of rate limiter moves it.
+
+    :param fake_clock: fake_clock fixture
+    :param monkeypatch: monkeypatch fixture
+    :return: FakeClock instance
+    :rtype: FakeClock
+    """
+    monkeypatch.setattr("src.ablt_python_api.utils.rate_limiter.monotonic", fake_clock)
+    monkeypatch.setattr("src.ablt_python_api.utils.rate_limiter.sleep", fake_clock.advance)
+    return fake_clock
+
+
+def test_unit_rate_limiter_token_bucket(limiter_clock):
+    """
+    This method tests for token bucket: burst is spent at once, then requests are paced by rate in order of arrival
+
+    :param limiter_clock: limiter_clock fixture
+    """
+    limiter = RateLimiter(rate=2.0, burst=2)
+    assert [limiter.reserve("token", "v1/chat") for _ in range(5)] == [0.0, 0.0, 0.5, 1.0, 1.5]
+    limiter_clock.advance(1.5)
+    assert limiter.reserve("token", "v1/chat") == 0.5
+    # Idle period refills the bucket up to burst only
+    limiter_clock.advance(100)
+    assert [limiter.reserve("token", "v1/chat") for _ in range(3)] == [0.0, 0.0, 0.5]
+    assert limiter.reserve("token", "health-check") == 0.0
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+
+
+@pytest.mark.usefixtures("limiter_clock")
+def test_unit_rate_limiter_buckets():
+    """This method tests for separate buckets per bearer token and endpoint, and weighted costs"""
+    limiter = RateLimiter(rate=1.0, burst=1, per_endpoint=True)
+    assert limiter.reserve("first", "v1/chat") == 0.0
+    assert limiter.reserve("second", "v1/chat") == 0.0
+    assert limiter.reserve("first", "v1/bots") == 0.0
+    assert limiter.reserve("first", "v1/chat") == 1.0
+    shared = RateLimiter(rate=1.0, burst=1, per_token=False)
+    assert shared.reserve("first", "v1/chat") == 0.0 and shared.reserve("second", "v1/bots") == 1.0
+    weighted = RateLimiter(rate=10.0, burst=10, weighted=True)
+    assert weighted.reserve("token", "v1/chat", 30) == 2.0
+    assert RateLimiter(rate=10.0, burst=10).reserve("token", "v1/chat", 30) == 0.0
+
+
+def test_unit_rate_limiter_acquire(limiter_clock):
+    """
+    This method tests for sync acquire, which sleeps until the request may be sent
+
+    :param limiter_clock: limiter_clock fixture
+    """
+    limiter = RateLimiter(rate=4.0, burst=1)
+    for _ in range(5):
+        limiter.acquire("token", "v1/chat")
+    assert limiter_clock() == pytest.approx(1001.0)
+
+
+@pytest.mark.asyncio
+async def test_unit_rate_limiter_acquire_async(limiter_clock, monkeypatch):
+    """
+    This method tests for async acquire, which waits until the request may be sent
+
+    :param limiter_clock: limiter_clock fixture
+    :param monkeypatch: monkeypatch fixture
+    """
+    delays = []
+
+    async def sleep(delay: float) -> None:
+        """Records the delay and moves the clock instead of waiting."""
+        delays.append(delay)
+        limiter_clock.advance(delay)
+
+    monkeypatch.setattr("src.ablt_python_api.utils.rate_limiter.asyncio.sleep", sleep)
+    limiter = RateLimiter(rate=2.0, burst=1)
+    for _ in range(3):
+        await limiter.acquire_async("token", "v1/chat")
+    assert delays == [0.5, 0.5]
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_unit_response_cache.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for response caches (offline).
+"""
+
+import sqlite3
+
+import pytest
+
+from src.ablt_python_api.ablt_api_async import ABLTApi as ABLTApiAsync
+from src.ablt_python_api.ablt_api_sync import ABLTApi
+from src.ablt_python_api.utils.response_cache import ResponseCache, SQLiteResponseCache
+
+
+def test_unit_response_cache_key_namespace():
+    """This method tests for namespacing of response cache keys"""
+    payload = {"bot_uid": "uid-1", "prompt": "Hello"}
+    assert ResponseCache.get_key(payload, "a") == ResponseCache.get_key(dict(reversed(payload.items())), "a")
+    assert ResponseCache.get_key(payload, "a") != ResponseCache.get_key(payload, "b")
+    assert ResponseCache.get_key(payload) != ResponseCache.get_key(payload, "a")
+
+
+def test_unit_response_cache_lru_and_ttl(fake_clock, monkeypatch):
+    """
+    This method tests for LRU eviction and TTL of response cache
+
+    :param fake_clock: fake_clock fixture
+    :param monkeypatch: monkeypatch fixture
+    """
+    monkeypatch.setattr("src.ablt_python_api.utils.response_cache.monotonic", fake_clock)
+    cache = ResponseCache(max_entries=2, max_size=None, ttl=10)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    fake_clock.advance(11)
+    assert cache.get("a") is None
+    assert cache.get_stats()["entries"] == 1
+
+
+def test_unit_response_cache_size_limit():
+    """This method tests for size limit of response cache"""
+    cache = ResponseCache(max_entries=10, max_size=10)
+    cache.set("a", "12345")
+    cache.set("b", "12345")
+    cache.set("c", "1")
+    assert cache.get("a") is None
+    assert cache.get_stats()["size"] == 6
+    cache.set("d", "x" * 11)
+    assert cache.get("d") is None
+
+
+def test_unit_sync_response_cache_tenants(stub, logger):
+    """
+    This method tests for sync response cache shared by two API keys
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    cache = ResponseCache()
+    first = ABLTApi(bearer_token="first", base_api_url=stub.url, logger=logger, response_cache=cache)
+    second = ABLTApi(bearer_token="second", base_api_url=stub.url, logger=logger, response_cache=cache)
+    assert list(first.chat(bot_uid="uid-1", prompt="Hello")) == ["first: Hello"]
+    assert list(second.chat(bot_uid="uid-1", prompt="Hello")) == ["second: Hello"]
+    assert list(first.chat(bot_uid="uid-1", prompt="Hello")) == ["first: Hello"]
+    assert stub.calls["chat"] == 2
+    assert cache.get_stats()["entries"] == 2
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_unit_async_response_cache_tenants(stub, logger):
+    """
+    This method tests for async response cache shared by two API keys
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    cache = ResponseCache()
+    first = ABLTApiAsync(
+        bearer_token="first", base_api_url=stub.url, logger=logger, response_cache=cache, startup_check="skip"
+    )
+    second = ABLTApiAsync(
+        bearer_token="second", base_api_url=stub.url, logger=logger, response_cache=cache, startup_check="skip"
+    )
+    assert [message async for message in first.chat(bot_uid="uid-1", prompt="Hello")] == ["first: Hello"]
+    assert [message async for message in second.chat(bot_uid="uid-1", prompt="Hello")] == ["second: Hello"]
+    assert stub.calls["chat"] == 2
+    assert cache.get_stats()["entries"] == 2
+    assert cache.hits == 0
+
+
+def test_unit_sqlite_response_cache_schema_version(tmp_path):
+    """
+    This method tests for discarding entries of older schema of SQLite response cache
+
+    :param tmp_path: tmp_path fixture
+    """
+    path = str(tmp_path / "responses.sqlite")
+    connection = sqlite3.connect(path)
+    connection.executescript(
+        "CREATE TABLE entries (key TEXT PRIMARY KEY, response TEXT NOT NULL, size INTEGER NOT NULL, "
+        "expires REAL NOT NULL, accessed REAL NOT NULL);"
+        "INSERT INTO entries VALUES ('blind', 'answer', 6, 1e12, 0);"
+    )
+    connection.close()
+    with SQLiteResponseCache(path) as cache:
+        assert len(cache) == 0
+        assert cache.get("blind") is None
+        cache.set("key", "answer")
+    with SQLiteResponseCache(path) as cache:
+        assert cache.get("key") == "answer"
+        assert cache.get_stats()["entries"] == 1
+
+
+def test_unit_sqlite_response_cache_eviction(tmp_path):
+    """
+    This method tests for LRU eviction of SQLite response cache
+
+    :param tmp_path: tmp_path fixture
+    """
+    with SQLiteResponseCache(str(tmp_path / "responses.sqlite"), max_entries=3, max_size=None) as cache:
+        for index in range(5):
+            cache.set(str(index), "x")
+        assert len(cache) <= 3
+        assert cache.get("4") == "x"
+        assert cache.get("0") is None
+
+
+def test_unit_sync_sqlite_response_cache_tenants(stub, logger, tmp_path):
+    """
+    This method tests for sync SQLite response cache shared by two API keys
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    :param tmp_path: tmp_path fixture
+    """
+    with SQLiteResponseCache(str(tmp_path / "responses.sqlite")) as cache:
+        first = ABLTApi(bearer_token="first", base_api_url=stub.url, logger=logger, response_cache=cache)
+        second = ABLTApi(bearer_token="second", base_api_url=stub.url, logger=logger, response_cache=cache)
+        assert list(first.chat(bot_uid="uid-1", prompt="Hello")) == ["first: Hello"]
+        assert list(second.chat(bot_uid="uid-1", prompt="Hello")) == ["second: Hello"]
+        assert stub.calls["chat"] == 2
+        assert len(cache) == 2
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_unit_retry.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for retry policy and retries of requests (offline).
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from src.ablt_python_api.ablt_api_async import ABLTApi as ABLTApiAsync
+from src.ablt_python_api.ablt_api_sync import ABLTApi
+from src.ablt_python_api.utils.retry import RetryPolicy, parse_retry_after
+
+
+def test_unit_parse_retry_after():
+    """This method tests for parsing of Retry-After header (seconds or HTTP date)"""
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after(None) is None and parse_retry_after("soon") is None
+    retry_date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= parse_retry_after(retry_date) <= 30
+    assert parse_retry_after("Thu, 01 Jan 1970 00:00:00 GMT") == 0.0
+
+
+def test_unit_retry_policy_delays(monkeypatch):
+    """
+    This method tests for delays of retry policy: exponential backoff with full jitter, capped by max backoff
+
+    :param monkeypatch: monkeypatch fixture
+    """
+    monkeypatch.setattr("src.ablt_python_api.utils.retry.random.uniform", lambda low, high: high)
+    policy = RetryPolicy(backoff=0.5, max_backoff=3.0)
+    assert [policy.get_delay(attempt) for attempt in range(5)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+    assert policy.get_delay(0, "10") == 10.0
+    assert RetryPolicy(backoff=0.5, respect_retry_after=False).get_delay(0, "10") == 0.5
+    monkeypatch.setattr("src.ablt_python_api.utils.retry.random.uniform", lambda low, high: low)
+    assert policy.get_delay(3) == 0.0
+
+
+def test_unit_retry_policy_budget():
+    """This method tests for retries count, total budget and retryable endpoints of retry policy"""
+    policy = RetryPolicy(max_retries=2, total_budget=10.0)
+    assert policy.can_retry(0, 0.0, 1.0) and policy.can_retry(1, 8.0, 2.0)
+    assert not policy.can_retry(2, 0.0, 0.0)
+    assert not policy.can_retry(1, 9.0, 2.0)
+    assert RetryPolicy(total_budget=None).can_retry(0, 1e6, 1e6)
+    assert policy.is_retryable("v1/chat") and not policy.is_retryable("v1/chat", streaming=True)
+    assert not policy.is_retryable("health-check")
+    assert not RetryPolicy(max_retries=0).is_retryable("v1/chat")
+    assert policy.is_retryable_status(503) and not policy.is_retryable_status(400)
+
+
+def test_unit_sync_retry_after(stub, logger, monkeypatch):
+    """
+    This method tests for sync retries of transient failures, which wait as long as Retry-After asks
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    :param monkeypatch: monkeypatch fixture
+    """
+    delays = []
+    monkeypatch.setattr("src.ablt_python_api.ablt_api_sync.sleep", delays.append)
+    api = ABLTApi(bearer_token="token", base_api_url=stub.url, logger=logger, retry_policy=RetryPolicy(max_retries=3))
+    stub.failures, stub.failure_status, stub.failure_headers = 2, 429, {"Retry-After": "7"}
+    assert list(api.chat(bot_uid="uid-1", prompt="Hello")) == ["token: Hello"]
+    assert delays == [7.0, 7.0] and stub.calls["chat"] == 3
+    # Retries are exhausted, the last failure is returned to caller
+    delays.clear()
+    stub.failures = 10
+    assert not list(api.chat(bot_uid="uid-1", prompt="Hello"))
+    assert delays == [7.0, 7.0, 7.0] and stub.calls["chat"] == 7
+
+
+@pytest.mark.asyncio
+async def test_unit_async_retry_budget(stub, logger, fake_clock, monkeypatch):
+    """
+    This method tests for async retries of transient failures, which stop when total budget is exceeded
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    :param fake_clock: fake_clock fixture
+    :param monkeypatch: monkeypatch fixture
+    """
+    delays = []
+
+    async def sleep(delay: float) -> None:
+        """Records the delay and moves the clock instead of waiting."""
+        delays.append(delay)
+        fake_clock.advance(delay)
+
+    monkeypatch.setattr("src.ablt_python_api.ablt_api_async.monotonic", fake_clock)
+    monkeypatch.setattr("src.ablt_python_api.ablt_api_async.asyncio.sleep", sleep)
+    api = ABLTApiAsync(
+        bearer_token="token",
+        base_api_url=stub.url,
+        logger=logger,
+        startup_check="skip",
+        retry_policy=RetryPolicy(max_retries=5, total_budget=10.0),
+    )
+    stub.failures, stub.failure_status, stub.failure_headers = 10, 503, {"Retry-After": "4"}
+    assert [message async for message in api.chat(bot_uid="uid-1", prompt="Hello")] == []
+    assert delays == [4.0, 4.0] and stub.calls["chat"] == 3
+    await api.aclose()
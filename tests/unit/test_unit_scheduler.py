@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_unit_scheduler.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for request scheduler and its priority classes (offline).
+"""
+
+import asyncio
+from threading import Lock, Thread
+from time import sleep
+
+import pytest
+
+from src.ablt_python_api.ablt_api_async import ABLTApi as ABLTApiAsync
+from src.ablt_python_api.ablt_api_sync import ABLTApi
+from src.ablt_python_api.job_queue import ChatJobQueue
+from src.ablt_python_api.utils.scheduler import PriorityClass, RequestScheduler
+
+REQUESTS = [{"bot_uid": "uid-1", "prompt": f"Question {index}", "stream": False} for index in range(3)]
+
+
+def get_custom_scheduler() -> RequestScheduler:
+    """
+    Returns scheduler with custom priority classes (without "batch" class).
+
+    :return: scheduler.
+    :rtype: RequestScheduler
+    """
+    return RequestScheduler(
+        max_concurrency=2, classes=[PriorityClass("low", 5), PriorityClass("high", 0)], default_class="high"
+    )
+
+
+def test_unit_scheduler_lowest_class():
+    """This method tests for the lowest priority class of scheduler"""
+    assert RequestScheduler().lowest_class == "batch"
+    assert get_custom_scheduler().lowest_class == "low"
+    with pytest.raises(ValueError):
+        RequestScheduler(default_class="batch").acquire("unknown")
+
+
+def test_unit_sync_chat_many_custom_classes(stub, logger, tmp_path):
+    """
+    This method tests for sync chat_many and drain of job queue with scheduler without "batch" class
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    :param tmp_path: tmp_path fixture
+    """
+    scheduler = get_custom_scheduler()
+    api = ABLTApi(bearer_token="token", base_api_url=stub.url, logger=logger, scheduler=scheduler)
+    results = list(api.chat_many(REQUESTS, concurrency=2, ordered=True))
+    assert [result.response for result in results] == [f"token: Question {index}" for index in range(3)]
+    with ChatJobQueue(str(tmp_path / "jobs.db")) as queue:
+        queue.add_many(REQUESTS)
+        assert queue.drain(api, concurrency=2)["done"] == len(REQUESTS)
+    assert scheduler.get_stats() == {"low": {"queued": 0, "in_flight": 0}, "high": {"queued": 0, "in_flight": 0}}
+
+
+@pytest.mark.asyncio
+async def test_unit_async_chat_many_custom_classes(stub, logger, tmp_path):
+    """
+    This method tests for async chat_many and drain of job queue with scheduler without "batch" class
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    :param tmp_path: tmp_path fixture
+    """
+    api = ABLTApiAsync(
+        bearer_token="token",
+        base_api_url=stub.url,
+        logger=logger,
+        startup_check="skip",
+        scheduler=get_custom_scheduler(),
+    )
+    results = [result async for result in api.chat_many(REQUESTS, concurrency=2)]
+    assert all(result.ok for result in results) and len(results) == len(REQUESTS)
+    with ChatJobQueue(str(tmp_path / "jobs.db")) as queue:
+        queue.add_many(REQUESTS)
+        assert (await queue.drain_async(api, concurrency=2))["done"] == len(REQUESTS)
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_unit_scheduler_fair_queuing():
+    """This method tests for weighted fair queuing of users within priority class"""
+    scheduler = RequestScheduler(max_concurrency=1, user_weights={3: 2.0})
+    order = []
+    holder = await scheduler.acquire_async(user_id=0)
+
+    async def request(user_id: int) -> None:
+        """Waits for a slot, records the user and frees the slot."""
+        async with scheduler.slot_async(user_id=user_id):
+            order.append(user_id)
+
+    # User 1 queues many requests before user 2 comes, user 3 has double share
+    tasks = [asyncio.create_task(request(user_id)) for user_id in (1, 1, 1, 1, 2, 2, 3, 3, 3, 3)]
+    await asyncio.sleep(0)
+    assert scheduler.get_stats()["interactive"] == {"queued": 10, "in_flight": 1}
+    scheduler.release(holder)
+    await asyncio.gather(*tasks)
+    # Requests are served by finish tags (1, 2, 3, 4 for user 1, 1, 2 for user 2, 0.5, 1, 1.5, 2 for user 3)
+    assert order == [3, 1, 2, 3, 3, 1, 2, 3, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_unit_scheduler_priority_classes():
+    """This method tests for strict priority classes with per-class concurrency caps"""
+    scheduler = RequestScheduler(
+        max_concurrency=2, classes=[PriorityClass("interactive", 0, max_concurrency=1), PriorityClass("batch", 1)]
+    )
+    order = []
+    holders = [await scheduler.acquire_async("batch"), await scheduler.acquire_async("batch")]
+
+    async def request(priority: str, index: int) -> None:
+        """Waits for a slot, records the request and holds the slot until the next loop iteration."""
+        async with scheduler.slot_async(priority):
+            order.append(f"{priority}-{index}")
+            await asyncio.sleep(0)
+
+    tasks = [asyncio.create_task(request("batch", index)) for index in range(2)]
+    tasks.extend(asyncio.create_task(request("interactive", index)) for index in range(2))
+    await asyncio.sleep(0)
+    for holder in holders:
+        scheduler.release(holder)
+    await asyncio.gather(*tasks)
+    # Interactive requests go first, but only one at a time, so the free slot is taken by batch request
+    assert order[:2] == ["interactive-0", "batch-0"]
+    assert order.index("interactive-1") < order.index("batch-1")
+
+
+def test_unit_scheduler_threads():
+    """This method tests for scheduler shared by threads, which never exceeds max concurrency"""
+    scheduler = RequestScheduler(max_concurrency=3)
+    lock = Lock()
+    state = {"in_flight": 0, "peak": 0}
+
+    def request(user_id: int) -> None:
+        """Holds a slot for a while and tracks the peak of requests in flight."""
+        with scheduler.slot("batch", user_id):
+            with lock:
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            sleep(0.005)
+            with lock:
+                state["in_flight"] -= 1
+
+    threads = [Thread(target=request, args=(index % 4,)) for index in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert state["peak"] == 3
+    assert scheduler.get_stats()["batch"] == {"queued": 0, "in_flight": 0}
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_unit_single_flight.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for coalescing of concurrent identical calls (offline).
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+import pytest
+
+from src.ablt_python_api.ablt_api_async import ABLTApi as ABLTApiAsync
+from src.ablt_python_api.utils.single_flight import AsyncSingleFlight, SingleFlight
+
+
+def test_unit_single_flight_threads():
+    """This method tests for concurrent identical calls from threads, which are coalesced into one"""
+    single_flight = SingleFlight()
+    release = Event()
+    calls = []
+
+    def fetch(key: str) -> list:
+        """Blocks until released, so all callers are in flight at once."""
+        calls.append(key)
+        release.wait(5)
+        return [key]
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(single_flight.do, "bots", fetch, "bots") for _ in range(5)]
+        while not calls:
+            release.wait(0.001)
+        # Gives other callers time to join the call in flight
+        release.wait(0.05)
+        other = executor.submit(single_flight.do, "stats", fetch, "stats")
+        release.set()
+        results = [future.result() for future in futures]
+    assert other.result() == ["stats"] and sorted(calls) == ["bots", "stats"]
+    assert all(result is results[0] for result in results)
+    # Finished call is forgotten, the next one calls function again
+    assert single_flight.do("bots", fetch, "bots") == ["bots"] and len(calls) == 3
+
+
+def test_unit_single_flight_error():
+    """This method tests for error of the call, which is raised to every caller"""
+    single_flight = SingleFlight()
+
+    def fail() -> None:
+        """Always fails."""
+        raise ValueError("failure")
+
+    with pytest.raises(ValueError):
+        single_flight.do("key", fail)
+    assert single_flight.do("key", lambda: 1) == 1
+
+
+@pytest.mark.asyncio
+async def test_unit_async_single_flight():
+    """This method tests for concurrent identical coroutine calls, which are coalesced and survive cancellation"""
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch(key: str) -> list:
+        """Waits a bit, so all callers are in flight at once."""
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return [key]
+
+    cancelled = asyncio.create_task(single_flight.do("bots", fetch, "bots"))
+    callers = [single_flight.do("bots", fetch, "bots") for _ in range(4)]
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    results = await asyncio.gather(*callers, single_flight.do("stats", fetch, "stats"))
+    assert results[:4] == [["bots"]] * 4 and results[4] == ["stats"]
+    assert calls == ["bots", "stats"] and cancelled.cancelled()
+
+    async def fail() -> None:
+        """Always fails."""
+        raise ValueError("failure")
+
+    errors = await asyncio.gather(single_flight.do("key", fail), single_flight.do("key", fail), return_exceptions=True)
+    assert all(isinstance(error, ValueError) for error in errors)
+
+
+@pytest.mark.asyncio
+async def test_unit_async_coalesce_bots(stub, logger):
+    """
+    This method tests for concurrent async bot list requests, which are sent once
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    api = ABLTApiAsync(bearer_token="token", base_api_url=stub.url, logger=logger, startup_check="skip")
+    results = await asyncio.gather(*(api.get_bots() for _ in range(10)))
+    assert all(bots == results[0] for bots in results) and len(results[0]) == 2
+    assert stub.calls["bots"] == 1
+    await api.aclose()
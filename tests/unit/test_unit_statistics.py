@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_unit_statistics.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for usage statistics cache, chunks and their merging (offline).
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from src.ablt_python_api.ablt_api_async import ABLTApi as ABLTApiAsync
+from src.ablt_python_api.ablt_api_sync import ABLTApi
+from src.ablt_python_api.utils.retry import RetryPolicy
+from src.ablt_python_api.utils.statistics_cache import StatisticsCache, get_covering_ranges, split_date_range
+
+START_DATE = "2024-01-01"
+END_DATE = "2024-01-10"
+
+
+def test_unit_split_date_range():
+    """This method tests for splitting of date range into chunks"""
+    start = date(2024, 1, 1)
+    assert split_date_range(start, start + timedelta(days=9)) == [(start, start + timedelta(days=9))]
+    assert split_date_range(start, start + timedelta(days=9), 4) == [
+        (start, start + timedelta(days=3)),
+        (start + timedelta(days=4), start + timedelta(days=7)),
+        (start + timedelta(days=8), start + timedelta(days=9)),
+    ]
+    assert not split_date_range(start, start - timedelta(days=1), 4)
+    with pytest.raises(ValueError):
+        split_date_range(start, start, 0)
+
+
+def test_unit_get_covering_ranges():
+    """This method tests for merging of days into covering ranges"""
+    days = [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 5), date(2024, 1, 20)]
+    assert get_covering_ranges(days) == [
+        (date(2024, 1, 1), date(2024, 1, 2)),
+        (date(2024, 1, 5), date(2024, 1, 5)),
+        (date(2024, 1, 20), date(2024, 1, 20)),
+    ]
+    assert get_covering_ranges(days, max_gap_days=2) == [
+        (date(2024, 1, 1), date(2024, 1, 5)),
+        (date(2024, 1, 20), date(2024, 1, 20)),
+    ]
+
+
+def test_unit_statistics_cache():
+    """This method tests for statistics cache, which keeps closed days only"""
+    cache = StatisticsCache(settle_days=1, max_users=1)
+    today = date.today()
+    start = today - timedelta(days=4)
+    items = [{"date": (start + timedelta(days=1)).isoformat(), "total_tokens": 5}, {"total_tokens": 1}]
+    cache.update("key", 1, start, today, items)
+    # Closed days are cached (even without items), open days aren't
+    assert cache.get_missing_ranges("key", 1, start, today) == [(today - timedelta(days=1), today)]
+    cached = cache.get_items("key", 1, start, today)
+    assert len(cached) == 3 and cached[start] is None and cached[start + timedelta(days=1)]["total_tokens"] == 5
+    cache.update("key", 2, start, start, [])
+    assert cache.get_items("key", 1, start, today) == {}
+    assert StatisticsCache.get_total([{"total_tokens": 1}, {"total_tokens": 2}])["total_tokens"] == 3
+
+
+def test_unit_sync_statistics_chunks(stub, logger):
+    """
+    This method tests for sync usage statistics requested by chunks and merged with cache
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    api = ABLTApi(
+        bearer_token="token",
+        base_api_url=stub.url,
+        logger=logger,
+        statistics_cache=StatisticsCache(),
+        statistics_chunk_days=3,
+    )
+    statistics = api.get_usage_statistics(1, START_DATE, END_DATE)
+    assert [item["date"] for item in statistics["items"]] == [
+        (date(2024, 1, 1) + timedelta(days=day)).isoformat() for day in range(10)
+    ]
+    assert statistics["total"] == StatisticsCache.get_total(statistics["items"])
+    assert sorted(stub.statistics_ranges) == [
+        ("2024-01-01", "2024-01-03"),
+        ("2024-01-04", "2024-01-06"),
+        ("2024-01-07", "2024-01-09"),
+        ("2024-01-10", "2024-01-10"),
+    ]
+    assert api.get_usage_statistics(1, START_DATE, END_DATE) == statistics
+    assert stub.calls["statistics"] == 4
+
+
+def test_unit_sync_statistics_dateless_items(stub, logger):
+    """
+    This method tests for sync merging of usage statistics with items without date
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    stub.extra_items = [{"total_tokens": 1}, {"date": None, "total_tokens": 1}]
+    api = ABLTApi(bearer_token="token", base_api_url=stub.url, logger=logger, statistics_chunk_days=5)
+    statistics = api.get_usage_statistics(1, START_DATE, END_DATE)
+    assert len(statistics["items"]) == 10
+
+
+def test_unit_sync_statistics_connection_error(stub, logger):
+    """
+    This method tests for sync usage statistics by chunks, which return None if API isn't reachable
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    api = ABLTApi(
+        bearer_token="token",
+        base_api_url=stub.url,
+        logger=logger,
+        retry_policy=RetryPolicy(max_retries=0),
+        statistics_chunk_days=5,
+    )
+    api.set_base_api_url("http://127.0.0.1:9")
+    assert api.get_usage_statistics(1, START_DATE, END_DATE) is None
+
+
+@pytest.mark.asyncio
+async def test_unit_async_statistics_chunks(stub, logger):
+    """
+    This method tests for async usage statistics requested by chunks, merged with cache and items without date
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    stub.extra_items = [{"total_tokens": 1}]
+    api = ABLTApiAsync(
+        bearer_token="token",
+        base_api_url=stub.url,
+        logger=logger,
+        startup_check="skip",
+        statistics_cache=StatisticsCache(),
+        statistics_chunk_days=3,
+    )
+    statistics = await api.get_usage_statistics(1, START_DATE, END_DATE)
+    assert len(statistics["items"]) == 10
+    assert statistics["total"] == StatisticsCache.get_total(statistics["items"])
+    assert await api.get_usage_statistics(1, START_DATE, END_DATE) == statistics
+    assert stub.calls["statistics"] == 4
+    await api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_unit_async_statistics_connection_error(logger):
+    """
+    This method tests for async usage statistics by chunks, which return None if API isn't reachable
+
+    :param logger: logger fixture
+    """
+    api = ABLTApiAsync(
+        bearer_token="token",
+        base_api_url="http://127.0.0.1:9",
+        logger=logger,
+        startup_check="skip",
+        retry_policy=RetryPolicy(max_retries=0),
+        statistics_chunk_days=5,
+    )
+    assert await api.get_usage_statistics(1, START_DATE, END_DATE) is None
+    await api.aclose()
+
+
+@pytest.mark.parametrize("chunk_retries", [0, 2], ids=["no_retries", "retries"])
+def test_unit_sync_statistics_failed_chunks(stub, logger, chunk_retries):
+    """
+    This method tests for sync usage statistics by chunks with failed chunks, retried or reported as failed ranges
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    :param chunk_retries: passes over failed chunks
+    """
+    api = ABLTApi(
+        bearer_token="token",
+        base_api_url=stub.url,
+        logger=logger,
+        retry_policy=RetryPolicy(backoff=0.0),
+        statistics_chunk_days=5,
+        statistics_chunk_retries=chunk_retries,
+    )
+    stub.failures = 2
+    statistics = api.get_usage_statistics(1, START_DATE, END_DATE)
+    if chunk_retries:
+        assert len(statistics["items"]) == 10 and "failed_ranges" not in statistics
+        assert stub.calls["statistics"] == 4
+    else:
+        assert statistics is None
+    stub.reset()
+    stub.failures = 1
+    statistics = api.get_usage_statistics(1, START_DATE, END_DATE)
+    if chunk_retries:
+        assert len(statistics["items"]) == 10 and "failed_ranges" not in statistics
+    else:
+        (failed_range,) = statistics["failed_ranges"]
+        assert failed_range in (
+            {"start_date": "2024-01-01", "end_date": "2024-01-05"},
+            {"start_date": "2024-01-06", "end_date": "2024-01-10"},
+        )
+        assert len(statistics["items"]) == 5
+        assert all(
+            not failed_range["start_date"] <= item["date"] <= failed_range["end_date"] for item in statistics["items"]
+        )
+        assert statistics["total"] == StatisticsCache.get_total(statistics["items"])
+
+
+def test_unit_sync_statistics_for_days_failed_chunks(stub, logger):
+    """
+    This method tests for sync usage statistics for days, which omits days of failed chunks
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    api = ABLTApi(
+        bearer_token="token", base_api_url=stub.url, logger=logger, statistics_chunk_days=5, statistics_chunk_retries=0
+    )
+    stub.failures = 1
+    statistics = api.get_statistics_for_days(["2024-01-02", "2024-01-08"], user_id=1)
+    assert len(statistics) == 1
+
+
+@pytest.mark.asyncio
+async def test_unit_async_statistics_failed_chunks(stub, logger):
+    """
+    This method tests for async usage statistics by chunks with failed chunk reported as failed range
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    api = ABLTApiAsync(
+        bearer_token="token",
+        base_api_url=stub.url,
+        logger=logger,
+        startup_check="skip",
+        statistics_chunk_days=5,
+        statistics_chunk_retries=0,
+    )
+    stub.failures = 1
+    statistics = await api.get_usage_statistics(1, START_DATE, END_DATE)
+    assert len(statistics["failed_ranges"]) == 1 and len(statistics["items"]) == 5
+    await api.aclose()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_unit_timeouts.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for per-phase chat timeouts (offline).
+"""
+
+import pytest
+
+from src.ablt_python_api.ablt_api_async import ABLTApi as ABLTApiAsync
+from src.ablt_python_api.ablt_api_sync import ABLTApi
+from src.ablt_python_api.utils.exceptions import ChatTimeoutError, DoneException
+from src.ablt_python_api.utils.timeouts import ChatTimeout
+
+# (stall before chunk of stream or None for slow non-stream response, timeouts, expected phase)
+TIMEOUT_CASES = [
+    (1, ChatTimeout(first_chunk=5, idle=0.2, total=5), "idle"),
+    (0, ChatTimeout(first_chunk=0.2, idle=5, total=5), "first_chunk"),
+    (None, ChatTimeout(total=0.2), "total"),
+]
+TIMEOUT_IDS = ["stalled_stream", "stalled_first_chunk", "slow_response"]
+
+
+def stall(stub, stalled_chunk):
+    """
+    Stalls the stream before the chunk for a second, or delays non-stream response, if chunk is None.
+
+    :param stub: StubServer instance
+    :param stalled_chunk: index of stalled chunk or None
+    :return: True if the chat is streaming
+    """
+    if stalled_chunk is None:
+        stub.chat_delays["Hello"] = 1
+        return False
+    stub.stream_stalls[stalled_chunk] = 1
+    return True
+
+
+def test_unit_sync_chat_timeouts_no_stall(stub, logger):
+    """
+    This method tests for sync streaming chat, which isn't interrupted by timeouts when chunks arrive in time
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    api = ABLTApi(bearer_token="token", base_api_url=stub.url, logger=logger)
+    timeout = ChatTimeout(first_chunk=1, idle=1, total=2)
+    received = []
+    with pytest.raises(DoneException):
+        for message in api.chat(bot_uid="uid-1", prompt="Hello", stream=True, timeout=timeout):
+            received.append(message)
+    assert received == ["token: ", "Hello"]
+
+
+@pytest.mark.parametrize("stalled_chunk, timeout, phase", TIMEOUT_CASES, ids=TIMEOUT_IDS)
+def test_unit_sync_chat_timeouts(stub, logger, stalled_chunk, timeout, phase):
+    """
+    This method tests for sync chat, which raises timeout error of the phase the response has stalled in
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    :param stalled_chunk: index of stalled chunk or None for slow non-stream response
+    :param timeout: chat timeouts
+    :param phase: expected phase of timeout error
+    """
+    api = ABLTApi(bearer_token="token", base_api_url=stub.url, logger=logger)
+    stream = stall(stub, stalled_chunk)
+    received = []
+    with pytest.raises(ChatTimeoutError) as error:
+        for message in api.chat(bot_uid="uid-1", prompt="Hello", stream=stream, timeout=timeout):
+            received.append(message)
+    assert error.value.phase == phase
+    assert received == (["token: "] if phase == "idle" else [])
+
+
+@pytest.mark.asyncio
+async def test_unit_async_chat_timeouts_no_stall(stub, logger):
+    """
+    This method tests for async streaming chat, which isn't interrupted by timeouts when chunks arrive in time
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    """
+    api = ABLTApiAsync(bearer_token="token", base_api_url=stub.url, logger=logger, startup_check="skip")
+    timeout = ChatTimeout(first_chunk=1, idle=1, total=2)
+    received = []
+    with pytest.raises(DoneException):
+        async for message in api.chat(bot_uid="uid-1", prompt="Hello", stream=True, timeout=timeout):
+            received.append(message)
+    assert received == ["token: ", "Hello"]
+    await api.aclose()
+
+
+@pytest.mark.parametrize("stalled_chunk, timeout, phase", TIMEOUT_CASES, ids=TIMEOUT_IDS)
+@pytest.mark.asyncio
+async def test_unit_async_chat_timeouts(stub, logger, stalled_chunk, timeout, phase):
+    """
+    This method tests for async chat, which raises timeout error of the phase the response has stalled in
+
+    :param stub: stub fixture (returns StubServer)
+    :param logger: logger fixture
+    :param stalled_chunk: index of stalled chunk or None for slow non-stream response
+    :param timeout: chat timeouts
+    :param phase: expected phase of timeout error
+    """
+    api = ABLTApiAsync(bearer_token="token", base_api_url=stub.url, logger=logger, startup_check="skip")
+    stream = stall(stub, stalled_chunk)
+    received = []
+    with pytest.raises(ChatTimeoutError) as error:
+        async for message in api.chat(bot_uid="uid-1", prompt="Hello", stream=stream, timeout=timeout):
+            received.append(message)
+    assert error.value.phase == phase
+    assert received == (["token: "] if phase == "idle" else [])
+    await api.aclose()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Filename: test_unit_transport.py
+Author: Iliya Vereshchagin
+Copyright (c) 2023 aBLT.ai. All rights reserved.
+
+Created: 17.10.2026
+Last Modified: 17.10.2026
+
+Description:
+This file tests for pooled transports and their registry (offline).
+"""
+
+import asyncio
+from threading import Event, Thread
+
+from src.ablt_python_api.transport import (
+    AsyncTransport,
+    close_async_transport,
+    close_sync_transport,
+    get_async_transport,
+    get_sync_transport,
+)
+
+
+async def get_health(transport: AsyncTransport, url: str):
+    """
+    Requests health check with pooled session of the running event loop.
+
+    :param transport: transport.
+    :type transport: AsyncTransport
+    :param url: base API URL.
+    :type url: str
+    :return: session and response.
+    :rtype: tuple
+    """
+    session = transport.get_session()
+    async with session.get(f"{url}/health-check") as response:
+        return session, await response.json()
+
+
+def test_unit_async_transport_sessions_per_loop(stub):
+    """
+    This method tests for sessions of async transport, which are bound to event loops and closed with them
+
+    :param stub: stub fixture (returns StubServer)
+    """
+    transport = AsyncTransport()
+    first, response = asyncio.run(get_health(transport, stub.url))
+    assert response == {"status": "ok"}
+    second, response = asyncio.run(get_health(transport, stub.url))
+    assert response == {"status": "ok"}
+    # Session of the closed loop is dropped when the next loop gets its own session
+    assert first is not second and first.closed and not second.closed
+    asyncio.run(transport.aclose())
+    assert second.closed
+
+
+def test_unit_async_transport_aclose_other_loop(stub):
+    """
+    This method tests for closing of session of event loop running in another thread
+
+    :param stub: stub fixture (returns StubServer)
+    """
+    transport = AsyncTransport()
+    loop = asyncio.new_event_loop()
+    thread = Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        session, _ = asyncio.run_coroutine_threadsafe(get_health(transport, stub.url), loop).result()
+        ready = Event()
+        loop.call_soon_threadsafe(ready.set)
+        ready.wait()
+
+        async def use_and_close() -> None:
+            """Uses transport in this loop, then closes sessions of all loops."""
+            own_session, _ = await get_health(transport, stub.url)
+            assert own_session is not session
+            await transport.aclose()
+            assert own_session.closed
+
+        asyncio.run(use_and_close())
+        assert session.closed
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def test_unit_async_transport_aclose_current_loop_only(stub):
+    """
+    This method tests for closing of session of the running event loop only
+
+    :param stub: stub fixture (returns StubServer)
+    """
+    transport = AsyncTransport()
+
+    async def scenario() -> None:
+        """Closes session of the running loop, session is created again on next use."""
+        session, _ = await get_health(transport, stub.url)
+        await transport.aclose(current_loop_only=True)
+        assert session.closed
+        new_session, response = await get_health(transport, stub.url)
+        assert new_session is not session and response == {"status": "ok"}
+        await transport.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_unit_transport_registry(stub):
+    """
+    This method tests for registry of shared transports shared by event loops
+
+    :param stub: stub fixture (returns StubServer)
+    """
+    transport = get_async_transport(stub.url)
+    assert get_async_transport(stub.url) is transport
+    first, _ = asyncio.run(get_health(transport, stub.url))
+    second, _ = asyncio.run(get_health(get_async_transport(stub.url), stub.url))
+    assert first is not second and first.closed
+    asyncio.run(close_async_transport(stub.url))
+    assert second.closed and get_async_transport(stub.url) is not transport
+    asyncio.run(close_async_transport(stub.url))
+    sync_transport = get_sync_transport(stub.url)
+    close_sync_transport(stub.url)
+    assert get_sync_transport(stub.url) is not sync_transport
+    close_sync_transport(stub.url)